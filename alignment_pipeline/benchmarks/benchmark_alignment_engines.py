@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Alignment engine benchmark
+
+Compares the greedy per-segment engine of TranscriptAligner with the global
+monotonic engine: wall time, median CER and share of segments below 0.3 CER.
+
+Usage:
+    python benchmarks/benchmark_alignment_engines.py
+    python benchmarks/benchmark_alignment_engines.py --segments cache/<video_id>_segments.pkl --transcript transcript.txt
+"""
+
+import argparse
+import statistics
+import time
+
+from synthetic_session import add_session_arguments, session_from_args
+
+from parliament_transcript_aligner.transcript.aligner import TranscriptAligner, ALIGNMENT_ENGINES
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the alignment engines")
+    add_session_arguments(parser)
+    parser.add_argument("--band-width", type=int, default=250, help="Band width of the global engine")
+    args = parser.parse_args()
+
+    segments, transcript = session_from_args(args)
+    print(f"Session: {len(segments)} segments, {len(transcript.split())} transcript tokens")
+
+    for engine in ALIGNMENT_ENGINES:
+        aligner = TranscriptAligner(engine=engine, global_band_width=args.band_width)
+        start = time.perf_counter()
+        aligned = aligner.align_transcript(segments, transcript)
+        duration = time.perf_counter() - start
+        print(f"\n{engine}:")
+        print(f"  Wall time:     {duration:.2f}s ({len(segments) / duration:.1f} segments/s)")
+        print(f"  Median CER:    {statistics.median(a.cer for a in aligned):.4f}")
+        print(f"  CER <= 0.3:    {sum(a.cer <= 0.3 for a in aligned)}/{len(aligned)}")
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Anchor index benchmark
+
+Compares the sliding-window region scan of TranscriptAligner with the n-gram
+anchor index: wall time, CER evaluations per segment and resulting CER.
+
+Usage:
+    python benchmarks/benchmark_anchor_index.py
+    python benchmarks/benchmark_anchor_index.py --segments cache/<video_id>_segments.pkl --transcript transcript.txt
+"""
+
+import argparse
+import statistics
+import time
+
+from synthetic_session import add_session_arguments, session_from_args
+
+from parliament_transcript_aligner.transcript.aligner import TranscriptAligner
+
+
+def run(aligner: TranscriptAligner, segments, transcript: str):
+    start = time.perf_counter()
+    aligned = aligner.align_transcript(segments, transcript)
+    return aligned, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the n-gram anchor index")
+    add_session_arguments(parser)
+    args = parser.parse_args()
+
+    segments, transcript = session_from_args(args)
+    print(f"Session: {len(segments)} segments, {len(transcript.split())} transcript tokens")
+
+    results = {}
+    for name, use_anchor_index in [("window scan", False), ("anchor index", True)]:
+        aligner = TranscriptAligner(use_anchor_index=use_anchor_index)
+        aligned, duration = run(aligner, segments, transcript)
+        results[name] = aligned
+        print(f"\n{name}:")
+        print(f"  Wall time:              {duration:.2f}s")
+        print(f"  CER evaluations/segment: {aligner.stats.cer_evaluations_per_segment:.1f}")
+        if use_anchor_index:
+            print(f"  Anchor misses:          {aligner.stats.anchor_misses}/{aligner.stats.anchor_searches} searches")
+        print(f"  Median CER:             {statistics.median(a.cer for a in aligned):.4f}")
+        print(f"  Mean CER:               {statistics.mean(a.cer for a in aligned):.4f}")
+
+    unchanged = sum(
+        (a.start_idx, a.end_idx) == (b.start_idx, b.end_idx)
+        for a, b in zip(results["window scan"], results["anchor index"])
+    )
+    print(f"\nUnchanged alignments: {unchanged}/{len(segments)}")
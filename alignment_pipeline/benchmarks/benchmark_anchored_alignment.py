@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Anchored alignment benchmark
+
+Aligns a session with the greedy engine and with the anchored engine (unique
+n-gram anchors first, then the gaps between them) in the calling process and
+with a process pool, which the aligner keeps for the next transcript (the second
+parallel run reuses the started pool). Reports wall time, the number of anchors,
+the median CER and how many alignments differ from the greedy engine.
+
+Usage:
+    python benchmarks/benchmark_anchored_alignment.py
+    python benchmarks/benchmark_anchored_alignment.py --workers 8
+    python benchmarks/benchmark_anchored_alignment.py --segments cache/<video_id>_segments.pkl --transcript transcript.txt
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+from synthetic_session import add_session_arguments, session_from_args
+
+from parliament_transcript_aligner.transcript.aligner import TranscriptAligner
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the anchored alignment engine")
+    add_session_arguments(parser)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes of the parallel run")
+    args = parser.parse_args()
+
+    segments, transcript = session_from_args(args)
+    print(f"Session: {len(segments)} segments, {len(transcript.split())} transcript tokens")
+
+    parallel = TranscriptAligner(engine="anchored", anchored_workers=args.workers)
+    configurations = [
+        ("greedy", TranscriptAligner(engine="greedy")),
+        ("anchored, 1 process", TranscriptAligner(engine="anchored", anchored_workers=1)),
+        (f"anchored, {args.workers} processes", parallel),
+        (f"anchored, {args.workers} processes, pool reused", parallel),
+    ]
+    reference = None
+    for name, aligner in configurations:
+        start = time.perf_counter()
+        aligned = aligner.align_transcript(segments, transcript)
+        duration = time.perf_counter() - start
+        print(f"\n{name}:")
+        print(f"  Wall time:     {duration:.2f}s ({len(segments) / duration:.1f} segments/s)")
+        print(f"  Median CER:    {statistics.median(a.cer for a in aligned):.4f}")
+        print(f"  CER <= 0.3:    {sum(a.cer <= 0.3 for a in aligned)}/{len(aligned)}")
+        if reference is None:
+            reference = aligned
+            continue
+        print(f"  Anchors:       {aligner.stats.anchor_segments}")
+        changed = sum(
+            (a.start_idx, a.end_idx) != (b.start_idx, b.end_idx) for a, b in zip(reference, aligned)
+        )
+        print(f"  Changed vs. greedy: {changed}/{len(aligned)}")
+    parallel.close()
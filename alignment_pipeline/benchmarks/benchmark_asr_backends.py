@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+ASR backend benchmark
+
+Transcribes the same segments of a recording with every backend in --backends
+and reports the load time and the real-time factor (RTF: transcription time /
+audio duration, lower is faster). The texts of every backend are compared to
+those of the first one (character error rate), to check the accuracy cost of
+e.g. the int8 CPU backend against the fp32 model.
+
+The hf and int8-cpu backends require torch and transformers; the stub backend
+runs anywhere and spends --stub-rtf CPU seconds per audio second.
+
+Usage:
+    python benchmarks/benchmark_asr_backends.py --backends stub
+    python benchmarks/benchmark_asr_backends.py --backends hf int8-cpu --device cpu --audio session.wav --minutes 5
+"""
+
+import argparse
+import tempfile
+import time
+
+import Levenshtein
+import numpy as np
+from synthetic_audio import add_audio_arguments, audio_path_from_args
+
+from parliament_transcript_aligner.audio_processing.asr import create_asr_backend
+from parliament_transcript_aligner.audio_processing.audio_buffer import audio_slice, load_audio
+from parliament_transcript_aligner.audio_processing.batching import fixed_batches
+
+
+def backend_config(name: str, args) -> dict:
+    """Arguments of create_asr_backend for one backend."""
+    if name == "stub":
+        return {"seconds_per_audio_second": args.stub_rtf}
+    config = {"batch_size": args.batch_size}
+    if args.model:
+        config["model_name"] = args.model
+    if name == "int8-cpu" and args.threads:
+        config["num_threads"] = args.threads
+    return config
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the real-time factor of the ASR backends")
+    add_audio_arguments(parser)
+    parser.add_argument("--backends", nargs="+", default=["stub"], choices=["hf", "int8-cpu", "stub"],
+                        help="Backends to compare, the first one is the reference for the CER")
+    parser.add_argument("--device", default=None, help="Device of the hf backend (default: cuda if available)")
+    parser.add_argument("--model", default=None, help="Hugging Face model of the hf and int8-cpu backends")
+    parser.add_argument("--threads", type=int, default=None, help="CPU threads of the int8-cpu backend")
+    parser.add_argument("--segment-seconds", type=float, default=15.0, help="Length of the segments")
+    parser.add_argument("--batch-size", type=int, default=4, help="Segments per batch")
+    parser.add_argument("--stub-rtf", type=float, default=0.05, help="CPU seconds per audio second of the stub")
+    parser.add_argument("--language", default="en", help="Language of the recording")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        audio = load_audio(audio_path_from_args(args, directory))
+    duration = min(len(audio) / 16000, args.minutes * 60)
+    ranges = [(start, min(start + args.segment_seconds, duration))
+              for start in np.arange(0.0, duration, args.segment_seconds)]
+    batches = [[ranges[index] for index in batch] for batch in fixed_batches(len(ranges), args.batch_size)]
+    print(f"Recording: {duration / 60:.1f} minutes, {len(ranges)} segments in {len(batches)} batches")
+
+    reference = None
+    print(f"\n{'backend':<10} {'load':>8} {'transcription':>14} {'RTF':>7} {'CER':>7}")
+    for name in args.backends:
+        start = time.perf_counter()
+        backend = create_asr_backend(name, args.device, language=args.language, **backend_config(name, args))
+        load_time = time.perf_counter() - start
+        start = time.perf_counter()
+        texts = []
+        for batch in batches:
+            texts.extend(backend.transcribe_batch(
+                [audio_slice(audio, segment_start, segment_end) for segment_start, segment_end in batch],
+                args.language
+            ))
+        transcription_time = time.perf_counter() - start
+        backend.close()
+
+        text = " ".join(texts)
+        if reference is None:
+            reference = text
+        cer = Levenshtein.distance(reference, text) / max(len(reference), 1)
+        print(f"{name:<10} {load_time:>7.2f}s {transcription_time:>13.2f}s "
+              f"{transcription_time / duration:>7.3f} {cer:>7.1%}")
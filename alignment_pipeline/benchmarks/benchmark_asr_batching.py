@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+ASR batching benchmark
+
+Compares how the segments of a session are batched for the ASR model:
+
+- fixed: batch_size consecutive segments, as AudioSegmenter does by default
+- budget: segments of similar duration under an audio-seconds budget
+  (plan_batches, AudioSegmenter(batch_seconds=...))
+
+Every segment of a batch is padded to the longest one. Without a model, the ASR
+time is simulated as a fixed overhead per batch plus a cost per padded audio
+second. With --backend, the first --max-segments segments of a synthetic
+recording are transcribed with that ASR backend and the measured segments/s are
+reported (hf and int8-cpu require torch and transformers).
+
+Usage:
+    python benchmarks/benchmark_asr_batching.py
+    python benchmarks/benchmark_asr_batching.py --batch-sizes 8 16 --budgets 120 240
+    python benchmarks/benchmark_asr_batching.py --backend hf --max-segments 200
+"""
+
+import argparse
+import time
+
+from synthetic_audio import make_audio
+from synthetic_session import add_session_arguments, session_from_args
+
+from parliament_transcript_aligner.audio_processing.asr import create_asr_backend
+from parliament_transcript_aligner.audio_processing.audio_buffer import audio_slice
+from parliament_transcript_aligner.audio_processing.batching import (
+    BatchStats, fixed_batches, plan_batches, summarize_batches
+)
+
+
+def simulate(batches, durations, overhead: float, seconds_per_padded_second: float):
+    """Simulate the ASR time of every batch."""
+    stats = []
+    for batch in batches:
+        batch_durations = [durations[index] for index in batch]
+        padded_seconds = len(batch) * max(batch_durations)
+        stats.append(BatchStats.from_durations(batch_durations, overhead + seconds_per_padded_second * padded_seconds))
+    return stats
+
+
+def transcribe(backend, batches, segments, audio, language: str):
+    """Transcribe the batches and measure every batch."""
+    stats = []
+    for batch in batches:
+        start = time.perf_counter()
+        backend.transcribe_batch(
+            [audio_slice(audio, segments[index].start, segments[index].end) for index in batch], language
+        )
+        stats.append(BatchStats.from_durations([segments[index].duration for index in batch],
+                                               time.perf_counter() - start))
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark fixed-size vs. duration-bucketed ASR batches")
+    add_session_arguments(parser)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[8, 16], help="Fixed batch sizes")
+    parser.add_argument("--budgets", type=float, nargs="+", default=[120.0, 240.0], help="Audio seconds per batch")
+    parser.add_argument("--overhead", type=float, default=0.05, help="Simulated seconds per batch")
+    parser.add_argument("--cost", type=float, default=0.01, help="Simulated seconds per padded audio second")
+    parser.add_argument("--backend", default=None, choices=["hf", "int8-cpu", "stub"],
+                        help="ASR backend to measure instead of simulating")
+    parser.add_argument("--max-segments", type=int, default=100, help="Segments to transcribe with --backend")
+    parser.add_argument("--language", default="en", help="Language of the ASR model")
+    args = parser.parse_args()
+
+    transcribed_segments, _ = session_from_args(args)
+    segments = [segment.segment for segment in transcribed_segments]
+    if args.backend:
+        segments = segments[:args.max_segments]
+        audio = make_audio(segments[-1].end / 60 + 0.1, seed=args.seed)
+        backend = create_asr_backend(args.backend, language=args.language, batch_size=max(args.batch_sizes))
+    durations = [segment.duration for segment in segments]
+    print(f"Session: {len(segments)} segments, {sum(durations) / 60:.1f} minutes of audio, "
+          f"segments of {min(durations):.1f} to {max(durations):.1f} seconds")
+
+    strategies = [(f"fixed, {batch_size} segments", fixed_batches(len(segments), batch_size))
+                  for batch_size in args.batch_sizes]
+    strategies += [(f"budget, {budget:g} seconds", plan_batches(durations, budget)) for budget in args.budgets]
+    for name, batches in strategies:
+        if args.backend:
+            stats = transcribe(backend, batches, segments, audio, args.language)
+        else:
+            stats = simulate(batches, durations, args.overhead, args.cost)
+        print(f"\n{name}{'' if args.backend else ' (simulated)'}:")
+        print(f"  {summarize_batches(stats)}")
+        print(f"  ASR time: {sum(batch.wall_time for batch in stats):.1f}s")
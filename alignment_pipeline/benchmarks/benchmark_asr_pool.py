@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+ASR worker pool benchmark
+
+Transcribes the segments of a synthetic recording with the model in this
+process and with an ASRWorkerPool of --workers processes that read the decoded
+audio from shared memory. Reports the wall time of each, the time to start the
+workers (model loading), and checks that both give the same texts.
+
+By default every worker runs the stub ASR backend, a deterministic CPU
+stand-in that spends --stub-ms milliseconds per second of audio, so the pool
+can be tested without torch. With --backend hf or int8-cpu, every worker loads
+Whisper instead (requires torch and transformers; --model e.g. openai/whisper-tiny).
+
+Usage:
+    python benchmarks/benchmark_asr_pool.py --workers 4
+    python benchmarks/benchmark_asr_pool.py --workers 2 --devices cuda:0 cuda:1 --backend hf
+"""
+
+import argparse
+import os
+import time
+from functools import partial
+
+import numpy as np
+
+from synthetic_audio import make_audio
+
+from parliament_transcript_aligner.audio_processing.asr import create_asr_backend
+from parliament_transcript_aligner.audio_processing.asr_pool import ASRWorkerPool
+from parliament_transcript_aligner.audio_processing.audio_buffer import audio_slice
+from parliament_transcript_aligner.audio_processing.batching import fixed_batches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark one in-process ASR model vs. an ASR worker pool")
+    parser.add_argument("--minutes", type=float, default=10.0, help="Length of the synthetic recording")
+    parser.add_argument("--segment-seconds", type=float, default=15.0, help="Length of the segments")
+    parser.add_argument("--batch-size", type=int, default=4, help="Segments per batch")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes")
+    parser.add_argument("--devices", nargs="+", default=None, help="Device of every worker (default: cpu)")
+    parser.add_argument("--threads-per-worker", type=int, default=None, help="CPU threads of every worker")
+    parser.add_argument("--backend", default="stub", choices=["hf", "int8-cpu", "stub"], help="ASR backend")
+    parser.add_argument("--stub-ms", type=float, default=20.0, help="CPU milliseconds per audio second of the stub")
+    parser.add_argument("--model", default=None, help="Hugging Face model of the hf and int8-cpu backends")
+    parser.add_argument("--language", default="en", help="Language of the ASR model")
+    args = parser.parse_args()
+
+    if args.backend == "stub":
+        config = {"seconds_per_audio_second": args.stub_ms / 1000}
+    else:
+        config = {"batch_size": args.batch_size, **({"model_name": args.model} if args.model else {})}
+    backend_factory = partial(create_asr_backend, args.backend, language=args.language, **config)
+    devices = args.devices or ["cpu"] * args.workers
+
+    audio = make_audio(args.minutes)
+    duration = len(audio) / 16000
+    ranges = [(start, min(start + args.segment_seconds, duration))
+              for start in np.arange(0.0, duration, args.segment_seconds)]
+    batches = [[ranges[index] for index in batch] for batch in fixed_batches(len(ranges), args.batch_size)]
+    print(f"Recording: {args.minutes:.1f} minutes, {len(ranges)} segments in {len(batches)} batches")
+
+    start = time.perf_counter()
+    backend = backend_factory(devices[0])
+    load_time = time.perf_counter() - start
+    start = time.perf_counter()
+    expected = []
+    for batch in batches:
+        expected.append(backend.transcribe_batch(
+            [audio_slice(audio, segment_start, segment_end) for segment_start, segment_end in batch], args.language
+        ))
+    single_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ASRWorkerPool(backend_factory, devices, threads_per_worker=args.threads_per_worker) as pool:
+        startup_time = time.perf_counter() - start
+        start = time.perf_counter()
+        texts = [None] * len(batches)
+        for number, batch_texts, _ in pool.transcribe(audio, batches, args.language):
+            texts[number] = batch_texts
+        pool_time = time.perf_counter() - start
+
+    print(f"\nIn-process backend: load {load_time:.2f}s, transcription {single_time:.2f}s")
+    print(f"Pool of {len(devices)} workers:  start {startup_time:.2f}s, transcription {pool_time:.2f}s "
+          f"({single_time / pool_time:.2f}x)")
+    print(f"Identical texts: {texts == expected}")
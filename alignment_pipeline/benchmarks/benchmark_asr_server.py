@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+ASR server benchmark
+
+Simulates --clients pipelines on one GPU node that transcribe their segments
+in small batches (--client-batch-size), either each with its own model or all
+through one ASRServer that batches segments of different clients together.
+
+The model is a mock ASR backend that runs on CPU: a call takes --overhead
+seconds plus --per-segment seconds per segment, and calls are serialized as on
+one GPU. Its texts come from the stub backend, so the texts of both setups can
+be compared. Reports wall time, model calls, segments per call and clients per
+batch of the server.
+
+Usage:
+    python benchmarks/benchmark_asr_server.py
+    python benchmarks/benchmark_asr_server.py --clients 8 --client-batch-size 1 --max-wait-ms 20
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+from synthetic_audio import make_audio
+
+from parliament_transcript_aligner.audio_processing.asr import StubBackend
+from parliament_transcript_aligner.audio_processing.asr_server import ASRClient, ASRServer
+from parliament_transcript_aligner.audio_processing.audio_buffer import audio_slice
+
+
+class MockGPUBackend(StubBackend):
+    """Stub backend with the latency profile of a batched model on one GPU."""
+
+    def __init__(self, overhead: float, per_segment: float, device_lock: threading.Lock):
+        super().__init__()
+        self.overhead = overhead
+        self.per_segment = per_segment
+        self.device_lock = device_lock
+        self.calls = 0
+
+    def transcribe_batch(self, arrays, language=None):
+        with self.device_lock:
+            self.calls += 1
+            time.sleep(self.overhead + self.per_segment * len(arrays))
+        return super().transcribe_batch(arrays, language)
+
+
+def run_clients(backends, segments, batch_size: int):
+    """Transcribe the segments of every client in a thread, return texts per client and wall time."""
+    texts = [[] for _ in backends]
+
+    def client(number):
+        for i in range(0, len(segments[number]), batch_size):
+            texts[number].extend(backends[number].transcribe_batch(segments[number][i:i + batch_size]))
+
+    threads = [threading.Thread(target=client, args=(number,)) for number in range(len(backends))]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return texts, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark one model per pipeline vs. a shared ASR server")
+    parser.add_argument("--clients", type=int, default=4, help="Concurrent pipelines")
+    parser.add_argument("--segments", type=int, default=40, help="Segments per pipeline")
+    parser.add_argument("--client-batch-size", type=int, default=2, help="Segments per call of a pipeline")
+    parser.add_argument("--max-batch-size", type=int, default=16, help="Maximum segments per server batch")
+    parser.add_argument("--max-wait-ms", type=float, default=20.0, help="Latency budget of the server")
+    parser.add_argument("--overhead", type=float, default=0.05, help="Mock seconds per model call")
+    parser.add_argument("--per-segment", type=float, default=0.005, help="Mock seconds per segment")
+    args = parser.parse_args()
+
+    audio = make_audio(args.clients * args.segments * 5 / 60)
+    segments = [[audio_slice(audio, (client * args.segments + i) * 5.0, (client * args.segments + i) * 5.0 + 5.0)
+                 for i in range(args.segments)] for client in range(args.clients)]
+    device_lock = threading.Lock()
+
+    # Every pipeline with its own model (sharing one GPU)
+    backends = [MockGPUBackend(args.overhead, args.per_segment, device_lock) for _ in range(args.clients)]
+    separate_texts, separate_time = run_clients(backends, segments, args.client_batch_size)
+    separate_calls = sum(backend.calls for backend in backends)
+
+    # All pipelines through one server
+    backend = MockGPUBackend(args.overhead, args.per_segment, device_lock)
+    with tempfile.TemporaryDirectory() as directory:
+        server = ASRServer(backend, os.path.join(directory, "asr.sock"), max_batch_size=args.max_batch_size,
+                           max_wait=args.max_wait_ms / 1000)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        clients = [ASRClient(server.address) for _ in range(args.clients)]
+        server_texts, server_time = run_clients(clients, segments, args.client_batch_size)
+        for client in clients:
+            client.close()
+        server.close()
+
+    num_segments = args.clients * args.segments
+    print(f"\n{args.clients} pipelines, {num_segments} segments, {args.client_batch_size} segments per call")
+    print(f"  Separate models: {separate_time:.2f}s, {separate_calls} model calls, "
+          f"{num_segments / separate_calls:.1f} segments per call")
+    print(f"  Shared server:   {server_time:.2f}s, {backend.calls} model calls, "
+          f"{num_segments / backend.calls:.1f} segments per call, "
+          f"{np.mean(server.batch_clients):.1f} clients per batch")
+    print(f"  Speedup: {separate_time / server_time:.2f}x, identical texts: {server_texts == separate_texts}")
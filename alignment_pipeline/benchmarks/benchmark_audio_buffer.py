@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Audio buffer benchmark
+
+Prepares the ASR inputs of a session's segments (10 to 20 second windows, as
+cut by the AudioSegmenter) in two ways:
+
+- per segment: decode the whole WAV with pydub, export the segment to a
+  temporary WAV and decode that file again, as the ASR pipeline does with paths
+- buffer: decode the WAV once with load_audio and pass array slices
+
+Reports wall time, bytes written to the temporary directory and checks that
+both give the same samples. The ASR model itself is not run.
+
+Usage:
+    python benchmarks/benchmark_audio_buffer.py
+    python benchmarks/benchmark_audio_buffer.py --minutes 60 --max-segments 50
+    python benchmarks/benchmark_audio_buffer.py --audio converted/<video_id>.wav
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+from pydub import AudioSegment
+
+from synthetic_audio import add_audio_arguments, audio_path_from_args
+
+from parliament_transcript_aligner.audio_processing.audio_buffer import SAMPLING_RATE, load_audio, asr_input
+
+
+def segment_windows(duration: float, seed: int = 0):
+    """Cut the recording into consecutive windows of 10 to 20 seconds."""
+    rnd = random.Random(seed)
+    windows = []
+    start = 0.0
+    while start < duration:
+        end = min(round(start + rnd.uniform(10.0, 20.0), 3), duration)  # whole milliseconds, as pydub slices
+        windows.append((start, end))
+        start = end
+    return windows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark per-segment temporary files vs. one in-memory buffer")
+    add_audio_arguments(parser)
+    parser.add_argument("--max-segments", type=int, default=None,
+                        help="Only prepare the first segments with temporary files, extrapolate the rest")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        audio_path = audio_path_from_args(args, directory)
+        temp_directory = os.path.join(directory, "segments")
+        os.makedirs(temp_directory)
+
+        start = time.perf_counter()
+        audio = load_audio(audio_path)
+        windows = segment_windows(len(audio) / SAMPLING_RATE, seed=args.seed)
+        buffer_inputs = [asr_input(audio, window_start, window_end) for window_start, window_end in windows]
+        buffer_time = time.perf_counter() - start
+        print(f"Session: {len(audio) / SAMPLING_RATE / 60:.1f} minutes, {len(windows)} segments")
+
+        measured = windows[:args.max_segments] if args.max_segments else windows
+        bytes_written = 0
+        max_difference = 0.0
+        start = time.perf_counter()
+        for (window_start, window_end), buffer_input in zip(measured, buffer_inputs):
+            segment = AudioSegment.from_file(audio_path)[window_start * 1000:window_end * 1000]
+            temp_path = os.path.join(temp_directory, f"segment_{window_start}_{window_end}.wav")
+            segment.export(temp_path, format="wav")
+            bytes_written += os.path.getsize(temp_path)
+            samples = load_audio(temp_path)
+            os.remove(temp_path)
+            length = min(len(samples), len(buffer_input["raw"]))
+            max_difference = max(max_difference, float(np.abs(samples[:length] - buffer_input["raw"][:length]).max()))
+        temp_time = (time.perf_counter() - start) * len(windows) / len(measured)
+        bytes_written = bytes_written * len(windows) / len(measured)
+
+    note = f" (extrapolated from {len(measured)} segments)" if len(measured) < len(windows) else ""
+    print(f"\nPer segment, temporary files{note}:")
+    print(f"  Wall time:          {temp_time:.2f}s")
+    print(f"  Temp bytes written: {bytes_written / 1e6:.1f} MB")
+    print(f"\nOne in-memory buffer:")
+    print(f"  Wall time:          {buffer_time:.2f}s")
+    print(f"  Temp bytes written: 0.0 MB")
+    print(f"  Buffer size:        {audio.nbytes / 1e6:.1f} MB")
+    print(f"\nSpeedup: {temp_time / buffer_time:.0f}x, max sample difference: {max_difference:.2e}")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Bounded CER benchmark
+
+Aligns a session with and without bounded CER evaluation (early abandonment of
+windows that cannot change the result), for both region search strategies.
+Reports wall time and how many CER evaluations were rejected by the length
+difference alone or abandoned early, and checks that the alignments are identical.
+
+Usage:
+    python benchmarks/benchmark_bounded_cer.py
+    python benchmarks/benchmark_bounded_cer.py --segments cache/<video_id>_segments.pkl --transcript transcript.txt
+"""
+
+import argparse
+import time
+
+from synthetic_session import add_session_arguments, session_from_args
+
+from parliament_transcript_aligner.transcript.aligner import TranscriptAligner
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark bounded CER evaluation")
+    add_session_arguments(parser)
+    args = parser.parse_args()
+
+    segments, transcript = session_from_args(args)
+    print(f"Session: {len(segments)} segments, {len(transcript.split())} transcript tokens")
+
+    for search, use_anchor_index in [("window scan", False), ("anchor index", True)]:
+        results = {}
+        for bounded_cer in [False, True]:
+            aligner = TranscriptAligner(use_anchor_index=use_anchor_index, bounded_cer=bounded_cer)
+            start = time.perf_counter()
+            results[bounded_cer] = aligner.align_transcript(segments, transcript)
+            duration = time.perf_counter() - start
+            stats = aligner.stats
+            print(f"\n{search}, {'bounded' if bounded_cer else 'exact'} CER:")
+            print(f"  Wall time:          {duration:.2f}s")
+            print(f"  CER evaluations:    {stats.cer_evaluations}")
+            if bounded_cer:
+                print(f"  Length rejections:  {stats.cer_length_rejections} "
+                      f"({stats.cer_length_rejections / max(stats.cer_evaluations, 1):.1%})")
+                print(f"  Abandoned early:    {stats.cer_abandoned} "
+                      f"({stats.cer_abandoned / max(stats.cer_evaluations, 1):.1%})")
+
+        identical = all(
+            (a.start_idx, a.end_idx, a.cer) == (b.start_idx, b.end_idx, b.cer)
+            for a, b in zip(results[False], results[True])
+        )
+        print(f"  Alignments identical: {identical}")
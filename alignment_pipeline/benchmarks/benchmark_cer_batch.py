@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Batched CER microbenchmark
+
+Scores the fine-tuning windows of ASR segments of 5 to 60 words three ways:
+one compute_cer call per window, one compute_cer_batch call per region, and
+the shared-start bit-parallel sweep of the incremental fine-tuning. All three
+must produce identical CERs.
+
+Usage:
+    python benchmarks/benchmark_cer_batch.py
+    python benchmarks/benchmark_cer_batch.py --lengths 5 20 60 --segments-per-length 100
+"""
+
+import argparse
+import random
+import timeit
+
+from synthetic_session import make_session
+
+from parliament_transcript_aligner.transcript.aligner import TranscriptAligner
+from parliament_transcript_aligner.transcript.edit_distance import BitParallelPattern
+from parliament_transcript_aligner.transcript.transcript_view import TranscriptView
+
+
+def make_cases(view: TranscriptView, num_words: int, num_cases: int, local_margin: int = 15, seed: int = 0):
+    """Create ASR texts of num_words words with the fine-tuning windows around their true position."""
+    rnd = random.Random(seed)
+    cases = []
+    for _ in range(num_cases):
+        region_start = rnd.randint(local_margin, len(view) - num_words - 2 * local_margin)
+        words = view.tokens[region_start:region_start + num_words]
+        # Some ASR noise: drop and swap a few words
+        words = [word for word in words if rnd.random() > 0.05]
+        if len(words) > 1 and rnd.random() < 0.5:
+            idx = rnd.randrange(len(words) - 1)
+            words[idx], words[idx + 1] = words[idx + 1], words[idx]
+        starts = list(range(region_start - local_margin, region_start + local_margin + 1))
+        ends = [[start + size for size in range(max(num_words - local_margin, 1), num_words + local_margin + 1)]
+                for start in starts]
+        cases.append((" ".join(words), starts, ends))
+    return cases
+
+
+def per_window(aligner: TranscriptAligner, view: TranscriptView, cases):
+    return [[[aligner.compute_cer(asr_text, view.window_text(start, end)) for end in group_ends]
+             for start, group_ends in zip(starts, ends)]
+            for asr_text, starts, ends in cases]
+
+
+def batched(aligner: TranscriptAligner, view: TranscriptView, cases):
+    results = []
+    for asr_text, starts, ends in cases:
+        texts = [view.window_text(start, end) for start, group_ends in zip(starts, ends) for end in group_ends]
+        cers = iter(aligner.compute_cer_batch(asr_text, texts))
+        results.append([[next(cers) for _ in group_ends] for group_ends in ends])
+    return results
+
+
+def bit_parallel(view: TranscriptView, cases):
+    results = []
+    for asr_text, starts, ends in cases:
+        distances = BitParallelPattern(asr_text).window_distances(
+            view.text,
+            [view.char_span(start, start + 1)[0] for start in starts],
+            [[view.char_span(end - 1, end)[1] for end in group_ends] for group_ends in ends]
+        )
+        results.append([[distance / len(asr_text) for distance in lane] for lane in distances])
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batched CER computation")
+    parser.add_argument("--lengths", type=int, nargs="+", default=[5, 10, 20, 30, 40, 50, 60],
+                        help="ASR segment lengths in words")
+    parser.add_argument("--segments-per-length", type=int, default=50, help="ASR segments per length")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best is reported)")
+    args = parser.parse_args()
+
+    _, transcript = make_session(num_words=20000, num_segments=0)
+    view = TranscriptView.from_text(transcript)
+    aligner = TranscriptAligner()
+
+    print(f"{'words':>5} {'windows':>8} {'per window':>12} {'batch':>12} {'bit-parallel':>13}  (µs per window)")
+    for num_words in args.lengths:
+        cases = make_cases(view, num_words, args.segments_per_length, seed=num_words)
+        num_windows = sum(len(group_ends) for _, _, ends in cases for group_ends in ends)
+        expected = per_window(aligner, view, cases)
+        assert batched(aligner, view, cases) == expected
+        assert bit_parallel(view, cases) == expected
+
+        timings = [
+            min(timeit.repeat(lambda: function(), number=1, repeat=args.repeat)) / num_windows * 1e6
+            for function in (
+                lambda: per_window(aligner, view, cases),
+                lambda: batched(aligner, view, cases),
+                lambda: bit_parallel(view, cases),
+            )
+        ]
+        print(f"{num_words:>5} {num_windows:>8} {timings[0]:>12.2f} {timings[1]:>12.2f} {timings[2]:>13.2f}")
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+CER cache benchmark
+
+Aligns a session without the window CER cache, with the per-segment memo only,
+and with the memo plus the LRU across segments. Reports wall time, CER
+evaluations and the cache hit rate for both region search strategies, and
+checks that the alignments are identical.
+
+Usage:
+    python benchmarks/benchmark_cer_cache.py
+    python benchmarks/benchmark_cer_cache.py --segments cache/<video_id>_segments.pkl --transcript transcript.txt
+"""
+
+import argparse
+import time
+
+from synthetic_session import add_session_arguments, session_from_args
+
+from parliament_transcript_aligner.transcript.aligner import TranscriptAligner
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the window CER cache")
+    add_session_arguments(parser)
+    parser.add_argument("--cache-size", type=int, default=100_000, help="Windows kept in the LRU across segments")
+    args = parser.parse_args()
+
+    segments, transcript = session_from_args(args)
+    print(f"Session: {len(segments)} segments, {len(transcript.split())} transcript tokens")
+
+    configurations = [("no cache", None), ("per-segment memo", 0), ("memo + LRU", args.cache_size)]
+    for search, use_anchor_index in [("window scan", False), ("anchor index", True)]:
+        results = {}
+        for name, cer_cache_size in configurations:
+            aligner = TranscriptAligner(use_anchor_index=use_anchor_index, cer_cache_size=cer_cache_size)
+            start = time.perf_counter()
+            results[name] = aligner.align_transcript(segments, transcript)
+            duration = time.perf_counter() - start
+            stats = aligner.stats
+            print(f"\n{search}, {name}:")
+            print(f"  Wall time:        {duration:.2f}s")
+            print(f"  CER evaluations:  {stats.cer_evaluations}")
+            if cer_cache_size is not None:
+                print(f"  Cache hits:       {stats.cer_cache_hits} ({stats.cer_cache_hit_rate:.1%} of lookups)")
+
+        reference = results["no cache"]
+        identical = all(
+            (a.start_idx, a.end_idx, a.cer) == (b.start_idx, b.end_idx, b.cer)
+            for name, _ in configurations[1:]
+            for a, b in zip(reference, results[name])
+        )
+        print(f"  Alignments identical: {identical}")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Energy-based silence detection benchmark
+
+Detects the fallback silences of a recording (used by AudioSegmenter when the
+VAD finds no silence in a window) in three ways:
+
+- pydub, as segment_audio did before: normalize, the 15th percentile of the RMS
+  of 100 ms frames from a Python loop, then pydub.silence.detect_silence. The
+  percentile is an RMS amplitude but detect_silence expects dBFS, so nearly
+  everything counts as silence
+- pydub with the threshold converted to dBFS
+- detect_energy_silences: framed RMS levels in dB from one NumPy pass over the
+  decoded buffer
+
+Reports wall time, the number and total length of the silences and how much of
+the silences of the corrected pydub run the NumPy implementation agrees on.
+
+Usage:
+    python benchmarks/benchmark_energy_silences.py
+    python benchmarks/benchmark_energy_silences.py --minutes 120
+    python benchmarks/benchmark_energy_silences.py --audio converted/<video_id>.wav
+"""
+
+import argparse
+import math
+import tempfile
+import time
+
+import numpy as np
+from pydub import silence
+from pyannote.core import Segment, Timeline
+
+from synthetic_audio import add_audio_arguments, audio_path_from_args
+
+from parliament_transcript_aligner.audio_processing.audio_buffer import load_audio, to_audio_segment
+from parliament_transcript_aligner.audio_processing.segmentation import detect_energy_silences
+
+
+def pydub_silences(audio: np.ndarray, threshold_in_dbfs: bool) -> Timeline:
+    pydub_audio = to_audio_segment(audio).normalize(headroom=5)
+    silence_threshold = np.percentile([frame.rms for frame in pydub_audio[::100]], 15)
+    if threshold_in_dbfs:
+        silence_threshold = 20 * math.log10(max(silence_threshold, 1) / pydub_audio.max_possible_amplitude)
+    silences = silence.detect_silence(pydub_audio, min_silence_len=200, silence_thresh=silence_threshold, seek_step=15)
+    return Timeline([Segment(start / 1000, end / 1000) for start, end in silences])
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark pydub vs. NumPy energy-based silence detection")
+    add_audio_arguments(parser)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        audio = load_audio(audio_path_from_args(args, directory))
+    print(f"Recording: {len(audio) / 16000 / 60:.1f} minutes")
+
+    results = {}
+    results["pydub (before)"] = timed(pydub_silences, audio, False)
+    results["pydub, dBFS threshold"] = timed(pydub_silences, audio, True)
+    results["NumPy"] = timed(detect_energy_silences, audio)
+
+    print(f"\n{'':<22} {'wall':>8} {'silences':>9} {'total':>9}")
+    for name, (silences, wall) in results.items():
+        print(f"{name:<22} {wall:>7.2f}s {len(silences):>9} {silences.duration():>8.1f}s")
+
+    reference, numpy_silences = results["pydub, dBFS threshold"][0], results["NumPy"][0]
+    common = sum(region.duration for region in numpy_silences.crop(reference.support(), mode="intersection"))
+    union = reference.duration() + numpy_silences.duration() - common
+    print(f"\nSpeedup over pydub (before): {results['pydub (before)'][1] / results['NumPy'][1]:.0f}x")
+    print(f"Agreement with the dBFS pydub run (intersection over union): {common / union if union else 1.0:.3f}")
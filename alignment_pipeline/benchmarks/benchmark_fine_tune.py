@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Fine-tuning benchmark
+
+Compares the window-by-window fine-tuning of TranscriptAligner with the
+incremental mode, which scores all windows of a region in one bit-parallel
+sweep. The equivalence of the two modes on random transcripts is tested in
+tests/test_fine_tune.py.
+
+Usage:
+    python benchmarks/benchmark_fine_tune.py
+    python benchmarks/benchmark_fine_tune.py --segments cache/<video_id>_segments.pkl --transcript transcript.txt
+"""
+
+import argparse
+import time
+
+from synthetic_session import add_session_arguments, session_from_args
+
+from parliament_transcript_aligner.transcript.aligner import TranscriptAligner
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark incremental fine-tuning")
+    add_session_arguments(parser)
+    args = parser.parse_args()
+
+    segments, transcript = session_from_args(args)
+    print(f"Session: {len(segments)} segments, {len(transcript.split())} transcript tokens")
+
+    results = {}
+    for name, incremental in [("window by window", False), ("incremental", True)]:
+        aligner = TranscriptAligner(incremental_fine_tune=incremental)
+        start = time.perf_counter()
+        results[name] = aligner.align_transcript(segments, transcript)
+        print(f"  {name}: {time.perf_counter() - start:.2f}s")
+
+    identical = all(
+        (a.start_idx, a.end_idx, a.cer) == (b.start_idx, b.end_idx, b.cer)
+        for a, b in zip(results["window by window"], results["incremental"])
+    )
+    print(f"Session alignments identical: {identical}")
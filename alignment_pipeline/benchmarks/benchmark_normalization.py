@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Text normalization benchmark
+
+Formats the transcript of a synthetic session like a human transcript
+(capitalized words, punctuation, dashes between words, digits where the ASR
+spelled out numbers) and aligns it with and without normalization. Reports wall time, CER
+evaluations, the median CER and the share of segments below the region CER
+threshold, and checks that the human_text of the results is sliced from the
+original transcript.
+
+Usage:
+    python benchmarks/benchmark_normalization.py
+    python benchmarks/benchmark_normalization.py --expand-numbers
+    python benchmarks/benchmark_normalization.py --segments cache/<video_id>_segments.pkl --transcript transcript.txt
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from synthetic_session import add_session_arguments, session_from_args
+
+from parliament_transcript_aligner.transcript.aligner import TranscriptAligner
+
+NUMBER_WORDS = {"one": "1", "two": "2", "three": "3", "four": "4", "five": "5", "ten": "10", "twenty": "20"}
+
+
+def format_like_human(transcript: str, seed: int = 0) -> str:
+    """Capitalize some words, add punctuation (also between words) and write spelled out numbers as digits."""
+    rnd = random.Random(seed)
+    tokens = []
+    for token in transcript.split():
+        token = NUMBER_WORDS.get(token, token)
+        if rnd.random() < 0.15:
+            token = token.capitalize()
+        if rnd.random() < 0.12:
+            token += rnd.choice([",", ".", ";", ":", "?"])
+        elif rnd.random() < 0.02:
+            token = f"({token})"
+        tokens.append(token)
+        if rnd.random() < 0.03:
+            # Dashes and ellipses between words, tokens without any word
+            tokens.append(rnd.choice(["-", "–", "..."]))
+    return " ".join(tokens)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark transcript normalization")
+    add_session_arguments(parser)
+    parser.add_argument("--expand-numbers", action="store_true", help="Spell out numbers (requires num2words)")
+    args = parser.parse_args()
+
+    segments, transcript = session_from_args(args)
+    if not (args.segments and args.transcript):
+        # Synthetic ASR output: spell out some words as numbers, the human transcript uses digits
+        number_words = list(NUMBER_WORDS)
+        words = transcript.split()
+        rnd = random.Random(args.seed)
+        for idx in rnd.sample(range(len(words)), len(words) // 50):
+            words[idx] = rnd.choice(number_words)
+        transcript = format_like_human(" ".join(words), seed=args.seed)
+    print(f"Session: {len(segments)} segments, {len(transcript.split())} transcript tokens")
+
+    configurations = [
+        ("raw text", dict(normalize_text=False)),
+        ("normalized", dict(normalize_text=True, expand_numbers=args.expand_numbers)),
+    ]
+    original_tokens = transcript.split()
+    for name, kwargs in configurations:
+        aligner = TranscriptAligner(**kwargs)
+        start = time.perf_counter()
+        aligned = aligner.align_transcript(segments, transcript)
+        duration = time.perf_counter() - start
+        print(f"\n{name}:")
+        print(f"  Wall time:        {duration:.2f}s")
+        print(f"  CER evaluations:  {aligner.stats.cer_evaluations}")
+        print(f"  Median CER:       {statistics.median(a.cer for a in aligned):.4f}")
+        print(f"  CER <= {aligner.region_cer_threshold}:       "
+              f"{sum(a.cer <= aligner.region_cer_threshold for a in aligned)}/{len(aligned)}")
+        original = all(
+            a.human_text == " ".join(original_tokens[a.start_idx:a.end_idx]) for a in aligned
+        )
+        print(f"  human_text from original transcript: {original}")
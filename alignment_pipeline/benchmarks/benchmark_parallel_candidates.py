@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Parallel candidate alignment benchmark
+
+Aligns the transcript candidates of one session (see benchmark_screening.py)
+one after the other in this process, and concurrently in a process pool as
+AlignmentPipeline does with alignment_workers > 1: the segments are sent to
+every worker once, and at most --workers results are pending at a time.
+Reports wall time, CPU time of this process and checks that every candidate
+gets the same median CER and that the same candidate is selected.
+
+Usage:
+    python benchmarks/benchmark_parallel_candidates.py
+    python benchmarks/benchmark_parallel_candidates.py --workers 8 --other-sittings 6
+    python benchmarks/benchmark_parallel_candidates.py --segments cache/<video_id>_segments.pkl --transcript transcript.txt
+"""
+
+import argparse
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from synthetic_session import add_session_arguments, session_from_args
+from benchmark_screening import make_candidates
+
+from parliament_transcript_aligner.pipeline.alignment_pipeline import (
+    _CandidateWorker, _init_candidate_worker, _run_candidate_task, _bounded_ordered_map
+)
+from parliament_transcript_aligner.transcript.aligner import TranscriptAligner
+
+
+def median_cer(aligned) -> float:
+    return statistics.median(segment.cer for segment in aligned) if aligned else 1.0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark parallel alignment of transcript candidates")
+    add_session_arguments(parser)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Processes of the pool")
+    parser.add_argument("--other-sittings", type=int, default=3, help="Transcripts of other sittings")
+    parser.add_argument("--engine", default="greedy", help="Alignment engine")
+    args = parser.parse_args()
+
+    segments, transcript = session_from_args(args)
+    candidates = make_candidates(transcript, args.other_sittings, seed=args.seed)
+    texts = list(candidates.values())
+    print(f"Session: {len(segments)} segments, {len(candidates)} transcript candidates")
+
+    worker_args = (segments, None, None, None, 0.99)
+    results = {}
+
+    worker = _CandidateWorker(TranscriptAligner(engine=args.engine), *worker_args)
+    start, cpu_start = time.perf_counter(), time.process_time()
+    results["sequential"] = [median_cer(worker.align(text)) for text in texts]
+    timings = {"sequential": (time.perf_counter() - start, time.process_time() - cpu_start)}
+
+    start, cpu_start = time.perf_counter(), time.process_time()
+    aligner_config = dict(engine=args.engine, anchored_workers=1)
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_candidate_worker,
+                             initargs=(aligner_config, *worker_args)) as executor:
+        tasks = [("align", text) for text in texts]
+        aligned = _bounded_ordered_map(executor, _run_candidate_task, tasks, args.workers)
+        results["pool"] = [median_cer(segments) for segments in aligned]
+    timings["pool"] = (time.perf_counter() - start, time.process_time() - cpu_start)
+
+    for name, label in [("sequential", "Sequential"), ("pool", f"Process pool, {args.workers} workers")]:
+        wall, cpu = timings[name]
+        print(f"\n{label}:")
+        print(f"  Wall time:          {wall:.2f}s")
+        print(f"  CPU (this process): {cpu:.2f}s")
+        best = min(range(len(texts)), key=results[name].__getitem__)
+        print(f"  Selected:           {list(candidates)[best]}")
+    print(f"\nSpeedup: {timings['sequential'][0] / timings['pool'][0]:.1f}x")
+    print(f"Median CERs identical: {results['sequential'] == results['pool']}")
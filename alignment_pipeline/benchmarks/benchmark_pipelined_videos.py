@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Pipelined multi-video benchmark
+
+Processes --videos synthetic videos one after the other and with the
+StagedExecutor of AlignmentPipeline(prefetch_videos=...), and reports the wall
+time, the utilization of every stage and the throughput in audio hours per hour.
+
+The stages run the CPU work of the pipeline and simulate the GPU:
+
+- prepare: synthesizes the recording (in place of decoding), detects its
+  silences and splits it into segments, and creates the synthetic session
+  (in place of preprocessing the transcript)
+- asr: sleeps for the time the GPU would need (--asr-rtf x audio duration; the
+  GIL is released, as in CUDA inference)
+- align: aligns the session with the greedy engine
+
+Usage:
+    python benchmarks/benchmark_pipelined_videos.py
+    python benchmarks/benchmark_pipelined_videos.py --videos 8 --minutes 20 --asr-rtf 0.005 --prefetch 2
+"""
+
+import argparse
+import time
+
+from synthetic_audio import SAMPLING_RATE, make_audio
+from synthetic_session import make_session
+
+from parliament_transcript_aligner.audio_processing.segmentation import (
+    SilenceIndex, detect_energy_silences, split_on_silences
+)
+from parliament_transcript_aligner.pipeline.staged_executor import Stage, StagedExecutor, summarize_stages
+from parliament_transcript_aligner.transcript.aligner import TranscriptAligner
+
+
+def prepare(number: int, args) -> dict:
+    audio = make_audio(args.minutes, seed=number)
+    silences = SilenceIndex(detect_energy_silences(audio))
+    duration = len(audio) / SAMPLING_RATE
+    split_on_silences(silences, 10.0, 20.0)
+    segments, transcript = make_session(num_words=int(args.minutes * 150), num_segments=int(args.minutes * 5),
+                                        seed=number)
+    return {"duration": duration, "segments": segments, "transcript": transcript}
+
+
+def transcribe(video: dict, args) -> dict:
+    time.sleep(video["duration"] * args.asr_rtf)
+    return video
+
+
+def align(video: dict) -> float:
+    TranscriptAligner(engine="greedy").align_transcript(video["segments"], video["transcript"])
+    return video["duration"]
+
+
+def report(name: str, audio_seconds: float, wall_time: float) -> None:
+    print(f"{name}: {wall_time:.1f}s, {audio_seconds / wall_time:.0f} audio hours per hour")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark sequential vs. pipelined processing of videos")
+    parser.add_argument("--videos", type=int, default=6, help="Number of videos")
+    parser.add_argument("--minutes", type=float, default=10.0, help="Length of every recording")
+    parser.add_argument("--asr-rtf", type=float, default=0.002, help="Simulated GPU seconds per audio second")
+    parser.add_argument("--prefetch", type=int, default=1, help="Videos prepared ahead of the ASR")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    durations = [align(transcribe(prepare(number, args), args)) for number in range(args.videos)]
+    sequential_time = time.perf_counter() - start
+    report("Sequential", sum(durations), sequential_time)
+
+    executor = StagedExecutor([
+        Stage("prepare", lambda number: prepare(number, args)),
+        Stage("asr", lambda video: transcribe(video, args), queue_size=args.prefetch),
+        Stage("align", align),
+    ])
+    durations = executor.run(range(args.videos))
+    report(f"Pipelined (prefetch {args.prefetch})", sum(durations), executor.wall_time)
+    print(summarize_stages(executor.stats, executor.wall_time))
+    print(f"Speedup: {sequential_time / executor.wall_time:.2f}x")
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Position prior benchmark
+
+Aligns a session with and without the speech-rate position prior, which
+restricts the retry of segments that do not match near the previous match to
+a band around their predicted position. Reports wall time, how many retries
+rescanned the whole transcript, CER and unchanged alignments, for both region
+search strategies. Sessions with many unalignable segments benefit most.
+
+Usage:
+    python benchmarks/benchmark_position_prior.py --junk-rate 0.4
+    python benchmarks/benchmark_position_prior.py --segments cache/<video_id>_segments.pkl --transcript transcript.txt
+"""
+
+import argparse
+import statistics
+import time
+
+from synthetic_session import add_session_arguments, session_from_args
+
+from parliament_transcript_aligner.transcript.aligner import TranscriptAligner
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the speech-rate position prior")
+    add_session_arguments(parser)
+    args = parser.parse_args()
+
+    segments, transcript = session_from_args(args)
+    print(f"Session: {len(segments)} segments, {len(transcript.split())} transcript tokens")
+
+    for search, use_anchor_index in [("window scan", False), ("anchor index", True)]:
+        results = {}
+        for use_position_prior in [False, True]:
+            aligner = TranscriptAligner(use_anchor_index=use_anchor_index, use_position_prior=use_position_prior)
+            start = time.perf_counter()
+            aligned = aligner.align_transcript(segments, transcript)
+            duration = time.perf_counter() - start
+            results[use_position_prior] = aligned
+            stats = aligner.stats
+            print(f"\n{search}, {'with' if use_position_prior else 'without'} position prior:")
+            print(f"  Wall time:            {duration:.2f}s")
+            print(f"  Full rescans:         {stats.full_rescans}")
+            print(f"  Prior band searches:  {stats.prior_band_searches}")
+            print(f"  Median CER:           {statistics.median(a.cer for a in aligned):.4f}")
+            print(f"  Mean CER:             {statistics.mean(a.cer for a in aligned):.4f}")
+
+        unchanged = sum(
+            (a.start_idx, a.end_idx) == (b.start_idx, b.end_idx)
+            for a, b in zip(results[False], results[True])
+        )
+        print(f"  Unchanged alignments: {unchanged}/{len(segments)}")
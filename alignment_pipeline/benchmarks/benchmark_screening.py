@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Candidate screening benchmark
+
+Builds several transcript candidates for one session, as for parliaments with
+several transcripts per date: two modalities of the right transcript, a
+transcript that only partly matches, and transcripts of other sittings.
+Selects the best candidate by fully aligning every candidate, and by
+screening the candidates on a stratified sample first and fully aligning only
+those that could still be selected. Reports CPU time and the selections.
+
+Usage:
+    python benchmarks/benchmark_screening.py
+    python benchmarks/benchmark_screening.py --sample-size 50 --other-sittings 5
+    python benchmarks/benchmark_screening.py --segments cache/<video_id>_segments.pkl --transcript transcript.txt
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from synthetic_session import add_session_arguments, session_from_args
+
+from parliament_transcript_aligner.pipeline.screening import (
+    stratified_sample, median_confidence_interval, candidates_to_align
+)
+from parliament_transcript_aligner.transcript.aligner import TranscriptAligner
+
+
+def make_candidates(transcript: str, other_sittings: int, seed: int = 0):
+    """Create (transcript_id, format) candidates from the right transcript."""
+    rnd = random.Random(seed)
+    words = transcript.split()
+    noisy = [rnd.choice(words) if rnd.random() < 0.1 else word for word in words]
+    shuffled = words[:]
+    rnd.shuffle(shuffled)
+    candidates = {
+        ("right", "html"): transcript,
+        ("right", "pdf"): " ".join(noisy),
+        ("partial", "html"): " ".join(words[:len(words) // 3] + shuffled[len(words) // 3:]),
+    }
+    for sitting in range(other_sittings):
+        other = words[:]
+        rnd.shuffle(other)
+        candidates[(f"other_{sitting}", "html")] = " ".join(other)
+    return candidates
+
+
+def median_cer(aligner: TranscriptAligner, segments, text: str) -> float:
+    aligned = [segment for segment in aligner.align_transcript(segments, text) if segment is not None]
+    return statistics.median(segment.cer for segment in aligned) if aligned else 1.0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark sample-based candidate screening")
+    add_session_arguments(parser)
+    parser.add_argument("--sample-size", type=int, default=100, help="Segments aligned per candidate for screening")
+    parser.add_argument("--confidence", type=float, default=0.99, help="Confidence level of the median CER intervals")
+    parser.add_argument("--other-sittings", type=int, default=3, help="Transcripts of other sittings")
+    parser.add_argument("--cer-threshold", type=float, default=0.3, help="Maximum acceptable median CER")
+    args = parser.parse_args()
+
+    segments, transcript = session_from_args(args)
+    candidates = make_candidates(transcript, args.other_sittings, seed=args.seed)
+    print(f"Session: {len(segments)} segments, {len(candidates)} transcript candidates")
+    aligner = TranscriptAligner()
+
+    start = time.process_time()
+    full = {candidate: median_cer(aligner, segments, text) for candidate, text in candidates.items()}
+    full_time = time.process_time() - start
+    print(f"\nFull alignment of every candidate: {full_time:.2f}s CPU")
+    for candidate, cer in full.items():
+        print(f"  {candidate[0]:>10} ({candidate[1]}): median CER {cer:.4f}")
+
+    start = time.process_time()
+    sample = stratified_sample(segments, args.sample_size)
+    estimates = {}
+    for candidate, text in candidates.items():
+        aligned = [segment for segment in aligner.align_transcript(sample, text) if segment is not None]
+        estimates[candidate] = median_confidence_interval([segment.cer for segment in aligned], args.confidence)
+    selected = candidates_to_align(
+        estimates, {candidate: candidate[0] for candidate in candidates}, "best_only", args.cer_threshold
+    )
+    screened = {candidate: median_cer(aligner, segments, candidates[candidate]) for candidate in selected}
+    screening_time = time.process_time() - start
+    print(f"\nScreening, then full alignment of {len(selected)} candidates: {screening_time:.2f}s CPU "
+          f"({full_time / screening_time:.1f}x less)")
+    for candidate, estimate in estimates.items():
+        print(f"  {candidate[0]:>10} ({candidate[1]}): median CER {estimate.median:.4f} "
+              f"[{estimate.lower:.4f}, {estimate.upper:.4f}]{'' if candidate in selected else ' skipped'}")
+
+    best_full = min(full, key=full.get)
+    best_screened = min(screened, key=screened.get)
+    print(f"\nSelected (full): {best_full}, selected (screened): {best_screened}, same: {best_full == best_screened}")
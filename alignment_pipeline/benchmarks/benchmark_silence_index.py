@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Silence index benchmark
+
+Splits synthetic sessions into segments with split_on_silences, once with the
+non-speech regions as pyannote Timelines (each longest-silence query crops the
+Timeline, as segment_audio did before) and once with a SilenceIndex (binary
+search and a sparse table over sorted arrays). Regression check: both must give
+exactly the same segments, and the same answer to random longest-silence
+queries, with and without pydub fallback silences and diarization.
+
+Usage:
+    python benchmarks/benchmark_silence_index.py
+    python benchmarks/benchmark_silence_index.py --hours 1 4 8 --queries 20000
+"""
+
+import argparse
+import random
+import time
+
+import synthetic_audio  # noqa: F401 (makes the package importable)
+
+from pyannote.core import Annotation, Segment, Timeline
+
+from parliament_transcript_aligner.audio_processing.segmentation import (
+    SilenceIndex, longest_silence, split_on_silences
+)
+
+
+def make_regions(hours: float, seed: int = 0):
+    """Create non-speech regions like Silero VAD finds them, pydub silences and a diarization.
+
+    Speech runs of 0.5 to 30 seconds (some longer than the maximum window, so that
+    the pydub fallback is used) alternate with pauses of 10 ms to 3 seconds, and
+    now and then a break longer than the minimum window. Times are whole samples.
+    """
+    rnd = random.Random(seed)
+    duration = hours * 3600
+    non_speech, silences = Timeline(), Timeline()
+    diarization = Annotation()
+    speakers = ["A", "B", "C"]
+    speaker = speakers[0]
+    position = round(rnd.uniform(0.0, 2.0) * 16000) / 16000
+    non_speech.add(Segment(0, position))
+    while position < duration:
+        speech_end = position + round(rnd.uniform(0.5, 30.0) * 16000) / 16000
+        # Short pauses inside the speech run, only found by pydub
+        cursor = position
+        while True:
+            cursor += round(rnd.uniform(1.0, 8.0) * 1000) / 1000
+            if cursor + 0.5 >= speech_end:
+                break
+            silences.add(Segment(cursor, cursor + round(rnd.uniform(0.2, 0.5) * 1000) / 1000))
+        if rnd.random() < 0.2:
+            speaker = rnd.choice(speakers)
+        diarization[Segment(position, speech_end)] = speaker
+        pause = rnd.uniform(12.0, 60.0) if rnd.random() < 0.03 else rnd.uniform(0.01, 3.0)
+        position = speech_end + round(pause * 16000) / 16000
+        non_speech.add(Segment(speech_end, position))
+    # An overlapping speaker now and then
+    for _ in range(int(hours * 20)):
+        start = rnd.uniform(0.0, duration)
+        diarization[Segment(start, start + rnd.uniform(0.5, 3.0))] = rnd.choice(speakers) + "_overlap"
+    return non_speech, silences, diarization
+
+
+def as_tuples(timeline):
+    return [(segment.start, segment.end) for segment in timeline]
+
+
+def check_queries(non_speech: Timeline, index: SilenceIndex, queries: int, seed: int) -> int:
+    """Compare random longest-silence queries, return the number of mismatches."""
+    rnd = random.Random(seed)
+    end = non_speech.extent().end
+    boundaries = [boundary for segment in non_speech for boundary in (segment.start, segment.end)]
+    mismatches = 0
+    for _ in range(queries):
+        if rnd.random() < 0.3:
+            # Windows starting or ending exactly on region boundaries
+            start = rnd.choice(boundaries)
+            window_end = rnd.choice([start + rnd.uniform(0.0, 30.0), start + 20.0])
+        else:
+            start = rnd.uniform(-5.0, end + 5.0)
+            window_end = start + rnd.choice([rnd.uniform(0.0, 60.0), 10.0, 20.0, 0.0])
+        if longest_silence(non_speech, start, window_end) != longest_silence(index, start, window_end):
+            mismatches += 1
+    return mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Timeline.crop vs. SilenceIndex in split_on_silences")
+    parser.add_argument("--hours", type=float, nargs="+", default=[0.5, 2, 6], help="Session lengths")
+    parser.add_argument("--queries", type=int, default=5000, help="Random longest-silence queries per session")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    identical = True
+    print(f"{'hours':>6} {'regions':>8} {'variant':>12} {'segments':>9} {'Timeline':>10} {'index':>9} {'speedup':>8}")
+    for hours in args.hours:
+        non_speech, silences, diarization = make_regions(hours, seed=args.seed)
+        start = time.perf_counter()
+        index = SilenceIndex(non_speech)
+        silence_index = SilenceIndex(silences)
+        build_time = time.perf_counter() - start
+
+        mismatches = check_queries(non_speech, index, args.queries, args.seed)
+        identical &= mismatches == 0
+
+        for variant, fallback, speakers in [("VAD only", None, None),
+                                            ("+ pydub", silences, None),
+                                            ("+ diarization", silences, diarization)]:
+            start = time.perf_counter()
+            expected = split_on_silences(non_speech, 10.0, 20.0, fallback, speakers)
+            timeline_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            actual = split_on_silences(index, 10.0, 20.0, silence_index if fallback else None, speakers)
+            index_time = time.perf_counter() - start + build_time
+
+            same = as_tuples(expected) == as_tuples(actual)
+            identical &= same
+            print(f"{hours:>6g} {len(non_speech):>8} {variant:>12} {len(actual):>9} "
+                  f"{timeline_time:>9.2f}s {index_time:>8.3f}s {timeline_time / index_time:>7.0f}x"
+                  f"{'' if same else '  SEGMENTS DIFFER'}")
+        print(f"{'':>6} random queries: {args.queries}, mismatches: {mismatches}")
+
+    print(f"\nIdentical results: {identical}")
+    if not identical:
+        raise SystemExit(1)
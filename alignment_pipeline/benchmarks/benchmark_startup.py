@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Import time and startup benchmark
+
+Starts fresh Python processes with -X importtime that import
+parliament_transcript_aligner and construct an AlignmentPipeline (without
+Supabase logging), and reports the import time, the construction time, the
+packages that dominate the import (self time from -X importtime) and whether
+torch, transformers, pyannote.audio, pydub or supabase were imported or the ASR
+model was loaded. Neither should happen before the first video that is not
+cached.
+
+To track the metric over time, --json appends one record per run to a JSON lines
+file (with the git commit), and --max-import-ms fails if the median import time
+exceeds a budget.
+
+Usage:
+    python benchmarks/benchmark_startup.py
+    python benchmarks/benchmark_startup.py --repeat 10 --json startup_metrics.jsonl --max-import-ms 1500
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+PACKAGE_DIR = str(Path(__file__).resolve().parent.parent)
+HEAVY_MODULES = ["torch", "transformers", "pyannote.audio", "pydub", "supabase"]
+MARKER = "benchmark_startup: importing"
+
+
+def run_child(directory: str) -> None:
+    """Import the package and construct a pipeline, print the measurements as JSON (child process)."""
+    sys.path.insert(0, PACKAGE_DIR)
+    print(MARKER, file=sys.stderr, flush=True)
+    start = time.perf_counter()
+    from parliament_transcript_aligner import AlignmentPipeline
+    import_seconds = time.perf_counter() - start
+
+    csv_path = os.path.join(directory, "metadata.csv")
+    with open(csv_path, "w") as f:
+        f.write("video_id,transcript_id\n")
+    start = time.perf_counter()
+    pipeline = AlignmentPipeline(directory, csv_path, os.path.join(directory, "output"),
+                                 hf_cache_dir=directory, supabase_logging_enabled=False)
+    construct_seconds = time.perf_counter() - start
+
+    segmenter = pipeline.audio_segmenter
+    print(json.dumps({
+        "import_seconds": import_seconds,
+        "construct_seconds": construct_seconds,
+        "heavy_modules": [module for module in HEAVY_MODULES if module in sys.modules],
+        "asr_loaded": segmenter.asr_backend is not None or segmenter.asr_pool is not None,
+    }))
+
+
+def package_self_times(importtime_output: str) -> dict:
+    """Sum the self import time in seconds of every top-level package imported after the marker."""
+    lines = importtime_output.splitlines()
+    lines = lines[lines.index(MARKER) + 1:] if MARKER in lines else lines
+    times = defaultdict(float)
+    for line in lines:
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        if self_us.strip().isdigit():
+            times[name.strip().split(".")[0]] += int(self_us) / 1e6
+    return dict(times)
+
+
+def measure() -> tuple:
+    """Run one child process and return its measurements and the self import time per package."""
+    with tempfile.TemporaryDirectory() as directory:
+        process = subprocess.run([sys.executable, "-X", "importtime", __file__, "--child", directory],
+                                 capture_output=True, text=True)
+    if process.returncode != 0:
+        raise RuntimeError(f"Startup process failed:\n{process.stderr[-2000:]}")
+    return json.loads(process.stdout.strip().splitlines()[-1]), package_self_times(process.stderr)
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PACKAGE_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (subprocess.SubprocessError, OSError):
+        return ""
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the import time and startup of the pipeline")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of fresh processes")
+    parser.add_argument("--top", type=int, default=8, help="Number of packages to list")
+    parser.add_argument("--json", default=None, help="JSON lines file to append the results to")
+    parser.add_argument("--max-import-ms", type=float, default=None, help="Fail if the median import time is higher")
+    parser.add_argument("--child", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child)
+        sys.exit(0)
+
+    runs = [measure() for _ in range(args.repeat)]
+    results = [result for result, _ in runs]
+    import_ms = statistics.median(result["import_seconds"] for result in results) * 1000
+    construct_ms = statistics.median(result["construct_seconds"] for result in results) * 1000
+    heavy_modules = sorted({module for result in results for module in result["heavy_modules"]})
+    asr_loaded = any(result["asr_loaded"] for result in results)
+
+    package_times = defaultdict(list)
+    for _, times in runs:
+        for package, seconds in times.items():
+            package_times[package].append(seconds)
+    slowest = sorted(((statistics.median(times), package) for package, times in package_times.items()), reverse=True)
+
+    print(f"Import of parliament_transcript_aligner: {import_ms:.0f} ms (median of {args.repeat} processes)")
+    print(f"AlignmentPipeline construction: {construct_ms:.1f} ms, ASR model loaded: {'yes' if asr_loaded else 'no'}")
+    print(f"Heavy modules imported: {', '.join(heavy_modules) if heavy_modules else 'none'}")
+    print("Slowest packages (self import time):")
+    for seconds, package in slowest[:args.top]:
+        print(f"  {package:<32} {seconds * 1000:>8.1f} ms")
+
+    if args.json:
+        record = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": sys.version.split()[0],
+            "import_ms": import_ms,
+            "construct_ms": construct_ms,
+            "heavy_modules": heavy_modules,
+            "asr_loaded": asr_loaded,
+            "packages_ms": {package: seconds * 1000 for seconds, package in slowest[:args.top]},
+        }
+        with open(args.json, "a") as f:
+            f.write(json.dumps(record) + "\n")
+        print(f"Appended the results to {args.json}")
+
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        print(f"Import time {import_ms:.0f} ms exceeds the budget of {args.max_import_ms:.0f} ms")
+        sys.exit(1)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Streaming alignment benchmark
+
+Simulates the ASR of a session: segments are released in batches, after
+sleeping for the time the GPU would need for the batch (the GIL is released,
+as in CUDA inference). Aligns the session after the transcription, and while
+the transcription is running, with the aligner consuming the segments from a
+queue in a thread as AlignmentPipeline does with streaming_alignment=True.
+Reports the end-to-end time against the ASR and alignment times and checks
+that the alignments are identical.
+
+Usage:
+    python benchmarks/benchmark_streaming_alignment.py
+    python benchmarks/benchmark_streaming_alignment.py --asr-seconds 30 --batch-size 16
+    python benchmarks/benchmark_streaming_alignment.py --segments cache/<video_id>_segments.pkl --transcript transcript.txt
+"""
+
+import argparse
+import queue
+import threading
+import time
+
+from synthetic_session import add_session_arguments, session_from_args
+
+from parliament_transcript_aligner.pipeline.alignment_pipeline import _iter_queue
+from parliament_transcript_aligner.transcript.aligner import TranscriptAligner
+
+
+def simulated_asr(segments, batch_size: int, asr_seconds: float):
+    """Yield the segments batch by batch, spreading asr_seconds over the batches."""
+    batch_seconds = asr_seconds * batch_size / len(segments)
+    for i in range(0, len(segments), batch_size):
+        time.sleep(batch_seconds)
+        yield from segments[i:i + batch_size]
+
+
+def key(aligned_segments):
+    return [(a.start_idx, a.end_idx, a.cer) if a else None for a in aligned_segments]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark alignment overlapping with the transcription")
+    add_session_arguments(parser)
+    parser.add_argument("--asr-seconds", type=float, default=None,
+                        help="Simulated transcription time (default: the measured alignment time)")
+    parser.add_argument("--batch-size", type=int, default=8, help="Segments per ASR batch")
+    args = parser.parse_args()
+
+    segments, transcript = session_from_args(args)
+    print(f"Session: {len(segments)} segments, {len(transcript.split())} transcript tokens")
+
+    start = time.perf_counter()
+    reference = TranscriptAligner().align_transcript(segments, transcript)
+    align_seconds = time.perf_counter() - start
+    asr_seconds = args.asr_seconds if args.asr_seconds is not None else align_seconds
+    print(f"Alignment: {align_seconds:.2f}s, simulated ASR: {asr_seconds:.2f}s")
+
+    start = time.perf_counter()
+    transcribed = list(simulated_asr(segments, args.batch_size, asr_seconds))
+    sequential = TranscriptAligner().align_transcript(transcribed, transcript)
+    sequential_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    segment_queue = queue.Queue()
+    result = {}
+    thread = threading.Thread(
+        target=lambda: result.update(aligned=TranscriptAligner().align_transcript(_iter_queue(segment_queue), transcript))
+    )
+    thread.start()
+    for segment in simulated_asr(segments, args.batch_size, asr_seconds):
+        segment_queue.put(segment)
+    segment_queue.put(None)
+    transcription_end = time.perf_counter()
+    thread.join()
+    streaming_seconds = time.perf_counter() - start
+
+    print(f"\nASR, then alignment:      {sequential_seconds:.2f}s")
+    print(f"Streaming alignment:      {streaming_seconds:.2f}s "
+          f"(alignment finished {streaming_seconds - (transcription_end - start):.2f}s after the transcription)")
+    print(f"Lower bound max(ASR, alignment): {max(asr_seconds, align_seconds):.2f}s")
+    print(f"Speedup: {sequential_seconds / streaming_seconds:.2f}x")
+    print(f"Alignments identical: {key(reference) == key(sequential) == key(result['aligned'])}")
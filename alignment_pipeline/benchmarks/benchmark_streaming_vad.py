@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Streaming VAD benchmark
+
+Runs Silero VAD on synthetic recordings of increasing length, once on the
+whole decoded recording (get_silero_vad) and once over chunks read from the
+file (iter_silero_non_speech over iter_audio_chunks). Every run is a separate
+process, so that its peak RSS can be reported. Checks that both modes find
+the same non-speech regions.
+
+Usage:
+    python benchmarks/benchmark_streaming_vad.py
+    python benchmarks/benchmark_streaming_vad.py --minutes 30 60 120 --onnx
+"""
+
+import argparse
+import hashlib
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from synthetic_audio import make_audio, write_wav
+
+
+def run_vad(mode: str, audio_path: str, onnx: bool) -> None:
+    """Run one VAD mode and print the number and a digest of the regions (child process)."""
+    from parliament_transcript_aligner.audio_processing.audio_buffer import load_audio, iter_audio_chunks
+    from parliament_transcript_aligner.audio_processing.vad.silero_vad import get_silero_vad, iter_silero_non_speech
+
+    if mode == "whole":
+        regions = list(get_silero_vad(audio_path, audio=load_audio(audio_path), onnx=onnx))
+    else:
+        regions = list(iter_silero_non_speech(iter_audio_chunks(audio_path), onnx=onnx))
+    digest = hashlib.sha1(repr([(region.start, region.end) for region in regions]).encode()).hexdigest()
+    print(f"{len(regions)} {digest}")
+
+
+def measure(mode: str, audio_path: str, onnx: bool):
+    """Run one VAD mode in a child process and return its output, wall time and peak RSS in MB."""
+    cmd = [sys.executable, __file__, "--child", mode, audio_path] + (["--onnx"] if onnx else [])
+    start = time.perf_counter()
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+    output = process.stdout.read().decode().strip()
+    _, status, usage = os.wait4(process.pid, 0)
+    if status != 0:
+        raise RuntimeError(f"VAD process failed: {cmd}")
+    return output, time.perf_counter() - start, usage.ru_maxrss / 1024  # ru_maxrss is in KB on Linux
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark peak memory of whole-recording vs. streaming VAD")
+    parser.add_argument("--minutes", type=float, nargs="+", default=[15, 30, 60], help="Recording lengths")
+    parser.add_argument("--onnx", action="store_true", help="Use the ONNX Runtime model")
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "AUDIO"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_vad(args.child[0], args.child[1], args.onnx)
+        sys.exit(0)
+
+    print(f"{'minutes':>8} {'mode':>10} {'wall':>8} {'peak RSS':>10} {'regions':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        for minutes in args.minutes:
+            audio_path = os.path.join(directory, f"session_{minutes}.wav")
+            write_wav(audio_path, make_audio(minutes))
+            outputs = {}
+            for mode in ["whole", "streaming"]:
+                outputs[mode], wall, rss = measure(mode, audio_path, args.onnx)
+                print(f"{minutes:>8.0f} {mode:>10} {wall:>7.1f}s {rss:>7.0f} MB {outputs[mode].split()[0]:>8}")
+            print(f"{'':>8} identical regions: {outputs['whole'] == outputs['streaming']}")
+            os.remove(audio_path)
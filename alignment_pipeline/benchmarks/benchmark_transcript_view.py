@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Transcript view benchmark
+
+Measures the cost of materializing candidate window texts: joining a slice of
+the token list per window (the previous approach) vs. slicing the joined text
+of a TranscriptView between precomputed character offsets. Reports wall time
+and tracemalloc allocations for all fine-tuning windows of a session, and the
+allocation peak of a full alignment run in both fine-tuning modes.
+
+Usage:
+    python benchmarks/benchmark_transcript_view.py
+    python benchmarks/benchmark_transcript_view.py --segments cache/<video_id>_segments.pkl --transcript transcript.txt
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import Levenshtein
+from synthetic_session import add_session_arguments, session_from_args
+
+from parliament_transcript_aligner.transcript.aligner import TranscriptAligner
+from parliament_transcript_aligner.transcript.transcript_view import TranscriptView
+
+
+def fine_tune_windows(segments, aligned, num_tokens: int, local_margin: int = 15):
+    """Enumerate the fine-tuning windows around every aligned region."""
+    for segment, alignment in zip(segments, aligned):
+        num_predicted = len(segment.text.split())
+        for start in range(max(alignment.start_idx - local_margin, 0), alignment.start_idx + local_margin + 1):
+            for window_tokens in range(max(num_predicted - local_margin, 1), num_predicted + local_margin + 1):
+                end = start + window_tokens
+                if end > num_tokens:
+                    break
+                yield segment.text, start, end
+
+
+def measure(score_windows, windows):
+    """Time a window scoring function (best of 3), then record its allocations in a second (traced) run."""
+    durations = []
+    for _ in range(3):
+        start = time.perf_counter()
+        score_windows(windows)
+        durations.append(time.perf_counter() - start)
+    tracemalloc.start()
+    score_windows(windows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(durations), peak
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark window text materialization")
+    add_session_arguments(parser)
+    args = parser.parse_args()
+
+    segments, transcript = session_from_args(args)
+    tokens = transcript.split()
+    print(f"Session: {len(segments)} segments, {len(tokens)} transcript tokens")
+
+    aligned = TranscriptAligner().align_transcript(segments, transcript)
+    windows = list(fine_tune_windows(segments, aligned, len(tokens)))
+    view = TranscriptView(tokens)
+    print(f"Fine-tuning windows: {len(windows)}")
+
+    # Only the sum of the distances is kept, so the allocation peak is that of the window texts
+    def score_joined(windows):
+        return sum(Levenshtein.distance(asr_text, " ".join(tokens[start:end])) for asr_text, start, end in windows)
+
+    def score_view(windows):
+        return sum(Levenshtein.distance(asr_text, view.window_text(start, end)) for asr_text, start, end in windows)
+
+    assert all(" ".join(tokens[start:end]) == view.window_text(start, end) for _, start, end in windows)
+
+    for name, score_windows in [("join of token slice", score_joined), ("transcript view slice", score_view)]:
+        duration, peak = measure(score_windows, windows)
+        print(f"\n{name}:")
+        print(f"  Wall time:        {duration:.2f}s")
+        print(f"  Allocation peak:  {peak / 2**10:.1f} KiB")
+
+    # Tracing slows down the big integer arithmetic of the incremental mode, so only the peak is reported
+    for incremental_fine_tune in [False, True]:
+        aligner = TranscriptAligner(incremental_fine_tune=incremental_fine_tune)
+        tracemalloc.start()
+        aligner.align_transcript(segments, transcript)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        mode = "incremental" if incremental_fine_tune else "window by window"
+        print(f"\nFull alignment ({mode}): allocation peak {peak / 2**20:.1f} MiB")
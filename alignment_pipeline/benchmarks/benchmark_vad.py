@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Silero VAD benchmark
+
+Runs get_silero_vad on one recording with the torch and the ONNX Runtime
+model. Reports the time to load each model (first call) and to reuse the
+cached model, the throughput in audio hours per CPU minute of this process,
+and how much of the detected non-speech both backends agree on.
+
+Usage:
+    python benchmarks/benchmark_vad.py
+    python benchmarks/benchmark_vad.py --minutes 60 --torch-threads 4
+    python benchmarks/benchmark_vad.py --audio converted/<video_id>.wav --backends onnx
+
+The ONNX backend requires silero-vad and onnxruntime.
+"""
+
+import argparse
+import tempfile
+import time
+
+import torch
+
+from synthetic_audio import add_audio_arguments, audio_path_from_args
+
+from parliament_transcript_aligner.audio_processing.audio_buffer import SAMPLING_RATE, load_audio
+from parliament_transcript_aligner.audio_processing.vad.silero_vad import get_silero_vad, load_silero_vad_model
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Silero VAD throughput with torch and ONNX Runtime")
+    add_audio_arguments(parser)
+    parser.add_argument("--backends", nargs="+", default=["torch", "onnx"], choices=["torch", "onnx"])
+    parser.add_argument("--repeats", type=int, default=2, help="Runs with the cached model")
+    parser.add_argument("--torch-threads", type=int, default=None, help="torch.set_num_threads for the torch model")
+    args = parser.parse_args()
+
+    if args.torch_threads:
+        torch.set_num_threads(args.torch_threads)
+
+    with tempfile.TemporaryDirectory() as directory:
+        audio = load_audio(audio_path_from_args(args, directory))
+    hours = len(audio) / SAMPLING_RATE / 3600
+    print(f"Recording: {hours * 60:.1f} minutes")
+
+    silences = {}
+    for backend in args.backends:
+        onnx = backend == "onnx"
+        start = time.perf_counter()
+        load_silero_vad_model(onnx=onnx)
+        load_time = time.perf_counter() - start
+        start = time.perf_counter()
+        load_silero_vad_model(onnx=onnx)
+        cached_time = time.perf_counter() - start
+
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        for _ in range(args.repeats):
+            silences[backend] = get_silero_vad("", audio=audio, onnx=onnx)
+        wall = (time.perf_counter() - wall_start) / args.repeats
+        cpu = (time.process_time() - cpu_start) / args.repeats
+
+        print(f"\n{backend}:")
+        print(f"  Model load:         {load_time:.2f}s (cached: {cached_time * 1e6:.0f}us)")
+        print(f"  VAD wall time:      {wall:.2f}s ({hours * 3600 / wall:.0f}x real time)")
+        print(f"  VAD CPU time:       {cpu:.2f}s")
+        print(f"  Throughput:         {hours / (cpu / 60):.2f} audio hours per CPU minute")
+        print(f"  Non-speech regions: {len(silences[backend])}, {silences[backend].duration():.1f}s")
+
+    if len(silences) == 2:
+        torch_silences, onnx_silences = silences["torch"], silences["onnx"]
+        common = sum(
+            region.duration
+            for region in onnx_silences.crop(torch_silences.support(), mode="intersection")
+        )
+        union = torch_silences.duration() + onnx_silences.duration() - common
+        print(f"\nNon-speech agreement (intersection over union): {common / union if union else 1.0:.3f}")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Word-level region search benchmark
+
+Aligns a session with the sliding-window region scan comparing character
+strings (CER) and comparing normalized word ID sequences (word error rate).
+Reports the wall time of the whole alignment and of the region scan alone, the
+number of evaluations of each kind, and checks that the final alignments are
+unchanged.
+
+Usage:
+    python benchmarks/benchmark_word_level_search.py
+    python benchmarks/benchmark_word_level_search.py --word-region-threshold 0.4
+    python benchmarks/benchmark_word_level_search.py --segments cache/<video_id>_segments.pkl --transcript transcript.txt
+"""
+
+import argparse
+import time
+
+from synthetic_session import add_session_arguments, session_from_args
+
+from parliament_transcript_aligner.transcript.aligner import TranscriptAligner
+
+
+class TimedAligner(TranscriptAligner):
+    """TranscriptAligner that measures the time spent in the region scan."""
+
+    region_scan_time = 0.0
+
+    def _find_match_region(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return super()._find_match_region(*args, **kwargs)
+        finally:
+            self.region_scan_time += time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the word-level region search")
+    add_session_arguments(parser)
+    parser.add_argument("--word-region-threshold", type=float, default=0.5,
+                        help="Word error rate at which the word-level scan stops at a region")
+    args = parser.parse_args()
+
+    segments, transcript = session_from_args(args)
+    print(f"Session: {len(segments)} segments, {len(transcript.split())} transcript tokens")
+
+    results = {}
+    for word_level_search in [False, True]:
+        aligner = TimedAligner(
+            use_anchor_index=False,
+            word_level_search=word_level_search,
+            word_region_threshold=args.word_region_threshold
+        )
+        start = time.perf_counter()
+        results[word_level_search] = aligner.align_transcript(segments, transcript)
+        duration = time.perf_counter() - start
+        stats = aligner.stats
+        print(f"\n{'word' if word_level_search else 'character'}-level region scan:")
+        print(f"  Wall time:          {duration:.2f}s")
+        print(f"  Region scan time:   {aligner.region_scan_time:.2f}s")
+        print(f"  CER evaluations:    {stats.cer_evaluations}")
+        print(f"  Word evaluations:   {stats.word_evaluations}")
+
+    changed = [
+        (a, b) for a, b in zip(results[False], results[True])
+        if (a.start_idx, a.end_idx, a.cer) != (b.start_idx, b.end_idx, b.cer)
+    ]
+    print(f"\nAlignments unchanged: {len(segments) - len(changed)}/{len(segments)}")
+    for a, b in changed[:10]:
+        print(f"  {a.asr_segment.text[:40]!r}: ({a.start_idx}, {a.end_idx}, {a.cer:.3f}) -> "
+              f"({b.start_idx}, {b.end_idx}, {b.cer:.3f})")
@@ -0,0 +1,73 @@
+"""
+Synthetic session audio for benchmarks
+
+Generates 16 kHz mono audio that alternates between speech-like bursts
+(modulated tones with noise) and pauses of background noise, so that VAD and
+silence detection have something to find. Real recordings can be passed with
+--audio instead.
+"""
+
+import sys
+import wave
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to sys.path to make package importable
+parent_dir = str(Path(__file__).resolve().parent.parent)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+SAMPLING_RATE = 16000
+
+
+def make_audio(minutes: float = 10.0, seed: int = 0) -> np.ndarray:
+    """Create a synthetic session recording.
+
+    Args:
+        minutes: Length of the recording
+        seed: Random seed
+
+    Returns:
+        Samples in [-1, 1] as float32 array
+    """
+    rng = np.random.default_rng(seed)
+    num_samples = int(minutes * 60 * SAMPLING_RATE)
+    audio = rng.normal(0.0, 0.003, num_samples).astype(np.float32)
+    position = 0
+    while position < num_samples:
+        # Speech bursts of 2 to 15 seconds, pauses of 0.2 to 2 seconds
+        burst = int(rng.uniform(2.0, 15.0) * SAMPLING_RATE)
+        end = min(position + burst, num_samples)
+        t = np.arange(end - position) / SAMPLING_RATE
+        pitch = rng.uniform(100.0, 250.0)
+        envelope = 0.5 + 0.5 * np.sin(2 * np.pi * rng.uniform(3.0, 6.0) * t)  # syllable rate
+        audio[position:end] += (0.2 * envelope * np.sin(2 * np.pi * pitch * t)).astype(np.float32)
+        audio[position:end] += rng.normal(0.0, 0.02, end - position).astype(np.float32)
+        position = end + int(rng.uniform(0.2, 2.0) * SAMPLING_RATE)
+    return np.clip(audio, -1.0, 1.0)
+
+
+def write_wav(path: str, audio: np.ndarray) -> None:
+    """Write samples as 16-bit mono WAV file, like the converted session audio."""
+    with wave.open(str(path), 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(SAMPLING_RATE)
+        wav_file.writeframes(np.clip(audio * 32768.0, -32768, 32767).astype(np.int16).tobytes())
+
+
+def add_audio_arguments(parser) -> None:
+    """Add the options that select a real or synthetic recording."""
+    parser.add_argument("--audio", type=str, default=None, help="Real recording (.wav or .opus)")
+    parser.add_argument("--minutes", type=float, default=10.0, help="Length of the synthetic recording")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+
+
+def audio_path_from_args(args, directory: str) -> str:
+    """Return the real recording, or write the synthetic one into directory."""
+    if args.audio:
+        return args.audio
+    path = str(Path(directory) / "session.wav")
+    write_wav(path, make_audio(args.minutes, seed=args.seed))
+    return path
@@ -0,0 +1,122 @@
+"""
+Synthetic alignment sessions for benchmarks
+
+Generates a long human transcript and noisy ASR segments covering it, including
+unalignable segments (chair announcements, votes) that trigger the aligner's
+fallback searches. Real sessions can be loaded from the pipeline cache instead.
+"""
+
+import random
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# Add parent directory to sys.path to make package importable
+parent_dir = str(Path(__file__).resolve().parent.parent)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from pyannote.core import Segment
+
+from parliament_transcript_aligner.data_models.models import TranscribedSegment
+from parliament_transcript_aligner.utils.io import load_transcribed_segments
+
+_SYLLABLES = ['ka', 'to', 'ri', 'men', 'sa', 'lo', 'pe', 'de', 'vi', 'nor', 'ta', 'us', 'el']
+_CHAIR_WORDS = ['order', 'vote', 'yes', 'no', 'please', 'thank', 'you', 'the', 'floor']
+
+
+def make_session(num_words: int = 30000,
+                 num_segments: int = 1000,
+                 noise: float = 0.08,
+                 junk_rate: float = 0.15,
+                 vocab_size: int = 2000,
+                 words_per_second: float = 2.5,
+                 seed: int = 0) -> Tuple[List[TranscribedSegment], str]:
+    """Create a synthetic session.
+    
+    Args:
+        num_words: Number of words in the human transcript
+        num_segments: Maximum number of spoken ASR segments
+        noise: Probability of an ASR word error (deletion, substitution or insertion)
+        junk_rate: Probability of an unalignable segment after each spoken segment
+        vocab_size: Number of distinct words
+        words_per_second: Speech rate used for the segment timings
+        seed: Random seed
+        
+    Returns:
+        Tuple of (transcribed segments, human transcript)
+    """
+    rnd = random.Random(seed)
+    vocab = [''.join(rnd.choice(_SYLLABLES) for _ in range(rnd.randint(1, 4))) for _ in range(vocab_size)]
+    words = [rnd.choice(vocab) for _ in range(num_words)]
+
+    segments = []
+    pos = 0
+    current_time = 0.0
+    while pos < num_words and len(segments) < num_segments:
+        length = rnd.randint(8, 40)
+        asr_words = []
+        for word in words[pos:pos + length]:
+            r = rnd.random()
+            if r < noise / 3:
+                continue
+            elif r < 2 * noise / 3:
+                asr_words.append(rnd.choice(vocab))
+            elif r < noise:
+                asr_words.extend([word, rnd.choice(vocab)])
+            else:
+                asr_words.append(word)
+        pos += length
+        duration = length / words_per_second
+        segments.append(TranscribedSegment(Segment(current_time, current_time + duration), ' '.join(asr_words)))
+        current_time += duration
+
+        if rnd.random() < junk_rate:
+            junk = ' '.join(rnd.choice(_CHAIR_WORDS) for _ in range(rnd.randint(1, 12)))
+            segments.append(TranscribedSegment(Segment(current_time, current_time + 2.0), junk))
+            current_time += 2.0
+
+    return segments, ' '.join(words)
+
+
+def load_session(segments_path: Optional[str],
+                 transcript_path: Optional[str],
+                 **synthetic_kwargs) -> Tuple[List[TranscribedSegment], str]:
+    """Load a real session from the pipeline cache, or create a synthetic one.
+    
+    Args:
+        segments_path: Path to a cached `<video_id>_segments.pkl` file
+        transcript_path: Path to a preprocessed transcript text file
+        **synthetic_kwargs: Arguments for make_session if no real session is given
+        
+    Returns:
+        Tuple of (transcribed segments, human transcript)
+    """
+    if segments_path and transcript_path:
+        segments = load_transcribed_segments(Path(segments_path))
+        with open(transcript_path, 'r', encoding='utf-8') as f:
+            return segments, f.read()
+    return make_session(**synthetic_kwargs)
+
+
+def add_session_arguments(parser) -> None:
+    """Add the arguments understood by load_session to an argparse parser."""
+    parser.add_argument("--segments", help="Cached segments pickle of a real session")
+    parser.add_argument("--transcript", help="Preprocessed transcript text of a real session")
+    parser.add_argument("--num-words", type=int, default=30000, help="Words in the synthetic transcript")
+    parser.add_argument("--num-segments", type=int, default=1000, help="Spoken segments in the synthetic session")
+    parser.add_argument("--junk-rate", type=float, default=0.15,
+                        help="Probability of an unalignable segment after each spoken segment")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the synthetic session")
+
+
+def session_from_args(args) -> Tuple[List[TranscribedSegment], str]:
+    """Load the session described by the arguments of add_session_arguments."""
+    return load_session(
+        args.segments,
+        args.transcript,
+        num_words=args.num_words,
+        num_segments=args.num_segments,
+        junk_rate=args.junk_rate,
+        seed=args.seed
+    )
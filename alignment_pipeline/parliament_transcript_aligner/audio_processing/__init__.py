@@ -6,12 +6,14 @@ and speaker diarization.
 """
 
 from .segmenter import AudioSegmenter
+from .audio_buffer import load_audio
 from .vad import initialize_vad_pipeline
 from .vad import get_silero_vad
 from .diarization import initialize_diarization_pipeline
 
 __all__ = [
     "AudioSegmenter",
+    "load_audio",
     "initialize_vad_pipeline",
     "initialize_diarization_pipeline",
     "get_silero_vad" 
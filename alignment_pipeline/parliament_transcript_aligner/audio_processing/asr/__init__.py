@@ -0,0 +1,36 @@
+from typing import Optional
+
+from .base import ASRBackend
+from .stub_backend import StubBackend
+
+
+def create_asr_backend(name: str = "hf", device: Optional[str] = None, **config) -> ASRBackend:
+    """Create an ASR backend by name.
+
+    The model backends are imported here, so that the stub works without torch.
+
+    Args:
+        name: "hf" (Whisper through a Hugging Face pipeline, on GPU if available), "int8-cpu" (Whisper with
+            int8-quantized weights on CPU) or "stub" (deterministic stand-in for tests)
+        device: Device of the model, e.g. "cuda:1" (default: chosen by the backend)
+        **config: Arguments of the backend, e.g. language, batch_size, hf_cache_dir
+
+    Returns:
+        The backend
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if name == "hf":
+        from .hf_backend import HFBackend
+        return HFBackend(device=device, **config)
+    if name == "int8-cpu":
+        from .hf_backend import Int8CPUBackend
+        return Int8CPUBackend(device=device, **config)
+    if name == "stub":
+        return StubBackend(device=device, **config)
+    raise ValueError(f"Unknown ASR backend: {name}. Use 'hf', 'int8-cpu' or 'stub'")
+
+
+# Export the classes and factory function
+__all__ = ['ASRBackend', 'StubBackend', 'create_asr_backend']
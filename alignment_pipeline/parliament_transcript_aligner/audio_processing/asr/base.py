@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+import numpy as np
+
+
+class ASRBackend(ABC):
+    """Base interface for speech recognition models."""
+
+    @abstractmethod
+    def transcribe_batch(self, arrays: List[np.ndarray], language: Optional[str] = None) -> List[str]:
+        """Transcribe a batch of segments.
+
+        Args:
+            arrays: Samples of every segment, 16 kHz mono float32 in [-1, 1] (see load_audio)
+            language: Audio language code using ISO 639-1 standard (default: the language of the backend)
+
+        Returns:
+            Text of every segment, stripped of surrounding whitespace
+        """
+        pass
+
+    def close(self) -> None:
+        """Release resources held by the backend, e.g. connections."""
+        pass
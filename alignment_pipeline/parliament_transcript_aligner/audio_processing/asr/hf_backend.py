@@ -0,0 +1,105 @@
+from pathlib import Path
+from typing import List, Optional, Union
+
+import numpy as np
+import torch
+from transformers import pipeline, AutoModelForSpeechSeq2Seq, AutoProcessor
+
+from ..audio_buffer import SAMPLING_RATE
+from .base import ASRBackend
+
+#ASR_MODEL_NAME = "openai/whisper-large-v3"
+#ASR_MODEL_NAME = "distil-whisper/distil-large-v3"
+#ASR_MODEL_NAME = "distil-whisper/distil-large-v3.5" # doesn't support languages other than English unfortunatelly
+ASR_MODEL_NAME = "openai/whisper-large-v3-turbo"
+
+
+class HFBackend(ASRBackend):
+    """Whisper through a Hugging Face ASR pipeline, on GPU if available."""
+
+    def __init__(self,
+                 device: Optional[str] = None,
+                 language: str = "en",
+                 batch_size: int = 1,
+                 hf_cache_dir: Optional[Union[Path, str]] = None,
+                 model_name: str = ASR_MODEL_NAME):
+        """Load the model.
+
+        Args:
+            device: Device of the model, e.g. "cuda:1" or "cpu" (default: "cuda" if available, otherwise "cpu")
+            language: Default audio language code using ISO 639-1 standard
+            batch_size: Number of segments the pipeline processes at once
+            hf_cache_dir: Optional directory for Hugging Face cache
+            model_name: Hugging Face model
+        """
+        if device is None:
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.device = device
+        self.language = language
+
+        # Load the model and processor with cache_dir
+        model = self._load_model(model_name, hf_cache_dir)
+        processor = AutoProcessor.from_pretrained(
+            model_name,
+            cache_dir=hf_cache_dir
+        )
+
+        # Create the pipeline using the loaded model and processor
+        self.asr_pipeline = pipeline(
+            "automatic-speech-recognition",
+            model=model,
+            tokenizer=processor.tokenizer,
+            feature_extractor=processor.feature_extractor,
+            generate_kwargs={"language": language},
+            batch_size=batch_size
+        )
+
+    def _load_model(self, model_name: str, hf_cache_dir: Optional[Union[Path, str]]):
+        return AutoModelForSpeechSeq2Seq.from_pretrained(
+            model_name,
+            #torch_dtype=torch.float16,
+            low_cpu_mem_usage=True,
+            #attn_implementation="flash_attention_2",
+            cache_dir=hf_cache_dir,
+            device_map=self.device
+        )
+
+    def transcribe_batch(self, arrays: List[np.ndarray], language: Optional[str] = None) -> List[str]:
+        results = self.asr_pipeline(
+            [{"raw": array, "sampling_rate": SAMPLING_RATE} for array in arrays],
+            batch_size=len(arrays),
+            return_timestamps=False,  # Faster than word-level timestamps
+            generate_kwargs={"language": language or self.language}
+        )
+        return [result["text"].strip() for result in results]
+
+
+class Int8CPUBackend(HFBackend):
+    """Whisper on CPU with int8 weights (torch dynamic quantization of the linear layers).
+
+    Uses about a quarter of the memory of the fp32 model and is usually 1.5 to 3
+    times faster on CPU, so alignment can run on CPU-only partitions. The
+    quantization changes the transcripts slightly; check the CER of a few
+    sessions against the HFBackend before switching.
+    """
+
+    def __init__(self, device: Optional[str] = None, num_threads: Optional[int] = None, **kwargs):
+        """Load and quantize the model.
+
+        Args:
+            device: Ignored, the quantized model only runs on CPU
+            num_threads: Number of CPU threads (torch.set_num_threads, default: torch default)
+            **kwargs: Arguments of HFBackend (language, batch_size, hf_cache_dir, model_name)
+        """
+        if num_threads:
+            torch.set_num_threads(num_threads)
+        super().__init__(device="cpu", **kwargs)
+
+    def _load_model(self, model_name: str, hf_cache_dir: Optional[Union[Path, str]]):
+        model = AutoModelForSpeechSeq2Seq.from_pretrained(
+            model_name,
+            torch_dtype=torch.float32,
+            low_cpu_mem_usage=True,
+            cache_dir=hf_cache_dir
+        )
+        return torch.quantization.quantize_dynamic(model.eval(), {torch.nn.Linear}, dtype=torch.qint8)
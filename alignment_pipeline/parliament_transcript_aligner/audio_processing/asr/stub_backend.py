@@ -0,0 +1,43 @@
+import hashlib
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from .base import ASRBackend
+
+
+class StubBackend(ASRBackend):
+    """Deterministic stand-in for tests and benchmarks, without torch or a model.
+
+    The text of a segment is derived from its samples (one pseudo-word per
+    second of audio), so equal audio always gives equal text and different
+    backends, processes or servers can be checked against each other. Optionally
+    burns CPU time in proportion to the audio length to simulate a model.
+    """
+
+    def __init__(self, device: Optional[str] = None, language: str = "en",
+                 seconds_per_audio_second: float = 0.0, **kwargs):
+        """Initialize the stub.
+
+        Args:
+            device: Ignored
+            language: Default language, part of the text
+            seconds_per_audio_second: CPU time spent per second of audio (0.1 simulates a real-time factor of 0.1)
+            **kwargs: Ignored, so that the stub accepts the arguments of the other backends
+        """
+        self.language = language
+        self.seconds_per_audio_second = seconds_per_audio_second
+
+    def transcribe_batch(self, arrays: List[np.ndarray], language: Optional[str] = None) -> List[str]:
+        texts = []
+        for array in arrays:
+            array = np.asarray(array, dtype=np.float32)
+            deadline = time.process_time() + self.seconds_per_audio_second * len(array) / 16000
+            while len(array) and time.process_time() < deadline:
+                np.abs(np.fft.rfft(array[:16000]))
+            digest = hashlib.sha1(array.tobytes()).hexdigest()
+            num_words = max(1, int(round(len(array) / 16000)))
+            words = [digest[(i * 4) % 36:(i * 4) % 36 + 4] for i in range(num_words)]
+            texts.append(f"{language or self.language} " + " ".join(words))
+        return texts
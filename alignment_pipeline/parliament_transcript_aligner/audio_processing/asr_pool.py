@@ -0,0 +1,185 @@
+import multiprocessing
+import os
+import queue
+import time
+import traceback
+from multiprocessing import shared_memory
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .asr import ASRBackend
+from .audio_buffer import SAMPLING_RATE, audio_slice
+
+
+def _asr_worker(backend_factory: Callable[[str], ASRBackend],
+                device: str,
+                threads: Optional[int],
+                tasks: multiprocessing.Queue,
+                results: multiprocessing.Queue) -> None:
+    """Create a backend and transcribe batches of the shared session audio until a None task arrives."""
+    try:
+        if threads:
+            os.environ["OMP_NUM_THREADS"] = str(threads)
+            try:
+                import torch
+                torch.set_num_threads(threads)
+            except ImportError:
+                pass
+        backend = backend_factory(device)
+    except Exception:
+        results.put(("error", None, None, traceback.format_exc(), 0.0))
+        return
+    results.put(("ready", None, None, device, 0.0))
+
+    block, block_name = None, None
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        session, name, num_samples, sampling_rate, language, number, ranges = task
+        try:
+            if name != block_name:
+                if block is not None:
+                    block.close()
+                # The workers share the resource tracker of the parent, which owns and unlinks the block
+                block, block_name = shared_memory.SharedMemory(name=name), name
+            audio = np.ndarray((num_samples,), dtype=np.float32, buffer=block.buf)
+            start = time.perf_counter()
+            texts = backend.transcribe_batch([audio_slice(audio, segment_start, segment_end, sampling_rate)
+                                              for segment_start, segment_end in ranges], language)
+            del audio
+            results.put(("done", session, number, texts, time.perf_counter() - start))
+        except Exception:
+            results.put(("error", session, number, traceback.format_exc(), 0.0))
+    if block is not None:
+        block.close()
+    backend.close()
+
+
+class ASRWorkerPool:
+    """Transcribes batches of a session in several processes, each with its own ASR backend.
+
+    The decoded session audio is copied once into shared memory, which every
+    worker maps without copying; only the time ranges of the segments of a batch
+    are sent through the task queue, and only the texts come back. The workers
+    are started (and their models loaded) once and reused for every session.
+
+    Example:
+        with ASRWorkerPool(partial(create_asr_backend, "hf", language="de"), ["cuda:0", "cuda:1"]) as pool:
+            for number, texts, wall_time in pool.transcribe(audio, batches, "de"):
+                ...
+    """
+
+    def __init__(self,
+                 backend_factory: Callable[[str], ASRBackend],
+                 devices: Sequence[str],
+                 threads_per_worker: Optional[int] = None,
+                 sampling_rate: int = SAMPLING_RATE):
+        """Start one worker per device and wait until all models are loaded.
+
+        Args:
+            backend_factory: Picklable function (e.g. functools.partial of create_asr_backend) that creates
+                the ASRBackend of a worker from its device
+            devices: Device of every worker, e.g. ["cuda:0", "cuda:1"], or ["cpu"] * 4 for CPU workers
+            threads_per_worker: Number of CPU threads of every worker (torch.set_num_threads), e.g. the number of
+                cores divided by the number of CPU workers (default: library default)
+            sampling_rate: Sampling rate of the session audio in Hz
+        """
+        if not devices:
+            raise ValueError("ASRWorkerPool requires at least one device")
+        self.devices = list(devices)
+        self.sampling_rate = sampling_rate
+        self._session = 0
+        # Spawned, not forked: CUDA cannot be initialized in forked processes
+        context = multiprocessing.get_context("spawn")
+        self._tasks = context.Queue()
+        self._results = context.Queue()
+        self._workers = [
+            context.Process(target=_asr_worker,
+                            args=(backend_factory, device, threads_per_worker, self._tasks, self._results),
+                            daemon=True)
+            for device in self.devices
+        ]
+        for worker in self._workers:
+            worker.start()
+        try:
+            for _ in self._workers:
+                kind, _, _, payload, _ = self._next_result()
+                if kind == "error":
+                    raise RuntimeError(f"Failed to create the ASR backend in a worker:\n{payload}")
+        except BaseException:
+            self.close()
+            raise
+        print(f"Started {len(self._workers)} ASR workers on {', '.join(self.devices)}")
+
+    def _next_result(self) -> Tuple[str, Optional[int], Optional[int], Any, float]:
+        while True:
+            try:
+                return self._results.get(timeout=1.0)
+            except queue.Empty:
+                if not all(worker.is_alive() for worker in self._workers):
+                    raise RuntimeError("An ASR worker exited unexpectedly")
+
+    def transcribe(self, audio: np.ndarray, batches: Sequence[Sequence[Tuple[float, float]]],
+                   language: Optional[str] = None) -> Iterator[Tuple[int, List[str], float]]:
+        """Transcribe batches of segments of a session.
+
+        Args:
+            audio: Decoded mono float32 samples of the session (see load_audio)
+            batches: Batches as lists of (start, end) times of segments in seconds
+            language: Audio language code (default: the language of the backends)
+
+        Yields:
+            Tuples of (index of the batch, texts of its segments, wall time of the batch in the worker),
+            in the order in which the batches finish
+        """
+        self._session += 1
+        session = self._session
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        block = shared_memory.SharedMemory(create=True, size=max(audio.nbytes, 1))
+        remaining = len(batches)
+        try:
+            np.ndarray(audio.shape, dtype=np.float32, buffer=block.buf)[:] = audio
+            for number, ranges in enumerate(batches):
+                self._tasks.put((session, block.name, len(audio), self.sampling_rate, language, number, list(ranges)))
+
+            while remaining:
+                kind, result_session, number, payload, wall_time = self._next_result()
+                if result_session != session:
+                    # Left over from a session that was aborted
+                    continue
+                if kind == "error":
+                    raise RuntimeError(f"ASR worker failed on batch {number}:\n{payload}")
+                remaining -= 1
+                yield number, payload, wall_time
+        finally:
+            if remaining:
+                self._drain_tasks()
+            block.close()
+            block.unlink()
+
+    def _drain_tasks(self) -> None:
+        """Drop the tasks of an aborted session that no worker has taken yet."""
+        try:
+            while True:
+                self._tasks.get_nowait()
+        except queue.Empty:
+            pass
+
+    def close(self) -> None:
+        """Stop the workers."""
+        for worker in self._workers:
+            if worker.is_alive():
+                self._tasks.put(None)
+        for worker in self._workers:
+            worker.join(timeout=10)
+            if worker.is_alive():
+                worker.terminate()
+        self._workers = []
+
+    def __enter__(self) -> "ASRWorkerPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
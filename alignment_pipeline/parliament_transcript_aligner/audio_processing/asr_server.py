@@ -0,0 +1,269 @@
+"""
+Local ASR inference server
+
+One process owns the ASR model and transcribes segments for many pipeline
+processes on the same node, batching segments of different clients together.
+Start it with
+
+    python -m parliament_transcript_aligner.audio_processing.asr_server --address /tmp/asr.sock
+
+and point the pipelines at it with AudioSegmenter(asr_server_address="/tmp/asr.sock")
+(or AlignmentPipeline(asr_server_address=...)). Messages are pickled, so only
+trusted local clients may connect: use a Unix socket (protected by file
+permissions) or set ASR_SERVER_AUTHKEY for both server and clients.
+"""
+
+import argparse
+import os
+import queue
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from multiprocessing.connection import Client, Connection, Listener
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from .asr import ASRBackend, create_asr_backend
+from .audio_buffer import SAMPLING_RATE
+from .batching import BatchStats, summarize_batches
+
+Address = Union[str, Tuple[str, int]]
+
+
+def parse_address(address: str) -> Address:
+    """Parse "host:port" into a TCP address, anything else is the path of a Unix socket."""
+    host, separator, port = address.rpartition(":")
+    if separator and not address.startswith("/") and port.isdigit():
+        return (host or "localhost", int(port))
+    return address
+
+
+def _authkey(authkey: Optional[bytes]) -> Optional[bytes]:
+    if authkey is None and os.getenv("ASR_SERVER_AUTHKEY"):
+        return os.getenv("ASR_SERVER_AUTHKEY").encode()
+    return authkey
+
+
+class _Request:
+    """Segments sent by a client in one call, answered once all of them are transcribed."""
+
+    def __init__(self, connection: Connection, send_lock: threading.Lock, request_id: int, num_segments: int):
+        self.connection = connection
+        self.send_lock = send_lock
+        self.request_id = request_id
+        self.texts: List[Optional[str]] = [None] * num_segments
+        self.remaining = num_segments
+        self.failed = False
+
+    def reply(self, message: Tuple) -> None:
+        try:
+            with self.send_lock:
+                self.connection.send(message)
+        except OSError:
+            pass  # The client has gone away
+
+    def set_text(self, index: int, text: str) -> None:
+        self.texts[index] = text
+        self.remaining -= 1
+        if self.remaining == 0 and not self.failed:
+            self.reply(("ok", self.request_id, self.texts))
+
+    def fail(self, error: str) -> None:
+        if not self.failed:
+            self.failed = True
+            self.reply(("error", self.request_id, error))
+
+
+@dataclass
+class _Item:
+    request: _Request
+    index: int
+    audio: np.ndarray
+    language: Optional[str]
+
+    @property
+    def duration(self) -> float:
+        return len(self.audio) / SAMPLING_RATE
+
+
+class ASRServer:
+    """Serves an ASR backend to local clients and batches their segments together.
+
+    A thread per client queues the segments of its requests. One batching thread
+    takes the oldest segment, waits at most max_wait seconds for more (of any
+    client, in the same language) until the batch is full, runs the backend on the
+    batch and answers every request whose segments are all transcribed. A batch
+    that fails is retried request by request, so that the error only reaches the
+    client whose segments caused it.
+    """
+
+    def __init__(self,
+                 backend: ASRBackend,
+                 address: Address,
+                 authkey: Optional[bytes] = None,
+                 max_batch_size: int = 16,
+                 max_batch_seconds: Optional[float] = None,
+                 max_wait: float = 0.05):
+        """Initialize the server and start listening.
+
+        Args:
+            backend: ASR backend that owns the model (see create_asr_backend)
+            address: Path of a Unix socket, or (host, port) on localhost
+            authkey: Key that clients must know (default: ASR_SERVER_AUTHKEY environment variable, if set)
+            max_batch_size: Maximum number of segments per batch
+            max_batch_seconds: Maximum padded audio seconds per batch (segments x longest segment, see plan_batches)
+            max_wait: Latency budget in seconds: how long the first segment of a batch waits for more segments
+        """
+        self.backend = backend
+        self.max_batch_size = max_batch_size
+        self.max_batch_seconds = max_batch_seconds
+        self.max_wait = max_wait
+        self.batch_stats: List[BatchStats] = []
+        self.batch_clients: List[int] = []
+        self._pending: "queue.Queue[_Item]" = queue.Queue()
+        self._closed = threading.Event()
+        authkey = _authkey(authkey)
+        if isinstance(address, tuple) and authkey is None:
+            print("Warning: ASR server on TCP without authkey, any local process can connect")
+        self.listener = Listener(address, authkey=authkey)
+        self.address = self.listener.address
+
+    def serve_forever(self) -> None:
+        """Accept clients until close() is called."""
+        threading.Thread(target=self._batch_loop, daemon=True).start()
+        print(f"ASR server listening on {self.address}")
+        while not self._closed.is_set():
+            try:
+                connection = self.listener.accept()
+            except (OSError, EOFError):
+                if self._closed.is_set():
+                    break
+                continue  # e.g. a client with a wrong authkey
+            threading.Thread(target=self._serve_client, args=(connection,), daemon=True).start()
+
+    def close(self) -> None:
+        """Stop accepting clients (requests in progress are still answered)."""
+        self._closed.set()
+        self.listener.close()
+        print(summarize_batches(self.batch_stats))
+
+    def _serve_client(self, connection: Connection) -> None:
+        send_lock = threading.Lock()
+        try:
+            while True:
+                request_id, segments, language = connection.recv()
+                request = _Request(connection, send_lock, request_id, len(segments))
+                if not segments:
+                    request.reply(("ok", request_id, []))
+                for index, audio in enumerate(segments):
+                    self._pending.put(_Item(request, index, audio, language))
+        except (EOFError, OSError):
+            pass
+        finally:
+            connection.close()
+
+    def _batch_loop(self) -> None:
+        carried = None
+        while True:
+            first = carried if carried is not None else self._pending.get()
+            carried = None
+            batch = [first]
+            longest = first.duration
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._pending.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                padded_seconds = (len(batch) + 1) * max(longest, item.duration)
+                if item.language != first.language or (self.max_batch_seconds and padded_seconds > self.max_batch_seconds):
+                    carried = item
+                    break
+                batch.append(item)
+                longest = max(longest, item.duration)
+            self._run_batch(batch)
+
+    def _run_batch(self, batch: List[_Item]) -> None:
+        start = time.perf_counter()
+        try:
+            texts = self.backend.transcribe_batch([item.audio for item in batch], batch[0].language)
+        except Exception:
+            error = traceback.format_exc()
+            requests = {}
+            for item in batch:
+                requests.setdefault(id(item.request), []).append(item)
+            if len(requests) > 1:
+                # Retry the requests one by one, so that only the request with the bad segment fails
+                print(f"Error transcribing a batch of {len(batch)} segments of {len(requests)} requests, "
+                      f"retrying them separately")
+                for items in requests.values():
+                    self._run_batch(items)
+                return
+            print(f"Error transcribing a batch of {len(batch)} segments: {error}")
+            for item in batch:
+                item.request.fail(error)
+            return
+        self.batch_stats.append(BatchStats.from_durations([item.duration for item in batch], time.perf_counter() - start))
+        self.batch_clients.append(len({id(item.request.connection) for item in batch}))
+        for item, text in zip(batch, texts):
+            item.request.set_text(item.index, text)
+
+
+class ASRClient(ASRBackend):
+    """ASR backend that sends the segments to an ASRServer."""
+
+    def __init__(self, address: Address, authkey: Optional[bytes] = None):
+        """Connect to a server.
+
+        Args:
+            address: Path of the Unix socket of the server, or (host, port)
+            authkey: Key of the server (default: ASR_SERVER_AUTHKEY environment variable, if set)
+        """
+        self.address = address
+        self._connection = Client(address, authkey=_authkey(authkey))
+        self._lock = threading.Lock()
+        self._next_request_id = 0
+
+    def transcribe_batch(self, arrays: List[np.ndarray], language: Optional[str] = None) -> List[str]:
+        segments = [np.ascontiguousarray(array, dtype=np.float32) for array in arrays]
+        with self._lock:
+            self._next_request_id += 1
+            self._connection.send((self._next_request_id, segments, language))
+            status, _, payload = self._connection.recv()
+        if status == "error":
+            raise RuntimeError(f"ASR server failed to transcribe the segments:\n{payload}")
+        return payload
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the Whisper ASR model to local alignment pipelines")
+    parser.add_argument("--address", default="/tmp/asr.sock", help="Unix socket path or host:port")
+    parser.add_argument("--language", default="en", help="Default audio language of the model")
+    parser.add_argument("--backend", default="hf", choices=["hf", "int8-cpu", "stub"], help="ASR backend")
+    parser.add_argument("--device", default=None, help="Device of the model (default: cuda if available)")
+    parser.add_argument("--hf-cache-dir", default=os.getenv("HF_CACHE_DIR"), help="Hugging Face cache directory")
+    parser.add_argument("--max-batch-size", type=int, default=16, help="Maximum segments per batch")
+    parser.add_argument("--max-batch-seconds", type=float, default=None, help="Maximum padded audio seconds per batch")
+    parser.add_argument("--max-wait-ms", type=float, default=50.0, help="Latency budget for filling a batch")
+    args = parser.parse_args()
+
+    server = ASRServer(
+        create_asr_backend(args.backend, args.device, language=args.language, batch_size=args.max_batch_size,
+                           hf_cache_dir=args.hf_cache_dir),
+        parse_address(args.address),
+        max_batch_size=args.max_batch_size,
+        max_batch_seconds=args.max_batch_seconds,
+        max_wait=args.max_wait_ms / 1000
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.close()
@@ -0,0 +1,153 @@
+import subprocess
+import tempfile
+import wave
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from pydub import AudioSegment
+
+SAMPLING_RATE = 16000
+
+
+def _is_pcm16_wav(audio_path: str, sampling_rate: int) -> bool:
+    """Check whether a file is a 16-bit mono WAV at the sampling rate, which can be read without ffmpeg."""
+    if not str(audio_path).endswith('.wav'):
+        return False
+    try:
+        with wave.open(str(audio_path), 'rb') as wav_file:
+            return (wav_file.getnchannels() == 1 and wav_file.getsampwidth() == 2
+                    and wav_file.getframerate() == sampling_rate)
+    except (wave.Error, EOFError):
+        return False
+
+
+def _pcm16_to_float32(frames: bytes) -> np.ndarray:
+    return np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+def _ffmpeg_command(audio_path: str, sampling_rate: int, start: Optional[float] = None,
+                    duration: Optional[float] = None) -> List[str]:
+    cmd = ['ffmpeg', '-nostdin', '-v', 'error']
+    if start is not None:
+        cmd += ['-ss', str(start)]
+    cmd += ['-i', str(audio_path)]
+    if duration is not None:
+        cmd += ['-t', str(duration)]
+    return cmd + ['-f', 'f32le', '-ac', '1', '-ar', str(sampling_rate), '-']
+
+
+def _ffmpeg_decode(cmd: List[str], audio_path: str) -> np.ndarray:
+    try:
+        output = subprocess.run(cmd, capture_output=True, check=True).stdout
+    except (subprocess.SubprocessError, OSError) as e:
+        raise ValueError(f"Error decoding audio file {audio_path}: {e}")
+    # bytearray, so that the buffer is writable (torch.from_numpy warns on read-only arrays)
+    return np.frombuffer(bytearray(output), dtype=np.float32)
+
+
+def load_audio(audio_path: str, sampling_rate: int = SAMPLING_RATE) -> np.ndarray:
+    """Decode an audio file once into a mono float32 buffer.
+
+    16-bit mono WAV files at the requested sampling rate (as written by
+    AudioSegmenter.convert_audio_to_wav) are read directly, anything else is
+    decoded and resampled by ffmpeg into a pipe, without temporary files.
+
+    Args:
+        audio_path: Path to audio file
+        sampling_rate: Sampling rate of the buffer in Hz
+
+    Returns:
+        Samples in [-1, 1] as float32 array
+    """
+    if _is_pcm16_wav(audio_path, sampling_rate):
+        with wave.open(str(audio_path), 'rb') as wav_file:
+            return _pcm16_to_float32(wav_file.readframes(wav_file.getnframes()))
+    return _ffmpeg_decode(_ffmpeg_command(audio_path, sampling_rate), audio_path)
+
+
+def wav_duration(audio_path: str, sampling_rate: int = SAMPLING_RATE) -> Optional[float]:
+    """Read the duration in seconds of a 16-bit mono WAV file from its header, None for other files."""
+    if not _is_pcm16_wav(audio_path, sampling_rate):
+        return None
+    with wave.open(str(audio_path), 'rb') as wav_file:
+        return wav_file.getnframes() / sampling_rate
+
+
+def load_audio_segment(audio_path: str, start: float, end: float, sampling_rate: int = SAMPLING_RATE) -> np.ndarray:
+    """Decode only the samples between two times in seconds, without decoding the whole file.
+
+    Args:
+        audio_path: Path to audio file
+        start: Start time in seconds
+        end: End time in seconds
+        sampling_rate: Sampling rate of the samples in Hz
+
+    Returns:
+        Samples in [-1, 1] as float32 array
+    """
+    if _is_pcm16_wav(audio_path, sampling_rate):
+        with wave.open(str(audio_path), 'rb') as wav_file:
+            first = min(max(int(round(start * sampling_rate)), 0), wav_file.getnframes())
+            wav_file.setpos(first)
+            return _pcm16_to_float32(wav_file.readframes(max(int(round(end * sampling_rate)) - first, 0)))
+    return _ffmpeg_decode(_ffmpeg_command(audio_path, sampling_rate, start=start, duration=end - start), audio_path)
+
+
+def iter_audio_chunks(audio_path: str, chunk_seconds: float = 30.0,
+                      sampling_rate: int = SAMPLING_RATE) -> Iterator[np.ndarray]:
+    """Decode an audio file in consecutive chunks, so that only one chunk is in memory.
+
+    Args:
+        audio_path: Path to audio file
+        chunk_seconds: Length of the chunks in seconds (the last one may be shorter)
+        sampling_rate: Sampling rate of the chunks in Hz
+
+    Yields:
+        Samples in [-1, 1] as float32 arrays
+    """
+    chunk_samples = int(chunk_seconds * sampling_rate)
+    if _is_pcm16_wav(audio_path, sampling_rate):
+        with wave.open(str(audio_path), 'rb') as wav_file:
+            while True:
+                frames = wav_file.readframes(chunk_samples)
+                if not frames:
+                    return
+                yield _pcm16_to_float32(frames)
+
+    # stderr goes to a file: a pipe that is only read at the end would block ffmpeg once its buffer is full
+    with tempfile.TemporaryFile() as stderr:
+        process = subprocess.Popen(_ffmpeg_command(audio_path, sampling_rate),
+                                   stdout=subprocess.PIPE, stderr=stderr)
+        try:
+            while True:
+                data = process.stdout.read(chunk_samples * 4)  # 4 bytes per float32 sample
+                if not data:
+                    break
+                yield np.frombuffer(data, dtype=np.float32)
+        finally:
+            process.stdout.close()
+            if process.poll() is None:
+                process.kill()
+            process.wait()
+        if process.returncode != 0:
+            stderr.seek(0)
+            raise ValueError(f"Error decoding audio file {audio_path}: {stderr.read().decode(errors='replace').strip()}")
+
+
+def audio_slice(audio: np.ndarray, start: float, end: float, sampling_rate: int = SAMPLING_RATE) -> np.ndarray:
+    """Get the samples between two times in seconds (a view, not a copy)."""
+    return audio[max(int(round(start * sampling_rate)), 0):int(round(end * sampling_rate))]
+
+
+def asr_input(audio: np.ndarray, start: float, end: float, sampling_rate: int = SAMPLING_RATE) -> Dict[str, Any]:
+    """Build the input of a Hugging Face ASR pipeline for a segment of the buffer."""
+    return {"raw": audio_slice(audio, start, end, sampling_rate), "sampling_rate": sampling_rate}
+
+
+def to_audio_segment(audio: np.ndarray, sampling_rate: int = SAMPLING_RATE) -> "AudioSegment":
+    """Convert the buffer into a 16-bit pydub AudioSegment, e.g. for silence detection."""
+    from pydub import AudioSegment
+    samples = np.clip(audio * 32768.0, -32768, 32767).astype(np.int16)
+    return AudioSegment(data=samples.tobytes(), sample_width=2, frame_rate=sampling_rate, channels=1)
@@ -0,0 +1,89 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+
+@dataclass
+class BatchStats:
+    """Measurements of one ASR batch."""
+    num_segments: int
+    audio_seconds: float
+    padded_seconds: float
+    wall_time: float
+
+    @classmethod
+    def from_durations(cls, durations: Sequence[float], wall_time: float) -> "BatchStats":
+        """Measure a batch of segments, which are padded to the longest segment of the batch."""
+        return cls(len(durations), sum(durations), len(durations) * max(durations), wall_time)
+
+    @property
+    def padding_waste(self) -> float:
+        """Share of the padded batch that is padding."""
+        return 1.0 - self.audio_seconds / self.padded_seconds if self.padded_seconds else 0.0
+
+    @property
+    def segments_per_second(self) -> float:
+        return self.num_segments / self.wall_time if self.wall_time else 0.0
+
+
+def fixed_batches(num_segments: int, batch_size: int) -> List[List[int]]:
+    """Batch consecutive segments, batch_size at a time (in temporal order)."""
+    return [list(range(i, min(i + batch_size, num_segments))) for i in range(0, num_segments, batch_size)]
+
+
+def plan_batches(durations: Sequence[float],
+                 max_batch_seconds: float,
+                 max_batch_size: Optional[int] = None,
+                 bucket_width: float = 2.0) -> List[List[int]]:
+    """Group segments of similar duration into batches under an audio-seconds budget.
+
+    Segments are put into buckets of bucket_width seconds by their duration, and
+    each bucket is cut into batches (in temporal order within the bucket) whose
+    padded length, i.e. number of segments times the longest segment, stays within
+    max_batch_seconds. Short segments are thus batched many at a time and long ones
+    few at a time, and segments padded to a much longer neighbour are avoided.
+    A segment longer than the budget gets a batch of its own.
+
+    Args:
+        durations: Durations of the segments in seconds
+        max_batch_seconds: Maximum padded audio seconds per batch
+        max_batch_size: Maximum number of segments per batch (default: no limit)
+        bucket_width: Width of the duration buckets in seconds
+
+    Returns:
+        Batches as lists of segment indices, ordered by their first segment, so that
+        the segments at the start of the recording are transcribed first
+    """
+    buckets = defaultdict(list)
+    for index, duration in enumerate(durations):
+        buckets[int(duration // bucket_width)].append(index)
+
+    batches = []
+    for indices in buckets.values():
+        batch, longest = [], 0.0
+        for index in indices:
+            padded_seconds = (len(batch) + 1) * max(longest, durations[index])
+            if batch and (padded_seconds > max_batch_seconds or (max_batch_size and len(batch) >= max_batch_size)):
+                batches.append(batch)
+                batch, longest = [], 0.0
+            batch.append(index)
+            longest = max(longest, durations[index])
+        if batch:
+            batches.append(batch)
+    return sorted(batches, key=lambda batch: batch[0])
+
+
+def summarize_batches(stats: List[BatchStats]) -> str:
+    """Summarize the batches of a recording, e.g. to tune the batch budget for a GPU type."""
+    if not stats:
+        return "No ASR batches"
+    num_segments = sum(batch.num_segments for batch in stats)
+    audio_seconds = sum(batch.audio_seconds for batch in stats)
+    padded_seconds = sum(batch.padded_seconds for batch in stats)
+    wall_time = sum(batch.wall_time for batch in stats)
+    rates = sorted(batch.segments_per_second for batch in stats)
+    return (f"ASR batches: {len(stats)}, {num_segments / len(stats):.1f} segments per batch, "
+            f"padding waste {1.0 - audio_seconds / padded_seconds if padded_seconds else 0.0:.1%}, "
+            f"{num_segments / wall_time if wall_time else 0.0:.2f} segments/s "
+            f"(per batch: min {rates[0]:.2f}, median {rates[len(rates) // 2]:.2f}, max {rates[-1]:.2f}), "
+            f"{audio_seconds / wall_time if wall_time else 0.0:.1f}x real time")
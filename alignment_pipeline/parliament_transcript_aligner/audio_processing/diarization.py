@@ -1,15 +1,19 @@
 import os
-import torch
-from pyannote.audio import Pipeline
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from pathlib import Path
 
-def initialize_diarization_pipeline(hf_cache_dir: Optional[Path] = None, hf_token: Optional[str] = None) -> Pipeline:
+if TYPE_CHECKING:
+    from pyannote.audio import Pipeline
+
+def initialize_diarization_pipeline(hf_cache_dir: Optional[Path] = None, hf_token: Optional[str] = None) -> "Pipeline":
     """Initialize the pyannote diarization pipeline.
     
     Returns:
         Configured diarization pipeline
     """
+    import torch
+    from pyannote.audio import Pipeline
+
     hf_token = hf_token if hf_token is not None else os.getenv("HF_AUTH_TOKEN")
     cache_dir = hf_cache_dir if hf_cache_dir is not None else os.getenv("HF_CACHE_DIR")
     
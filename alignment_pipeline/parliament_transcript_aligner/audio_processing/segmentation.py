@@ -0,0 +1,302 @@
+from math import gcd
+from typing import Callable, Optional, Union
+
+import numpy as np
+from pyannote.core import Annotation, Segment, Timeline
+
+from .audio_buffer import SAMPLING_RATE
+
+
+class SilenceIndex:
+    """Answers longest-silence queries over non-speech regions in O(log n).
+    
+    The regions are kept as sorted NumPy arrays of starts and ends. The regions
+    overlapping a window are found by binary search, and the longest region
+    strictly inside the window is taken from a sparse table of range maxima
+    over the durations; only the first and last region have to be clipped to
+    the window. Gives the same result as cropping the Timeline to the window.
+    """
+    
+    def __init__(self, regions: Timeline):
+        """Build the index.
+        
+        Args:
+            regions: Non-speech regions (not overlapping each other, as returned by the VAD)
+        """
+        segments = list(regions)
+        self.starts = np.array([segment.start for segment in segments], dtype=np.float64)
+        self.ends = np.array([segment.end for segment in segments], dtype=np.float64)
+        if np.any(self.starts[1:] < self.ends[:-1]):
+            raise ValueError("SilenceIndex requires non-overlapping regions")
+        self.durations = self.ends - self.starts
+        
+        # table[k][i] is the index of the first longest region among regions i to i + 2**k - 1
+        self._table = [np.arange(len(segments))]
+        width = 1
+        while 2 * width <= len(segments):
+            previous = self._table[-1]
+            left, right = previous[:-width], previous[width:]
+            self._table.append(np.where(self.durations[right] > self.durations[left], right, left))
+            width *= 2
+    
+    def __len__(self) -> int:
+        return len(self.starts)
+    
+    def extent(self) -> Segment:
+        """Get the segment from the start of the first to the end of the last region."""
+        if not len(self):
+            return Segment(0.0, 0.0)
+        return Segment(float(self.starts[0]), float(self.ends[-1]))
+    
+    def _range_max(self, first: int, last: int) -> int:
+        """Get the index of the first longest region among regions first to last - 1."""
+        level = (last - first).bit_length() - 1
+        left = self._table[level][first]
+        right = self._table[level][last - (1 << level)]
+        return int(right) if self.durations[right] > self.durations[left] else int(left)
+    
+    def longest(self, start: float, end: float) -> Optional[Segment]:
+        """Get the longest silence in a window, clipped to the window.
+        
+        Args:
+            start: Start time of window to search in
+            end: End time of window to search in
+            
+        Returns:
+            The longest silence segment in the window (the first one if several are equally
+            long), or None if no silence found
+        """
+        if not Segment(start, end):
+            return None
+        first = int(np.searchsorted(self.ends, start, side='right'))
+        last = int(np.searchsorted(self.starts, end, side='left'))
+        if first >= last:
+            return None
+        
+        best = None
+        clipped = Segment(max(float(self.starts[first]), start), min(float(self.ends[first]), end))
+        if clipped:
+            best = clipped
+        if last - first > 2:
+            inner = self._range_max(first + 1, last - 1)
+            if best is None or self.durations[inner] > best.duration:
+                best = Segment(float(self.starts[inner]), float(self.ends[inner]))
+        if last - first > 1:
+            clipped = Segment(max(float(self.starts[last - 1]), start), min(float(self.ends[last - 1]), end))
+            if clipped and (best is None or clipped.duration > best.duration):
+                best = clipped
+        return best
+
+
+def _block_energies(audio: np.ndarray, block_samples: int) -> np.ndarray:
+    """Get the sum of squared samples of consecutive blocks (a trailing partial block is dropped)."""
+    blocks = audio[:len(audio) // block_samples * block_samples].reshape(-1, block_samples)
+    return np.einsum('ij,ij->i', blocks, blocks, dtype=np.float64)
+
+
+def _levels(cumulative: np.ndarray, first: np.ndarray, last: np.ndarray, block_samples: int) -> np.ndarray:
+    """Get the RMS level in dB (re full scale) of the blocks first to last - 1 from the cumulative block energies."""
+    mean_square = (cumulative[last] - cumulative[first]) / ((last - first) * block_samples)
+    return 10 * np.log10(np.maximum(mean_square, 1e-20))
+
+
+def detect_energy_silences(audio: np.ndarray,
+                           min_silence_len: int = 200,
+                           seek_step: int = 15,
+                           frame_len: int = 100,
+                           percentile: float = 15.0,
+                           sampling_rate: int = SAMPLING_RATE) -> Timeline:
+    """Detect silences as runs of low RMS level, like pydub.silence.detect_silence.
+    
+    The threshold is the given percentile of the levels of consecutive frames of
+    the recording, so it adapts to the loudness of the recording (no normalization
+    needed). A window of min_silence_len is silent if its level is at most the
+    threshold; windows are tried every seek_step and silent windows that overlap or
+    touch are merged into one silence. Energies are computed once for short blocks
+    of the buffer, so all levels come from one vectorized pass over the samples.
+    
+    Args:
+        audio: Decoded mono float32 samples (see load_audio)
+        min_silence_len: Minimum length of a silence in milliseconds
+        seek_step: Step between the windows that are tried in milliseconds
+        frame_len: Length of the frames the threshold is computed from in milliseconds
+        percentile: Percentile of the frame levels used as silence threshold
+        sampling_rate: Sampling rate of the samples in Hz
+        
+    Returns:
+        Timeline containing the silences
+    """
+    block_ms = gcd(gcd(min_silence_len, seek_step), frame_len)
+    block_samples = sampling_rate * block_ms // 1000
+    window, step, frame = min_silence_len // block_ms, seek_step // block_ms, frame_len // block_ms
+    
+    energies = _block_energies(audio, block_samples)
+    num_blocks = len(energies)
+    if num_blocks < window:
+        return Timeline()
+    cumulative = np.concatenate(([0.0], np.cumsum(energies)))
+    
+    # Threshold from consecutive frames (the last one may be shorter)
+    frame_starts = np.arange(0, num_blocks, frame)
+    frame_ends = np.minimum(frame_starts + frame, num_blocks)
+    threshold = np.percentile(_levels(cumulative, frame_starts, frame_ends, block_samples), percentile)
+    
+    # Windows every seek_step, and one ending at the end of the recording
+    last_start = num_blocks - window
+    starts = np.arange(0, last_start + 1, step)
+    if last_start % step:
+        starts = np.append(starts, last_start)
+    silent = starts[_levels(cumulative, starts, starts + window, block_samples) <= threshold]
+    if not len(silent):
+        return Timeline()
+    
+    # A new silence begins where the next silent window starts after the end of the previous one
+    breaks = np.flatnonzero(np.diff(silent) > window)
+    run_starts = silent[np.concatenate(([0], breaks + 1))]
+    run_ends = silent[np.concatenate((breaks, [len(silent) - 1]))] + window
+    seconds = block_samples / sampling_rate
+    return Timeline([Segment(float(start * seconds), float(end * seconds)) for start, end in zip(run_starts, run_ends)])
+
+
+def longest_silence(non_speech_regions: Union[Timeline, SilenceIndex],
+                    start: float,
+                    end: float) -> Optional[Segment]:
+    """Get the longest silence segment in the given time window.
+    
+    Args:
+        non_speech_regions: Timeline or SilenceIndex containing non-speech segments
+        start: Start time of window to search in
+        end: End time of window to search in
+        
+    Returns:
+        The longest silence segment in the window, or None if no silence found
+    """
+    if isinstance(non_speech_regions, SilenceIndex):
+        return non_speech_regions.longest(start, end)
+    
+    # Create a support segment for the window we're analyzing
+    support = Segment(start, end)
+    
+    # Get all silence segments in this window
+    window_silences = non_speech_regions.crop(support=support, mode="intersection")
+    
+    # Find the longest silence segment
+    if not window_silences:
+        return None
+        
+    return max(window_silences, key=lambda s: s.duration)
+
+
+def split_on_silences(non_speech_regions: Union[Timeline, SilenceIndex],
+                      window_min_size: float,
+                      window_max_size: float,
+                      silence_regions: Optional[Union[Timeline, SilenceIndex, Callable[[], SilenceIndex]]] = None,
+                      diarization: Optional[Annotation] = None) -> Timeline:
+    """Split the audio into segments that end in the middle of the longest silence of a window.
+    
+    Args:
+        non_speech_regions: Non-speech regions from the VAD
+        window_min_size: Minimum size of the window to look for silence in seconds
+        window_max_size: Maximum size of the window to look for silence in seconds
+        silence_regions: Silences used when the VAD finds none in a window (e.g. from detect_energy_silences),
+            or a function computing them, which is only called when the first such window is reached
+        diarization: Speaker diarization, to cut at speaker changes and skip overlapping speech
+        
+    Returns:
+        Timeline containing all segments
+    """
+    overlapping_speaker_segments = diarization.get_overlap() if diarization else None
+    
+    segments = Timeline()
+
+    # TODO: I think we don't need this necessarily as we should skip full silences anyways
+    """
+    # Skip initial silence
+    current_pos = speech_regions.get_timeline().extent().start
+    # Skip the last silence
+    audio_end = speech_regions.get_timeline().extent().end
+    """
+    current_pos = non_speech_regions.extent().start
+    audio_end = non_speech_regions.extent().end
+    
+    while current_pos < audio_end:
+        # Define the window we're looking at
+        window_start = current_pos + window_min_size
+        window_end = current_pos + window_max_size
+
+        # Check if the window only contains silence
+        max_segment_silence = longest_silence(
+            non_speech_regions, 
+            current_pos, 
+            window_end
+        )
+        if max_segment_silence and max_segment_silence.start == current_pos and max_segment_silence.duration > window_min_size:
+            # If the segment we are checking only contains silence, skip it
+            current_pos = max_segment_silence.end
+            continue
+        
+        # Check if the segment starts with an overlapping speaker segment
+        if overlapping_speaker_segments and diarization:
+            overlapping_speaker_segments_window_start = overlapping_speaker_segments.crop(
+                Segment(current_pos, window_end), 
+                mode="loose"
+            )
+            if overlapping_speaker_segments_window_start:
+                # If there is an overlapping speaker segment, move to its end
+                current_pos = overlapping_speaker_segments_window_start[0].end + 1e-6
+                continue
+
+            # Check if there is a speaker change in this segment
+            overlapping_segments = diarization.crop(
+                Segment(current_pos, window_end), 
+                mode="intersection"
+            )
+            last_speaker = None
+            speaker_change_detected = False
+        
+            # Iterate through speaker segments
+            for segment, track, label in overlapping_segments.itertracks(yield_label=True):
+                if last_speaker is None:
+                    last_speaker = label
+                elif label != last_speaker:
+                    segments.add(Segment(current_pos, segment.start))
+                    current_pos = segment.start
+                    speaker_change_detected = True
+                    break
+                    
+            if speaker_change_detected:
+                continue
+            
+        # Get the longest silence in this window
+        max_silence = longest_silence(
+            non_speech_regions, 
+            window_start, 
+            window_end
+        )
+        
+        if max_silence is None:
+            if callable(silence_regions):
+                silence_regions = silence_regions()
+            if silence_regions:
+                # If no silence found with pyannote, try pydub
+                max_silence = longest_silence(
+                    silence_regions, 
+                    window_start, 
+                    window_end
+                )
+            if max_silence is None:
+                # If no silence found with pydub, add the whole window
+                segments.add(Segment(current_pos, window_end))
+                current_pos = window_end
+            else:
+                # End segment at middle of silence
+                silence_middle = max_silence.middle
+                segments.add(Segment(current_pos, silence_middle))
+                current_pos = silence_middle
+        else:
+            # End segment at middle of silence
+            silence_middle = max_silence.middle
+            segments.add(Segment(current_pos, silence_middle))
+            current_pos = silence_middle
+            
+    return segments
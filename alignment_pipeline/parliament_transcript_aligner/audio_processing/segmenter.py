@@ -1,27 +1,45 @@
-from typing import List, Optional, Union
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterator, List, Optional, Union
+from functools import partial
 import os
 import warnings
 from pathlib import Path
-import torch
-from pyannote.audio.pipelines import VoiceActivityDetection
 from pyannote.core import Segment, Timeline
-from pyannote.audio import Pipeline
-from transformers import pipeline, AutoModelForSpeechSeq2Seq, AutoProcessor
-from pydub import AudioSegment
-from pydub import silence  # Added this import for silence detection
 import numpy as np
 from tqdm import tqdm  # Added tqdm for progress bar
 import time
 import logging
-import shutil
 from ..data_models.models import TranscribedSegment
-from ..audio_processing.vad.silero_vad import get_silero_vad  # Import get_silero_vad directly
+from ..audio_processing.vad.silero_vad import get_silero_vad, iter_silero_non_speech  # Import get_silero_vad directly
+from .asr import ASRBackend, create_asr_backend
+from .asr_pool import ASRWorkerPool
+from .asr_server import ASRClient, parse_address
+from .batching import BatchStats, fixed_batches, plan_batches, summarize_batches
+from .segmentation import SilenceIndex, detect_energy_silences, longest_silence, split_on_silences
+from .audio_buffer import SAMPLING_RATE, load_audio, load_audio_segment, iter_audio_chunks, audio_slice, wav_duration
 from ..utils.logging.supabase_logging import SupabaseClient
 
+if TYPE_CHECKING:
+    # torch, pyannote.audio and pydub are imported where they are used, so that importing the package is fast
+    from pyannote.audio import Pipeline
+    from pyannote.audio.pipelines import VoiceActivityDetection
+
+
+@dataclass
+class PreparedAudio:
+    """A recording after the CPU steps of the AudioSegmenter, ready for the ASR (see AudioSegmenter.prepare_audio)."""
+    audio_path: str
+    wav_path: str
+    audio: Optional[np.ndarray]  # None with streaming_vad, the ASR then decodes every segment from wav_path
+    segments: List[Segment]
+    duration: float
+    video_id: Optional[str] = None
+
+
 class AudioSegmenter:
     def __init__(self, 
-                 vad_pipeline: VoiceActivityDetection, 
-                 diarization_pipeline: Pipeline, 
+                 vad_pipeline: Optional["VoiceActivityDetection"], 
+                 diarization_pipeline: Optional["Pipeline"], 
                  window_min_size: float = 10.0, 
                  window_max_size: float = 20.0,
                  hf_cache_dir: Optional[Union[Path, str]] = None,
@@ -32,7 +50,13 @@ class AudioSegmenter:
                  batch_size: int = 1,
                  supabase_client: Optional[SupabaseClient] = None,
                  with_pydub_silences: bool = False,
-                 temp_directory: Optional[Union[Path, str]] = None):
+                 vad_onnx: bool = False,
+                 streaming_vad: bool = False,
+                 batch_seconds: Optional[float] = None,
+                 asr_devices: Optional[List[str]] = None,
+                 asr_threads_per_worker: Optional[int] = None,
+                 asr_server_address: Optional[str] = None,
+                 asr_backend: Union[str, ASRBackend] = "hf"):
         """Initialize the AudioSegmenter.
         
         Args:
@@ -46,8 +70,27 @@ class AudioSegmenter:
             with_diarization: Whether to use diarization (default: False)
             language: Audio language code using ISO 639-1 standard (default: "en" for English). Examples: "es" for Spanish, "fr" for French, "de" for German.
             batch_size: Number of segments the ASR model processes at once (default: 1, i.e. no batching, make sure to check how much VRAM is needed)
-            with_pydub_silences: Whether to use pydub to detect silences, when no silences are detected with VAD (default: False)
-            temp_directory: Optional directory for temporary files (default: system temp directory)
+            with_pydub_silences: Whether to fall back to energy-based silence detection (windows with an RMS level below
+                the 15th percentile of the recording, as with pydub), when no silences are detected with VAD (default: False)
+            vad_onnx: Whether to run Silero VAD with ONNX Runtime instead of torch, e.g. on CPU-only nodes (default: False)
+            streaming_vad: Whether to run the VAD over chunks of the audio and decode each segment separately for the ASR
+                instead of decoding the whole recording into memory, so that memory does not grow with the length of
+                the recording. Not supported with with_pydub_silences (default: False)
+            batch_seconds: Audio seconds per ASR batch, counting every segment as long as the longest one in its batch.
+                If given, segments of similar duration are batched up to this budget instead of batch_size segments
+                in temporal order, and batch_size is ignored (default: None)
+            asr_devices: Devices of a pool of ASR worker processes, each with its own model, e.g. ["cuda:0", "cuda:1"]
+                or ["cpu"] * 4. The batches of a recording are spread over the workers, which read the decoded audio
+                from shared memory. Not supported with streaming_vad (default: None, i.e. one model in this process)
+            asr_threads_per_worker: Number of CPU threads of every ASR worker, e.g. to split the cores of a node
+                between CPU workers (default: None, i.e. the torch default)
+            asr_server_address: Unix socket path or host:port of a local ASR server (see asr_server.py) that owns the
+                model and batches the segments of several pipelines together. No model is loaded in this process
+                (default: None)
+            asr_backend: Name of the ASR backend ("hf": Whisper through a Hugging Face pipeline, on GPU if available;
+                "int8-cpu": Whisper with int8-quantized weights on CPU; "stub": deterministic stand-in for tests),
+                or an ASRBackend instance (not with asr_devices). A named backend (or the worker pool) is only
+                loaded when the first recording is transcribed (default: "hf")
         """
         self.vad_pipeline = vad_pipeline
         self.diarization_pipeline = diarization_pipeline
@@ -56,11 +99,19 @@ class AudioSegmenter:
         self.with_diarization = with_diarization
         self.language = language
         self.batch_size = batch_size
+        self.batch_seconds = batch_seconds
+        self.last_batch_stats: List[BatchStats] = []
         self.supabase_client = supabase_client
         self.with_pydub_silences = with_pydub_silences
+        self.vad_onnx = vad_onnx
+        if streaming_vad and with_pydub_silences:
+            raise ValueError("with_pydub_silences requires the whole decoded recording and is not supported with streaming_vad")
+        self.streaming_vad = streaming_vad
+        if asr_devices and asr_server_address:
+            raise ValueError("asr_devices and asr_server_address cannot be combined")
+        if asr_devices and streaming_vad:
+            raise ValueError("asr_devices requires the whole decoded recording and is not supported with streaming_vad")
         self.wav_directory = wav_directory
-        self.temp_directory = Path(temp_directory) if temp_directory else Path("/tmp/") 
-        self.temp_directory.mkdir(parents=True, exist_ok=True)
         
         # Set cache directory for Hugging Face
         hf_cache_dir = hf_cache_dir if hf_cache_dir is not None else os.getenv("HF_CACHE_DIR")
@@ -74,36 +125,23 @@ class AudioSegmenter:
             warnings.warn("No cache directory provided, using default cache directory")
             print("No cache directory provided, using default cache directory")
 
-        #model_name = "openai/whisper-large-v3"
-        #model_name = "distil-whisper/distil-large-v3"
-        #model_name = "distil-whisper/distil-large-v3.5" # doesn't support languages other than English unfortunatelly
-        model_name = "openai/whisper-large-v3-turbo"
-
-        # Load the model and processor with cache_dir
-        model = AutoModelForSpeechSeq2Seq.from_pretrained(
-            model_name,
-            #torch_dtype=torch.float16,
-            low_cpu_mem_usage=True,
-            #attn_implementation="flash_attention_2",
-            cache_dir=hf_cache_dir,
-            device_map="cuda" if torch.cuda.is_available() else "cpu"
-        )
-
-        processor = AutoProcessor.from_pretrained(
-            model_name,
-            cache_dir=hf_cache_dir
-        )
-
-        # Create the pipeline using the loaded model and processor
         print(f"Using language: {self.language}")
-        self.asr_pipeline = pipeline(
-            "automatic-speech-recognition",
-            model=model,
-            tokenizer=processor.tokenizer,
-            feature_extractor=processor.feature_extractor,
-            generate_kwargs={"language": self.language},
-            batch_size=self.batch_size
-        )
+        if asr_server_address:
+            self.asr_backend = ASRClient(parse_address(asr_server_address))
+            self.asr_pool = None
+        elif isinstance(asr_backend, ASRBackend):
+            if asr_devices:
+                raise ValueError("asr_devices requires the name of the ASR backend, not an instance")
+            self.asr_backend = asr_backend
+            self.asr_pool = None
+        else:
+            # Loaded by _load_asr on the first transcription, not at all if every recording is cached
+            self.asr_backend = None
+            self.asr_pool = None
+            self._backend_factory = partial(create_asr_backend, asr_backend, language=self.language,
+                                            batch_size=self.batch_size, hf_cache_dir=hf_cache_dir)
+        self.asr_devices = asr_devices
+        self.asr_threads_per_worker = asr_threads_per_worker
         
         self.delete_wav_files = delete_wav_files
         self.wav_directory = Path(wav_directory) if wav_directory is not None else None
@@ -112,30 +150,20 @@ class AudioSegmenter:
         self.logger = logging.getLogger(__name__)
         
     def get_longest_silence(self, 
-                          non_speech_regions: Timeline, 
+                          non_speech_regions: Union[Timeline, SilenceIndex], 
                           start: float, 
                           end: float) -> Optional[Segment]:
         """Get the longest silence segment in the given time window.
         
         Args:
-            non_speech_regions: Timeline containing non-speech segments
+            non_speech_regions: Timeline or SilenceIndex containing non-speech segments
             start: Start time of window to search in
             end: End time of window to search in
             
         Returns:
             The longest silence segment in the window, or None if no silence found
         """
-        # Create a support segment for the window we're analyzing
-        support = Segment(start, end)
-        
-        # Get all silence segments in this window
-        window_silences = non_speech_regions.crop(support=support, mode="intersection")
-        
-        # Find the longest silence segment
-        if not window_silences:
-            return None
-            
-        return max(window_silences, key=lambda s: s.duration)
+        return longest_silence(non_speech_regions, start, end)
 
     def convert_audio_to_wav(self, audio_path: str) -> str:
         """Convert audio file to wav format using ffmpeg if needed.
@@ -165,75 +193,47 @@ class AudioSegmenter:
         
         return wav_path
 
-    def _check_disk_space(self, required_mb: int = 100) -> bool:
-        """Check if there's enough disk space in temp directory.
+    def segment_and_transcribe(self, audio_path: str, video_id: Optional[str] = None) -> List[TranscribedSegment]:
+        """Segment audio file and transcribe each segment.
         
         Args:
-            required_mb: Required space in megabytes
+            audio_path: Path to audio file
             
         Returns:
-            bool: True if enough space available, False otherwise
+            List of TranscribedSegments containing timing and text
         """
-        try:
-            total, used, free = shutil.disk_usage(self.temp_directory)
-            free_mb = free // (1024 * 1024)  # Convert to MB
-            used_mb = used // (1024 * 1024)  # Convert to MB
-            total_mb = total // (1024 * 1024)  # Convert to MB
-            self.logger.info(f"Available disk space in temp directory: {free_mb}MB. Used: {used_mb}MB. Total: {total_mb}MB")
-            if free_mb < required_mb:
-                self.logger.error(f"Insufficient disk space. Only {free_mb}MB available, need {required_mb}MB")
-                return False
-            return True
-        except Exception as e:
-            self.logger.error(f"Error checking disk space: {e}")
-            return False
+        return list(self.iter_segment_and_transcribe(audio_path, video_id=video_id))
 
-    def extract_audio_segment(self, audio_path: str, start: float, end: float) -> str:
-        """Extract a segment from an audio file and return a temporary path.
+    def iter_segment_and_transcribe(self, audio_path: str, video_id: Optional[str] = None) -> Iterator[TranscribedSegment]:
+        """Segment audio file and yield the transcribed segments as soon as their ASR batch is finished.
+        
+        Consumers such as the TranscriptAligner can process the segments while the
+        remaining batches are transcribed. The audio is decoded once into memory and
+        shared by VAD, silence detection and ASR, which receives array slices instead
+        of temporary files.
         
         Args:
-            audio_path: Path to audio file (.opus or .wav)
-            start: Start time in seconds
-            end: End time in seconds
+            audio_path: Path to audio file
             
-        Returns:
-            Path to temporary wav file containing the segment
+        Yields:
+            TranscribedSegments containing timing and text, in temporal order
         """
-        try:
-            # Check disk space before proceeding
-            segment_duration = end - start
-            estimated_size_mb = int(segment_duration * 32)  # Rough estimate: 32KB per second
-            if not self._check_disk_space(estimated_size_mb):
-                raise OSError(f"Insufficient disk space for audio segment (need ~{estimated_size_mb}MB)")
-            
-            # Convert to wav if needed
-            wav_path = self.convert_audio_to_wav(audio_path)
-            
-            audio = AudioSegment.from_file(wav_path)
-            segment = audio[start * 1000:end * 1000]  # pydub works in milliseconds
-            
-            # Use temp_directory instead of /tmp
-            temp_path = str(self.temp_directory / f"segment_{start}_{end}.wav")
-            self.logger.debug(f"Creating temporary segment file: {temp_path}")
-            
-            segment.export(temp_path, format="wav")
-            return temp_path
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting audio segment: {e}")
-            raise
+        yield from self.iter_transcribe(self.prepare_audio(audio_path, video_id=video_id))
 
-    def segment_and_transcribe(self, audio_path: str, video_id: Optional[str] = None) -> List[TranscribedSegment]:
-        """Segment audio file and transcribe each segment.
+    def prepare_audio(self, audio_path: str, video_id: Optional[str] = None) -> PreparedAudio:
+        """Run the CPU steps before the ASR: conversion to WAV, decoding, VAD and segmentation.
+        
+        Together with iter_transcribe, this lets a caller prepare the next recording
+        while the ASR model transcribes the current one.
         
         Args:
             audio_path: Path to audio file
+            video_id: Video ID for the Supabase logging
             
         Returns:
-            List of TranscribedSegments containing timing and text
+            The decoded and segmented recording
         """
         converted_wav_path = None
-        temp_paths = []
         
         try:
             # Convert to WAV if needed
@@ -246,7 +246,13 @@ class AudioSegmenter:
                 self.supabase_client.update_transcribing_start(video_id)
             segmentation_start_time = time.time()    
             
-            segments_timeline = self.segment_audio(converted_wav_path)
+            if self.streaming_vad:
+                # Decoded chunk by chunk by the VAD and segment by segment for the ASR
+                audio = None
+            else:
+                audio = load_audio(converted_wav_path)
+                print(f"Decoded {len(audio) / SAMPLING_RATE:.1f} seconds of audio ({audio.nbytes / 1e6:.1f} MB)")
+            segments_timeline = self.segment_audio(converted_wav_path, audio=audio)
 
             segmentation_duration = time.time() - segmentation_start_time
 
@@ -256,57 +262,48 @@ class AudioSegmenter:
                 if video_id is None:
                     raise ValueError("video_id is required when using SupabaseClient")
                 self.supabase_client.update_segmentation_complete(video_id, segmentation_duration, len(segments_timeline))
+        except Exception:
+            self._delete_wav(audio_path, converted_wav_path)
+            raise
 
+        if audio is not None:
+            duration = len(audio) / SAMPLING_RATE
+        else:
+            duration = wav_duration(converted_wav_path) or (segments_timeline.extent().end if segments_timeline else 0.0)
+        return PreparedAudio(audio_path, converted_wav_path, audio, list(segments_timeline), duration, video_id)
 
-
+    def iter_transcribe(self, prepared: PreparedAudio) -> Iterator[TranscribedSegment]:
+        """Transcribe the segments of a prepared recording (see prepare_audio) and yield them in temporal order.
+        
+        Args:
+            prepared: Recording returned by prepare_audio
+            
+        Yields:
+            TranscribedSegments containing timing and text, in temporal order
+        """
+        video_id = prepared.video_id
+        try:
+            self._load_asr()
             if self.supabase_client: 
                 if video_id is None:
                     raise ValueError("video_id is required when using SupabaseClient")
                 self.supabase_client.update_transcribing_start(video_id)
             transcribing_start_time = time.time()
 
-            transcribed_segments = []
-
-            if self.batch_size > 1:
-                try:
-                    temp_paths = [ self.extract_audio_segment(converted_wav_path, segment.start, segment.end) for segment in segments_timeline]
-                    for i in tqdm(range(0, len(temp_paths), self.batch_size), desc="Batch Transcribing Segments with Batch Size of {self.batch_size}", mininterval=60.0):
-                        batch_temp_paths = temp_paths[i:i+self.batch_size]
-                        results = self.asr_pipeline(
-                            batch_temp_paths,
-                            return_timestamps=False  # Faster than word-level timestamps
-                        )
-
-                        # Cleanup and result mapping
-                        for temp_path, result in zip(batch_temp_paths, results):
-                            os.remove(temp_path)
-                            text = result["text"].strip()
-                            transcribed_segments.append(TranscribedSegment(segments_timeline[i], text))
-                            i += 1
-                except Exception as e:
-                    print(f"Error transcribing segments: {e}")
-                    raise e
-                finally:
-                    for temp_path in temp_paths:
-                        if temp_path and os.path.exists(temp_path):
-                            os.remove(temp_path)
+            if self.asr_pool or self.batch_seconds or self.batch_size > 1:
+                yield from self._transcribe_batches(prepared.wav_path, prepared.audio, prepared.segments)
             else:
                 # Use tqdm to create a progress bar for segment processing
-                for segment in tqdm(segments_timeline, desc="Transcribing segments", unit="segment", mininterval=60.0):
+                for segment in tqdm(prepared.segments, desc="Transcribing segments", unit="segment", mininterval=60.0):
                     try:
-                        temp_path = self.extract_audio_segment(converted_wav_path, segment.start, segment.end)
-                        text = self.asr_pipeline(temp_path)["text"].strip()
-                    
-                        # Clean up
-                        os.remove(temp_path)
-                        
-                        transcribed_segments.append(TranscribedSegment(segment, text))
+                        text = self.asr_backend.transcribe_batch(
+                            [self._segment_samples(prepared.wav_path, prepared.audio, segment)], self.language
+                        )[0]
                     except Exception as e:
                         print(f"Error transcribing segment: {e}")
                         raise e
-                    finally:
-                        if temp_path and os.path.exists(temp_path):
-                            os.remove(temp_path)
+                    
+                    yield TranscribedSegment(segment, text)
             
             transcribing_duration = time.time() - transcribing_start_time
             print(f"Transcribing duration: {transcribing_duration} seconds")
@@ -315,136 +312,143 @@ class AudioSegmenter:
                 if video_id is None:
                     raise ValueError("video_id is required when using SupabaseClient")
                 self.supabase_client.update_transcribing_complete(video_id, transcribing_duration)
-
-            return transcribed_segments
         finally:
-            # Clean up the converted WAV file if needed
-            if self.delete_wav_files and converted_wav_path and converted_wav_path != audio_path:
-                os.remove(converted_wav_path)
+            self._delete_wav(prepared.audio_path, prepared.wav_path)
+
+    def _load_asr(self) -> None:
+        """Load the ASR backend, or start the ASR worker pool, if not done yet."""
+        if self.asr_backend is not None or self.asr_pool is not None:
+            return
+        load_start_time = time.time()
+        if self.asr_devices:
+            self.asr_pool = ASRWorkerPool(self._backend_factory, self.asr_devices,
+                                          threads_per_worker=self.asr_threads_per_worker)
+        else:
+            self.asr_backend = self._backend_factory()
+        print(f"ASR model loading duration: {time.time() - load_start_time} seconds")
+
+    def _delete_wav(self, audio_path: str, converted_wav_path: Optional[str]) -> None:
+        """Clean up the converted WAV file if needed."""
+        if self.delete_wav_files and converted_wav_path and converted_wav_path != audio_path:
+            os.remove(converted_wav_path)
+
+    def _transcribe_batches(self, audio_path: str, audio: Optional[np.ndarray],
+                            segments: List[Segment]) -> Iterator[TranscribedSegment]:
+        """Transcribe the segments in batches and yield them in temporal order.
+        
+        With batch_seconds, the batches group segments of similar duration (see
+        plan_batches), so a finished segment is held back until all earlier ones are
+        transcribed. The measurements of every batch are kept in last_batch_stats.
+        """
+        durations = [segment.duration for segment in segments]
+        if self.batch_seconds:
+            batches = plan_batches(durations, self.batch_seconds)
+            description = f"Batch Transcribing Segments with {self.batch_seconds:g} Audio Seconds per Batch"
+        else:
+            batches = fixed_batches(len(segments), self.batch_size)
+            description = f"Batch Transcribing Segments with Batch Size of {self.batch_size}"
+        
+        if self.asr_pool is not None:
+            batch_results = self.asr_pool.transcribe(
+                audio, [[(segments[index].start, segments[index].end) for index in batch] for batch in batches],
+                self.language
+            )
+        else:
+            batch_results = self._run_batches(audio_path, audio, segments, batches)
+        
+        self.last_batch_stats = []
+        transcribed = {}
+        next_index = 0
+        for number, texts, wall_time in tqdm(batch_results, total=len(batches), desc=description, mininterval=60.0):
+            batch = batches[number]
+            stats = BatchStats.from_durations([durations[index] for index in batch], wall_time)
+            self.last_batch_stats.append(stats)
+            self.logger.debug(f"ASR batch of {stats.num_segments} segments, {stats.audio_seconds:.1f}s of audio: "
+                              f"padding waste {stats.padding_waste:.1%}, {stats.segments_per_second:.2f} segments/s")
+            
+            for index, text in zip(batch, texts):
+                transcribed[index] = TranscribedSegment(segments[index], text)
+            while next_index in transcribed:
+                yield transcribed.pop(next_index)
+                next_index += 1
+        print(summarize_batches(self.last_batch_stats))
+
+    def _run_batches(self, audio_path: str, audio: Optional[np.ndarray], segments: List[Segment],
+                     batches: List[List[int]]) -> Iterator[tuple]:
+        """Transcribe the batches with the backend of this process, yielding (batch index, texts, wall time)."""
+        for number, batch in enumerate(batches):
+            batch_start_time = time.perf_counter()
+            try:
+                texts = self.asr_backend.transcribe_batch(
+                    [self._segment_samples(audio_path, audio, segments[index]) for index in batch], self.language
+                )
+            except Exception as e:
+                print(f"Error transcribing segments: {e}")
+                raise e
+            yield number, texts, time.perf_counter() - batch_start_time
 
-    def segment_audio(self, audio_path: str) -> Timeline:
+    def close(self) -> None:
+        """Stop the ASR worker processes or disconnect from the ASR server, if any."""
+        if self.asr_pool is not None:
+            self.asr_pool.close()
+        if self.asr_backend is not None:
+            self.asr_backend.close()
+
+    def _segment_samples(self, audio_path: str, audio: Optional[np.ndarray], segment: Segment) -> np.ndarray:
+        """Get the samples of a segment from the decoded audio, or from the file with streaming_vad."""
+        if audio is None:
+            return load_audio_segment(audio_path, segment.start, segment.end)
+        return audio_slice(audio, segment.start, segment.end)
+
+    def segment_audio(self, audio_path: str, audio: Optional[np.ndarray] = None) -> Timeline:
         """Segment audio file based on silence detection.
         
         Args:
             audio_path: Path to audio file
+            audio: Decoded 16 kHz mono float32 samples of the file (see load_audio); decoded here if not given,
+                unless streaming_vad is enabled
             
         Returns:
             Timeline containing all segments
         """
         # Get speech regions for the entire audio
         print(f"Segmenting audio file: {audio_path}")
+        if audio is None and not self.streaming_vad:
+            audio = load_audio(audio_path)
         
         # Using PyAnnote VAD
         #speech_regions = self.vad_pipeline(audio_path)
         
         # Instead of deriving non_speech_regions from PyAnnote, use Silero VAD directly
         # non_speech_regions = speech_regions.get_timeline().gaps()
-        non_speech_regions = get_silero_vad(audio_path)
+        if audio is None:
+            non_speech_regions = Timeline()
+            for region in iter_silero_non_speech(iter_audio_chunks(audio_path), onnx=self.vad_onnx):
+                non_speech_regions.add(region)
+        else:
+            non_speech_regions = get_silero_vad(audio_path, audio=audio, onnx=self.vad_onnx)
         
         if self.with_diarization:
-            diarization = self.diarization_pipeline(audio_path)
-            overlapping_speaker_segments = diarization.get_overlap()
+            if audio is None:
+                diarization = self.diarization_pipeline(audio_path)
+            else:
+                import torch
+                diarization = self.diarization_pipeline(
+                    {"waveform": torch.from_numpy(audio).unsqueeze(0), "sample_rate": SAMPLING_RATE}
+                )
         else:
             diarization = None
-            overlapping_speaker_segments = None
         
-        audio = AudioSegment.from_file(audio_path)
-        audio = audio.normalize(headroom=5)
-        silence_threshold = np.percentile([frame.rms for frame in audio[::100]], 15)
         if self.with_pydub_silences:
-            silences = silence.detect_silence(audio, min_silence_len=200, silence_thresh=silence_threshold, seek_step=15)
-            silence_regions = Timeline([Segment(start/1000, end/1000) for start, end in silences])
+            # Only detected if a window without VAD silence is reached
+            silence_regions = lambda: SilenceIndex(detect_energy_silences(audio))
         else:
             silence_regions = None
         
-        segments = Timeline()
-
-        # TODO: I think we don't need this necessarily as we should skip full silences anyways
-        """
-        # Skip initial silence
-        current_pos = speech_regions.get_timeline().extent().start
-        # Skip the last silence
-        audio_end = speech_regions.get_timeline().extent().end
-        """
-        current_pos = non_speech_regions.extent().start
-        audio_end = non_speech_regions.extent().end
-        
-        while current_pos < audio_end:
-            # Define the window we're looking at
-            window_start = current_pos + self.window_min_size
-            window_end = current_pos + self.window_max_size
-
-            # Check if the window only contains silence
-            max_segment_silence = self.get_longest_silence(
-                non_speech_regions, 
-                current_pos, 
-                window_end
-            )
-            if max_segment_silence and max_segment_silence.start == current_pos and max_segment_silence.duration > self.window_min_size:
-                # If the segment we are checking only contains silence, skip it
-                current_pos = max_segment_silence.end
-                continue
-            
-            # Check if the segment starts with an overlapping speaker segment
-            if overlapping_speaker_segments and diarization:
-                overlapping_speaker_segments_window_start = overlapping_speaker_segments.crop(
-                    Segment(current_pos, window_end), 
-                    mode="loose"
-                )
-                if overlapping_speaker_segments_window_start:
-                    # If there is an overlapping speaker segment, move to its end
-                    current_pos = overlapping_speaker_segments_window_start[0].end + 1e-6
-                    continue
-
-                # Check if there is a speaker change in this segment
-                overlapping_segments = diarization.crop(
-                    Segment(current_pos, window_end), 
-                    mode="intersection"
-                )
-                last_speaker = None
-                speaker_change_detected = False
-            
-                # Iterate through speaker segments
-                for segment, track, label in overlapping_segments.itertracks(yield_label=True):
-                    if last_speaker is None:
-                        last_speaker = label
-                    elif label != last_speaker:
-                        segments.add(Segment(current_pos, segment.start))
-                        current_pos = segment.start
-                        speaker_change_detected = True
-                        break
-                        
-                if speaker_change_detected:
-                    continue
-                
-            # Get the longest silence in this window
-            max_silence = self.get_longest_silence(
-                non_speech_regions, 
-                window_start, 
-                window_end
-            )
-            
-            if max_silence is None:
-                if self.with_pydub_silences and silence_regions:
-                    # If no silence found with pyannote, try pydub
-                    max_silence = self.get_longest_silence(
-                        silence_regions, 
-                        window_start, 
-                        window_end
-                    )
-                if max_silence is None:
-                    # If no silence found with pydub, add the whole window
-                    segments.add(Segment(current_pos, window_end))
-                    current_pos = window_end
-                else:
-                    # End segment at middle of silence
-                    silence_middle = max_silence.middle
-                    segments.add(Segment(current_pos, silence_middle))
-                    current_pos = silence_middle
-            else:
-                # End segment at middle of silence
-                silence_middle = max_silence.middle
-                segments.add(Segment(current_pos, silence_middle))
-                current_pos = silence_middle
-                
-        return segments 
\ No newline at end of file
+        return split_on_silences(
+            SilenceIndex(non_speech_regions),
+            self.window_min_size,
+            self.window_max_size,
+            silence_regions=silence_regions,
+            diarization=diarization
+        ) 
\ No newline at end of file
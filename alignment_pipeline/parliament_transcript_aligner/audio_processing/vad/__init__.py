@@ -5,9 +5,10 @@ Contains different VAD implementations for speech detection.
 """
 
 from .pyannote_vad import initialize_vad_pipeline
-from .silero_vad import get_silero_vad
+from .silero_vad import get_silero_vad, load_silero_vad_model
 
 __all__ = [
     "initialize_vad_pipeline",
-    "get_silero_vad"
+    "get_silero_vad",
+    "load_silero_vad_model"
 ]
\ No newline at end of file
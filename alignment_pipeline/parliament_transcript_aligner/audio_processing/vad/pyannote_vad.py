@@ -1,13 +1,12 @@
 import os
-from pyannote.audio.pipelines import VoiceActivityDetection
-from pyannote.audio import Model
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from pathlib import Path
-import torch
-import torch.serialization
 
+if TYPE_CHECKING:
+    from pyannote.audio.pipelines import VoiceActivityDetection
 
-def initialize_vad_pipeline(hf_cache_dir: Optional[Path] = None, hf_token: Optional[str] = None) -> VoiceActivityDetection:
+
+def initialize_vad_pipeline(hf_cache_dir: Optional[Path] = None, hf_token: Optional[str] = None) -> "VoiceActivityDetection":
     """Initialize the pyannote VAD pipeline.
     
     Args:
@@ -16,6 +15,9 @@ def initialize_vad_pipeline(hf_cache_dir: Optional[Path] = None, hf_token: Optio
     Returns:
         Configured VAD pipeline
     """
+    import torch.serialization
+    from pyannote.audio import Model
+    from pyannote.audio.pipelines import VoiceActivityDetection
     
     # Add omegaconf.listconfig.ListConfig to safe globals for PyTorch 2.6+ compatibility
     from omegaconf import ListConfig
@@ -1,32 +1,77 @@
-import torch
+import os
+from functools import lru_cache
 from pyannote.core import Segment, Timeline
-from pydub import AudioSegment
-from typing import Optional
-from pydub.silence import detect_silence
+from typing import TYPE_CHECKING, Optional, Tuple, Callable, Iterable, Iterator
+import numpy as np
+
+from ..audio_buffer import load_audio
+
+if TYPE_CHECKING:
+    import torch
+
+
+@lru_cache(maxsize=None)
+def load_silero_vad_model(onnx: bool = False, repo_dir: Optional[str] = None) -> Tuple["torch.nn.Module", Callable]:
+    """Load the Silero VAD model once per process.
+    
+    The model is loaded without network access from, in this order: a local copy of
+    the silero-vad repository (repo_dir or the SILERO_VAD_DIR environment variable),
+    the silero-vad package, which ships the model files, or the torch hub cache
+    (downloaded on first use).
+    
+    Args:
+        onnx: Whether to run the model with ONNX Runtime on the CPU instead of torch, so
+            that the VAD does not compete with the ASR model for torch threads
+        repo_dir: Local copy of the silero-vad repository
+        
+    Returns:
+        Tuple of the model and its get_speech_timestamps function
+    """
+    import torch
+    
+    repo_dir = repo_dir or os.getenv("SILERO_VAD_DIR")
+    if repo_dir:
+        model, utils = torch.hub.load(repo_or_dir=repo_dir, model='silero_vad', source='local', onnx=onnx)
+        return model, utils[0]
+    
+    try:
+        from silero_vad import load_silero_vad, get_speech_timestamps
+    except ImportError:
+        if onnx:
+            raise ImportError("Please install silero-vad and onnxruntime: pip install silero-vad onnxruntime")
+        model, utils = torch.hub.load(repo_or_dir='snakers4/silero-vad',
+                                      model='silero_vad',
+                                      force_reload=False)
+        return model, utils[0]
+    return load_silero_vad(onnx=onnx), get_speech_timestamps
+
 
 def get_silero_vad(audio_path: str, 
                    threshold: float = 0.5, 
-                   min_silence_duration_ms: int = 10) -> Timeline:
-    """Initialize and run Silero VAD on audio file.
+                   min_silence_duration_ms: int = 10,
+                   audio: Optional[np.ndarray] = None,
+                   onnx: bool = False) -> Timeline:
+    """Run Silero VAD on audio file.
     
     Args:
         audio_path: Path to audio file
         threshold: Speech probability threshold
         min_silence_duration_ms: Minimum silence duration in milliseconds
+        audio: Already decoded 16 kHz mono float32 samples of the file (see load_audio),
+            so that the file is not decoded again
+        onnx: Whether to use the ONNX Runtime model (see load_silero_vad_model)
         
     Returns:
         Timeline containing non-speech regions
     """
-    # Load Silero VAD model
-    model, utils = torch.hub.load(repo_or_dir='snakers4/silero-vad',
-                                model='silero_vad',
-                                force_reload=False)
+    import torch
     
-    (get_speech_timestamps, _, read_audio, _, _) = utils
+    # Load Silero VAD model (cached per process)
+    model, get_speech_timestamps = load_silero_vad_model(onnx=onnx)
     
     # Load audio
     sampling_rate = 16000
-    wav = read_audio(audio_path, sampling_rate=sampling_rate)
+    wav = torch.from_numpy(audio if audio is not None else load_audio(audio_path, sampling_rate))
     
     # Get speech timestamps
     speech_timestamps = get_speech_timestamps(
@@ -41,8 +86,7 @@ def get_silero_vad(audio_path: str,
     non_speech_regions = Timeline()
     
     # Get audio duration
-    audio = AudioSegment.from_file(audio_path)
-    audio_duration = len(audio) / 1000  # in seconds
+    audio_duration = len(wav) / sampling_rate  # in seconds
     
     # First silence if needed
     if speech_timestamps and speech_timestamps[0]['start'] > 0:
@@ -60,4 +104,118 @@ def get_silero_vad(audio_path: str,
         if last_end < audio_duration:
             non_speech_regions.add(Segment(last_end, audio_duration))
     
-    return non_speech_regions 
\ No newline at end of file
+    return non_speech_regions 
+
+
+def iter_silero_non_speech(chunks: Iterable[np.ndarray],
+                           threshold: float = 0.5,
+                           min_silence_duration_ms: int = 10,
+                           onnx: bool = False,
+                           min_speech_duration_ms: int = 250,
+                           speech_pad_ms: int = 30) -> Iterator[Segment]:
+    """Run Silero VAD over consecutive chunks of a recording and yield its non-speech regions.
+    
+    The model state and the speech/non-speech state of get_speech_timestamps are
+    carried across chunk boundaries, so the regions do not depend on the chunk
+    size and are the same as those of get_silero_vad on the whole recording,
+    while only one chunk is in memory. A region is yielded as soon as the speech
+    after it is confirmed.
+    
+    Args:
+        chunks: Consecutive 16 kHz mono float32 chunks of the recording (see iter_audio_chunks)
+        threshold: Speech probability threshold
+        min_silence_duration_ms: Minimum silence duration in milliseconds
+        onnx: Whether to use the ONNX Runtime model (see load_silero_vad_model)
+        min_speech_duration_ms: Speech shorter than this is ignored (as in get_speech_timestamps)
+        speech_pad_ms: Padding of speech on each side (as in get_speech_timestamps)
+        
+    Yields:
+        Non-speech regions in temporal order
+    """
+    import torch
+    
+    model, _ = load_silero_vad_model(onnx=onnx)
+    model.reset_states()
+    
+    sampling_rate = 16000
+    window_size_samples = 512
+    min_speech_samples = sampling_rate * min_speech_duration_ms / 1000
+    min_silence_samples = sampling_rate * min_silence_duration_ms / 1000
+    speech_pad_samples = sampling_rate * speech_pad_ms / 1000
+    neg_threshold = max(threshold - 0.15, 0.01)
+    
+    num_samples = 0
+    
+    def windows() -> Iterator[np.ndarray]:
+        nonlocal num_samples
+        remainder = np.zeros(0, dtype=np.float32)
+        for chunk in chunks:
+            num_samples += len(chunk)
+            audio = np.concatenate((remainder, chunk))
+            usable = len(audio) - len(audio) % window_size_samples
+            for offset in range(0, usable, window_size_samples):
+                yield audio[offset:offset + window_size_samples]
+            remainder = audio[usable:]
+        if len(remainder):
+            # The last window is zero padded
+            yield np.pad(remainder, (0, window_size_samples - len(remainder)))
+    
+    previous_end = None  # End of the last speech region, without padding
+    
+    def silence_before(speech_start: int, speech_end: int) -> Optional[Segment]:
+        # Padding as in get_speech_timestamps: short silences are split between the
+        # speech regions around them, longer ones shrink by the padding on each side
+        nonlocal previous_end
+        if previous_end is None:
+            padded_start = int(max(0, speech_start - speech_pad_samples))
+            silence = Segment(0, padded_start / sampling_rate) if padded_start > 0 else None
+        else:
+            silence_duration = speech_start - previous_end
+            if silence_duration < 2 * speech_pad_samples:
+                silence = Segment((previous_end + int(silence_duration // 2)) / sampling_rate,
+                                  int(max(0, speech_start - silence_duration // 2)) / sampling_rate)
+            else:
+                silence = Segment(int(previous_end + speech_pad_samples) / sampling_rate,
+                                  int(max(0, speech_start - speech_pad_samples)) / sampling_rate)
+        previous_end = speech_end
+        return silence
+    
+    triggered = False
+    speech_start = 0
+    temp_end = 0  # Potential end of the current speech (to tolerate short silences)
+    for i, window in enumerate(windows()):
+        speech_prob = model(torch.from_numpy(window), sampling_rate).item()
+        current_sample = window_size_samples * i
+        
+        if speech_prob >= threshold and temp_end:
+            temp_end = 0
+        
+        # Start of speech
+        if speech_prob >= threshold and not triggered:
+            triggered = True
+            speech_start = current_sample
+            continue
+        
+        # Silence while in speech
+        if speech_prob < neg_threshold and triggered:
+            if not temp_end:
+                temp_end = current_sample
+            if current_sample - temp_end < min_silence_samples:
+                continue
+            if temp_end - speech_start > min_speech_samples:
+                silence = silence_before(speech_start, temp_end)
+                if silence is not None:
+                    yield silence
+            temp_end = 0
+            triggered = False
+    
+    if triggered and num_samples - speech_start > min_speech_samples:
+        silence = silence_before(speech_start, num_samples)
+        if silence is not None:
+            yield silence
+    
+    # Final silence if needed
+    if previous_end is not None:
+        last_end = int(min(num_samples, previous_end + speech_pad_samples))
+        if last_end < num_samples:
+            yield Segment(last_end / sampling_rate, num_samples / sampling_rate)
@@ -7,16 +7,26 @@ of aligning audio recordings with their corresponding transcripts.
 
 import csv
 import json
+import queue
 import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union, Tuple, Callable
+from typing import Dict, List, Optional, Any, Union, Tuple, Callable, Iterator, Iterable
 
-from ..audio_processing.segmenter import AudioSegmenter
+from ..audio_processing.segmenter import AudioSegmenter, PreparedAudio
 from ..audio_processing.diarization import initialize_diarization_pipeline
 from ..audio_processing.vad import initialize_vad_pipeline
 from ..transcript.aligner import TranscriptAligner
 from ..transcript.preprocessor import create_preprocessor
 from ..data_models.models import TranscribedSegment, AlignedTranscript
+from .screening import stratified_sample, median_confidence_interval, candidates_to_align
+from .staged_executor import Stage, StagedExecutor, summarize_stages
 from ..utils.io import save_alignments, save_transcribed_segments, load_transcribed_segments, get_alignment_stats
 
 from ..utils.logging.supabase_logging import (
@@ -67,7 +77,20 @@ class AlignmentPipeline:
                  supabase_key: Optional[str] = SUPABASE_KEY,
                  supabase_environment_file_path: Optional[str] = None,
                  parliament_id: Optional[str] = None,
-                 with_pydub_silences: bool = False):
+                 with_pydub_silences: bool = False,
+                 alignment_engine: str = "greedy",
+                 screening_sample_size: Optional[int] = None,
+                 screening_confidence: float = 0.99,
+                 alignment_workers: int = 1,
+                 streaming_alignment: bool = False,
+                 vad_onnx: bool = False,
+                 streaming_vad: bool = False,
+                 batch_seconds: Optional[float] = None,
+                 asr_devices: Optional[List[str]] = None,
+                 asr_threads_per_worker: Optional[int] = None,
+                 asr_server_address: Optional[str] = None,
+                 asr_backend: str = "hf",
+                 prefetch_videos: int = 0):
         """
         Initialize the pipeline with configuration parameters.
         
@@ -81,7 +104,8 @@ class AlignmentPipeline:
             audio_dirs: List of directories to search for audio files
             transcript_dirs: List of directories to search for transcript files
             cache_dir: Directory for caching results
-            use_cache: Whether to use cached results
+            use_cache: Whether to use cached results. The ASR model is only loaded for the first video without
+                cached segments, so re-aligning cached videos does not load it
             hf_cache_dir: Directory for Hugging Face cache
             hf_token: Hugging Face token
             delete_wav_files: Whether to delete WAV that are created during segmentation by converting opus files
@@ -96,7 +120,50 @@ class AlignmentPipeline:
             supabase_key: Supabase key
             supabase_environment_file_path: Path to environment file containing Supabase URL and key
             parliament_id: Parliament ID
-            with_pydub_silences: Whether to use pydub to detect silences, when no silences are detected with VAD (default: False)
+            with_pydub_silences: Whether to fall back to energy-based silence detection (windows with an RMS level below
+                the 15th percentile of the recording, as with pydub), when no silences are detected with VAD (default: False)
+            alignment_engine: Engine used by the TranscriptAligner. "greedy" matches each segment independently,
+                "global" aligns the whole session in one monotonic pass, "anchored" aligns the segments between
+                unambiguous anchors. The pipeline runs the anchored engine in the process of the candidate, use
+                alignment_workers to align candidates in parallel (default: "greedy")
+            screening_sample_size: Number of segments aligned against every transcript candidate (transcript ID
+                and format) to estimate its median CER before the full alignment. Candidates that certainly
+                cannot be selected are not aligned in full, so screening can change the selected candidate
+                when the confidence intervals are wrong. None disables screening (default: None)
+            screening_confidence: Confidence level of the median CER intervals of the screening (default: 0.99)
+            alignment_workers: Number of processes that preprocess, screen and align the transcript candidates of a
+                video concurrently. The segments are sent to every process once, at most alignment_workers
+                results are pending at a time, and results are selected in candidate order, so the selection
+                does not depend on the completion order. html_processor must be picklable, i.e. a module-level
+                function (default: 1, i.e. sequential in the calling process)
+            streaming_alignment: Whether to align the transcript candidates while the audio is transcribed, each in
+                a thread that consumes the segments as their ASR batch finishes. Applies to videos without cached
+                segments and aligns every candidate without screening; only the greedy engine aligns
+                incrementally (default: False)
+            vad_onnx: Whether to run Silero VAD with ONNX Runtime instead of torch, e.g. on CPU-only nodes (default: False)
+            streaming_vad: Whether to run the VAD over chunks of the audio and decode each segment separately for the ASR,
+                so that memory does not grow with the length of the recording. Not supported with with_pydub_silences
+                (default: False)
+            batch_seconds: Audio seconds per ASR batch, counting every segment as long as the longest one in its batch.
+                If given, segments of similar duration are batched up to this budget instead of batch_size segments
+                in temporal order, and batch_size is ignored. Tune it per GPU type with the printed padding waste and
+                segments/s (default: None)
+            asr_devices: Devices of a pool of ASR worker processes, each with its own model, e.g. ["cuda:0", "cuda:1"]
+                or ["cpu"] * 4, instead of one model in this process. The batches of a recording are spread over the
+                workers, which read the decoded audio from shared memory. Not supported with streaming_vad (default: None)
+            asr_threads_per_worker: Number of CPU threads of every ASR worker (default: None, i.e. the torch default)
+            asr_server_address: Unix socket path or host:port of a local ASR server (python -m
+                parliament_transcript_aligner.audio_processing.asr_server) that owns the model and batches the
+                segments of several pipelines together, instead of loading the model in this process (default: None)
+            asr_backend: ASR backend ("hf": Whisper through a Hugging Face pipeline, on GPU if available;
+                "int8-cpu": Whisper with int8-quantized weights on CPU; "stub": deterministic stand-in for
+                tests) (default: "hf")
+            prefetch_videos: Number of videos prepared ahead of the ASR. If > 0, process_all and process_subset run
+                the videos through three concurrent stages: a CPU thread converts, decodes and segments the audio
+                and preprocesses the transcripts of the next videos, the ASR transcribes the current video, and
+                another thread aligns and saves the previous one. At most prefetch_videos + 2 decoded recordings
+                are in memory. Prints the utilization of every stage and the throughput in audio hours per hour.
+                Not supported with streaming_alignment (default: 0, i.e. one video after the other)
         """
         self.base_dir = Path(base_dir)
         self.csv_path = Path(csv_path)
@@ -106,6 +173,11 @@ class AlignmentPipeline:
         self.with_diarization = with_diarization
         self.language = language
         self.batch_size = batch_size
+        self.batch_seconds = batch_seconds
+        self.asr_devices = asr_devices
+        self.asr_threads_per_worker = asr_threads_per_worker
+        self.asr_server_address = asr_server_address
+        self.asr_backend = asr_backend
         self.abbreviations = abbreviations
         self.html_processor = html_processor
         self.supabase_logging_enabled = supabase_logging_enabled
@@ -114,6 +186,16 @@ class AlignmentPipeline:
         self.supabase_environment_file_path = supabase_environment_file_path
         self.parliament_id = parliament_id
         self.with_pydub_silences = with_pydub_silences
+        self.vad_onnx = vad_onnx
+        self.streaming_vad = streaming_vad
+        self.alignment_engine = alignment_engine
+        self.screening_sample_size = screening_sample_size
+        self.screening_confidence = screening_confidence
+        self.alignment_workers = alignment_workers
+        self.streaming_alignment = streaming_alignment
+        if prefetch_videos and streaming_alignment:
+            raise ValueError("prefetch_videos aligns a video after its transcription and is not supported with streaming_alignment")
+        self.prefetch_videos = prefetch_videos
         # Default directories if not specified
         self.audio_dirs = audio_dirs or [
             "downloaded_audio/mp4_converted",
@@ -162,7 +244,9 @@ class AlignmentPipeline:
         
         # Initialize components
         self.audio_segmenter = self._initialize_audio_segmenter()
-        self.transcript_aligner = TranscriptAligner()
+        # Candidates are aligned in parallel with alignment_workers, the anchored engine does not start a pool
+        self.transcript_aligner = TranscriptAligner(engine=self.alignment_engine, language=self.language,
+                                                    anchored_workers=1)
         
         # Create output directories
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -178,7 +262,7 @@ class AlignmentPipeline:
         vad_pipeline = None #initialize_vad_pipeline(hf_cache_dir=self.hf_cache_dir, hf_token=self.hf_token)
         diarization_pipeline = None # initialize_diarization_pipeline(hf_cache_dir=self.hf_cache_dir, hf_token=self.hf_token)
         logging.warning("Diarization pipeline and VAD pipeline not initialized!!! We did this because of the weights only problem")
-        return AudioSegmenter(vad_pipeline, diarization_pipeline, hf_cache_dir=self.hf_cache_dir, with_diarization=self.with_diarization, language=self.language, batch_size=self.batch_size, supabase_client=self.supabase_client, with_pydub_silences=self.with_pydub_silences, wav_directory=self.wav_dir, delete_wav_files=self.delete_wav_files)
+        return AudioSegmenter(vad_pipeline, diarization_pipeline, hf_cache_dir=self.hf_cache_dir, with_diarization=self.with_diarization, language=self.language, batch_size=self.batch_size, supabase_client=self.supabase_client, with_pydub_silences=self.with_pydub_silences, vad_onnx=self.vad_onnx, streaming_vad=self.streaming_vad, batch_seconds=self.batch_seconds, asr_devices=self.asr_devices, asr_threads_per_worker=self.asr_threads_per_worker, asr_server_address=self.asr_server_address, asr_backend=self.asr_backend, wav_directory=self.wav_dir, delete_wav_files=self.delete_wav_files)
     
     def _load_csv_metadata(self) -> Dict[str, List[str]]:
         """
@@ -337,35 +421,107 @@ class AlignmentPipeline:
         
         return segments
     
-    def _preprocess_transcript(self, transcript_path: Path, format_type: str) -> str:
+    def _segment_audio_and_align(self,
+                                 audio_path: Path,
+                                 video_id: str,
+                                 transcript_texts: Dict[Tuple[str, str], str]
+                                 ) -> Dict[Tuple[str, str], List[AlignedTranscript]]:
         """
-        Preprocess a transcript file using appropriate preprocessor.
+        Segment and transcribe audio while aligning the transcript candidates, and cache the segments.
+        
+        The ASR runs in the calling thread. Every candidate is aligned in its own thread,
+        which receives the segments through a queue as soon as their ASR batch is finished,
+        so the alignment mostly overlaps with the transcription.
         
         Args:
-            transcript_path: Path to the transcript file
-            format_type: The format type (pdf, html, txt, srt)
+            audio_path: Path to the audio file
+            video_id: The video ID for caching
+            transcript_texts: Preprocessed transcript text of each (transcript_id, format) candidate
             
         Returns:
-            The preprocessed text
+            Aligned segments of each candidate
         """
-        print(f"Preprocessing {format_type} transcript: {transcript_path}")
-        
-        # Create preprocessor config
-        config = {}
-        
-        # Add HTML processor to config if available and this is an HTML file
-        if format_type == 'html' and self.html_processor:
-            config['html_processor'] = self.html_processor
-            print(f"Using custom HTML processor for {transcript_path}")
-        
-        # Use the factory to create an appropriate preprocessor
-        preprocessor = create_preprocessor(str(transcript_path), config=config)
-        if self.abbreviations:
-            preprocessor.abbreviations = self.abbreviations
+        print(f"Segmenting audio for {video_id} while aligning {len(transcript_texts)} transcript candidates")
+        segment_queues = {candidate: queue.Queue() for candidate in transcript_texts}
+        alignments = {}
+        errors = []
+
+        def align(candidate: Tuple[str, str]) -> None:
+            # The candidates already run concurrently, so the anchored engine gets one worker each
+            aligner = TranscriptAligner(engine=self.alignment_engine, language=self.language, anchored_workers=1)
+            received_all = False
+
+            def received_segments() -> Iterator[TranscribedSegment]:
+                nonlocal received_all
+                yield from _iter_queue(segment_queues[candidate])
+                received_all = True
+
+            try:
+                aligned_segments = aligner.align_transcript(received_segments(), transcript_texts[candidate])
+                print(f"Alignment stats of {candidate[0]} ({candidate[1]}): {aligner.stats.to_dict()}")
+                alignments[candidate] = [segment for segment in aligned_segments if segment is not None]
+            except Exception as e:
+                print(f"Error aligning transcript {candidate[0]} ({candidate[1]}): {e}")
+                traceback.print_exc()
+                errors.append(e)
+                # Keep consuming, so that the queue does not grow until the transcription ends. The global and
+                # anchored engines read the whole queue before aligning, then the sentinel is already consumed.
+                if not received_all:
+                    for _ in _iter_queue(segment_queues[candidate]):
+                        pass
+
+        threads = [threading.Thread(target=align, args=(candidate,), daemon=True) for candidate in transcript_texts]
+        for thread in threads:
+            thread.start()
+
+        segments = []
+        try:
+            for segment in self.audio_segmenter.iter_segment_and_transcribe(str(audio_path), video_id=video_id):
+                segments.append(segment)
+                for segment_queue in segment_queues.values():
+                    segment_queue.put(segment)
+        finally:
+            for segment_queue in segment_queues.values():
+                segment_queue.put(None)
+            transcription_end_time = time.time()
+            for thread in threads:
+                thread.join()
+        print(f"Alignment finished {time.time() - transcription_end_time} seconds after the transcription")
+        if errors:
+            raise errors[0]
+
+        # Cache results
+        print(f"Caching segments for {video_id}")
+        save_transcribed_segments(segments, self._get_cache_path(video_id))
+
+        return alignments
+
+    def _update_best_modalities(self,
+                                best_modalities: Dict[str, Dict[str, Any]],
+                                alignments: Iterable[Tuple[Tuple[str, str], List[AlignedTranscript]]]) -> None:
+        """
+        Keep the format with the lowest median CER of every transcript ID.
         
-        # Preprocess the transcript
-        return preprocessor.preprocess(str(transcript_path))
-    
+        Args:
+            best_modalities: Best format of each transcript ID so far, updated in place
+            alignments: Aligned segments of (transcript_id, format) candidates, in candidate order
+        """
+        for (transcript_id, format_type), aligned_segments in alignments:
+            print(f"\nAligned {format_type} format of transcript_id: {transcript_id}")
+            
+            # Calculate CER
+            median_cer = self._calculate_median_cer(aligned_segments)
+            print(f"Median CER for {format_type}: {median_cer:.4f}")
+            
+            # Check if this is the best modality so far
+            best_cer = best_modalities[transcript_id]['cer'] if transcript_id in best_modalities else 1.0
+            if aligned_segments and median_cer < best_cer:
+                best_modalities[transcript_id] = {
+                    'cer': median_cer,
+                    'aligned_segments': aligned_segments,
+                    'format': format_type
+                }
+
     def _calculate_median_cer(self, aligned_segments: List[AlignedTranscript]) -> float:
         """
         Calculate the median CER from aligned segments.
@@ -382,25 +538,85 @@ class AlignmentPipeline:
         cers = [segment.cer for segment in aligned_segments]
         return statistics.median(cers)
     
-    def _align_transcript(self, segments: List[TranscribedSegment], transcript_text: str) -> List[AlignedTranscript]:
+    @contextmanager
+    def _candidate_runner(self, segments: List[TranscribedSegment]) -> Iterator[Callable]:
+        """
+        Provide a function that runs a _CandidateWorker method on many tasks, in this
+        process or in a process pool (see alignment_workers).
+        
+        Args:
+            segments: List of transcribed segments of the video
+            
+        Yields:
+            Function taking the method name and the list of tasks, returning an iterator
+            over the results in task order
+        """
+        worker_args = (
+            segments, self.html_processor, self.abbreviations, self.screening_sample_size, self.screening_confidence
+        )
+        if self.alignment_workers <= 1:
+            worker = _CandidateWorker(self.transcript_aligner, *worker_args)
+            yield lambda method, tasks: (getattr(worker, method)(task) for task in tasks)
+            return
+
+        # The anchored engine must not start a process pool of its own in every worker
+        aligner_config = dict(engine=self.alignment_engine, language=self.language, anchored_workers=1)
+        executor = ProcessPoolExecutor(
+            max_workers=self.alignment_workers,
+            initializer=_init_candidate_worker,
+            initargs=(aligner_config, *worker_args)
+        )
+        try:
+            yield lambda method, tasks: _bounded_ordered_map(
+                executor, _run_candidate_task, [(method, task) for task in tasks], self.alignment_workers
+            )
+        finally:
+            executor.shutdown()
+
+    def _screen_candidates(self,
+                           segments: List[TranscribedSegment],
+                           transcript_texts: Dict[Tuple[str, str], str],
+                           run: Callable) -> set:
         """
-        Align transcribed segments with a transcript.
+        Estimate the median CER of every transcript candidate from a sample of segments and
+        select the candidates that could still be selected by the multi-transcript strategy.
         
         Args:
             segments: List of transcribed segments
-            transcript_text: The preprocessed transcript text
+            transcript_texts: Preprocessed transcript text of each (transcript_id, format) candidate
+            run: Task runner of _candidate_runner
             
         Returns:
-            List of aligned transcript segments
+            The (transcript_id, format) candidates to align in full
         """
-        print(f"Aligning transcript with {len(segments)} segments")
-        try:
-            return self.transcript_aligner.align_transcript(segments, transcript_text)
-        except Exception as e:
-            print(f"Error aligning transcript: {e}")
-            traceback.print_exc()
-            raise e
-    
+        sample_size = self.screening_sample_size
+        if not sample_size or len(transcript_texts) < 2 or len(segments) <= 2 * sample_size:
+            return set(transcript_texts)
+
+        print(f"\nScreening {len(transcript_texts)} transcript candidates with {sample_size} segments")
+        screening_start_time = time.time()
+        estimates = {}
+        unscreened = set()
+        for candidate, estimate in zip(transcript_texts, run("screen", list(transcript_texts.values()))):
+            if estimate is None:
+                unscreened.add(candidate)
+                continue
+            estimates[candidate] = estimate
+            print(f"Screening {candidate[0]} ({candidate[1]}): median CER {estimate.median:.4f} "
+                  f"[{estimate.lower:.4f}, {estimate.upper:.4f}]")
+
+        selected = candidates_to_align(
+            estimates,
+            {candidate: candidate[0] for candidate in estimates},
+            self.multi_transcript_strategy,
+            self.cer_threshold
+        ) | unscreened
+        for candidate in transcript_texts:
+            if candidate not in selected:
+                print(f"Skipping {candidate[0]} ({candidate[1]}): cannot be selected")
+        print(f"Screening duration: {time.time() - screening_start_time} seconds")
+        return selected
+
     def _process_single_audio(self, video_id: str, metadata: Dict[str, List[str]]) -> Optional[Dict[str, Any]]:
         """
         Process a single audio file and its potential transcripts.
@@ -415,6 +631,44 @@ class AlignmentPipeline:
         """
         print(f"\nProcessing audio file for video_id: {video_id}")
         
+        found = self._find_candidates(video_id, metadata)
+        if found is None:
+            return None
+        audio_path, candidates = found
+
+        # Level 1: Find best modality for each transcript ID
+        if self.streaming_alignment and not (self.use_cache and self._get_cache_path(video_id).exists()):
+            best_modalities = {}
+            transcript_texts = {
+                (transcript_id, format_type):
+                    preprocess_transcript(file_path, format_type, self.html_processor, self.abbreviations)
+                for transcript_id, format_type, file_path in candidates
+            }
+            alignments = self._segment_audio_and_align(audio_path, video_id, transcript_texts)
+            self._update_best_modalities(
+                best_modalities, ((candidate, alignments[candidate]) for candidate in transcript_texts)
+            )
+        else:
+            # Segment audio
+            audio_segments = self._segment_audio(audio_path, video_id)
+            best_modalities = self._align_candidates(audio_segments, candidates)
+
+        return self._select_transcripts(video_id, audio_path, best_modalities)
+
+    def _find_candidates(self,
+                         video_id: str,
+                         metadata: Dict[str, List[str]]) -> Optional[Tuple[Path, List[Tuple[str, str, Path]]]]:
+        """
+        Find the audio file of a video and all format modalities of its potential transcripts.
+        
+        Args:
+            video_id: The video ID
+            metadata: The metadata dictionary
+            
+        Returns:
+            The audio path and the (transcript_id, format, file path) candidates, or None if the
+            audio file or the transcript IDs were not found
+        """
         # Find audio file
         audio_path = self._find_audio_file(video_id)
         if not audio_path:
@@ -430,61 +684,70 @@ class AlignmentPipeline:
             return None
             
         print(f"Found {len(transcript_ids)} potential transcript IDs")
-            
-        # Segment audio
-        audio_segments = self._segment_audio(audio_path, video_id)
-        
-        # Level 1: Find best modality for each transcript ID
-        best_modalities = {}
         
-        for transcript_id in transcript_ids:
-            print(f"\nProcessing transcript_id: {transcript_id}")
-            
-            # Find all format modalities
+        # Find all format modalities of all transcript IDs
+        candidates = []
+        for transcript_id in dict.fromkeys(transcript_ids):
             transcript_files = self._find_transcript_files(transcript_id)
             
             if not transcript_files:
                 print(f"No transcript files found for transcript_id: {transcript_id}")
                 continue
                 
-            print(f"Found {len(transcript_files)} format modalities: {', '.join(transcript_files.keys())}")
-                
-            # Process each modality
-            best_cer = 1.0
-            best_aligned = None
-            best_format = None
-            
+            print(f"Found {len(transcript_files)} format modalities for {transcript_id}: {', '.join(transcript_files.keys())}")
             for format_type, file_path in transcript_files.items():
-                print(f"Processing {format_type} format")
-                
-                # Preprocess transcript
-                transcript_text = self._preprocess_transcript(file_path, format_type)
-                
-                # Align with audio segments
-                aligned_segments = self._align_transcript(audio_segments, transcript_text)
+                candidates.append((transcript_id, format_type, file_path))
+        return audio_path, candidates
 
-                # remove all none elements from aligned_segments
-                aligned_segments = [segment for segment in aligned_segments if segment is not None]
-                #TODO: maybe we should add logging here if we have removed many elements
-                
-                # Calculate CER
-                median_cer = self._calculate_median_cer(aligned_segments)
-                print(f"Median CER for {format_type}: {median_cer:.4f}")
-                
-                # Check if this is the best modality so far
-                if median_cer < best_cer:
-                    best_cer = median_cer
-                    best_aligned = aligned_segments
-                    best_format = format_type
+    def _align_candidates(self,
+                          segments: List[TranscribedSegment],
+                          candidates: List[Tuple[str, str, Path]],
+                          transcript_texts: Optional[Dict[Tuple[str, str], str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Screen and align the transcript candidates and find the best modality of each transcript ID.
+        
+        Args:
+            segments: List of transcribed segments of the video
+            candidates: The (transcript_id, format, file path) candidates
+            transcript_texts: Preprocessed transcript text of each (transcript_id, format) candidate,
+                preprocessed here if not given
             
-            # Store best modality
-            if best_aligned:
-                print(f"Best modality for {transcript_id}: {best_format} with CER {best_cer:.4f}")
-                best_modalities[transcript_id] = {
-                    'cer': best_cer,
-                    'aligned_segments': best_aligned,
-                    'format': best_format
+        Returns:
+            Best format of each transcript ID with its CER and aligned segments
+        """
+        best_modalities = {}
+        with self._candidate_runner(segments) as run:
+            if transcript_texts is None:
+                texts = run("preprocess", [(file_path, format_type) for _, format_type, file_path in candidates])
+                transcript_texts = {
+                    (transcript_id, format_type): text
+                    for (transcript_id, format_type, _), text in zip(candidates, texts)
                 }
+            candidates_to_process = self._screen_candidates(segments, transcript_texts, run)
+            candidates_to_process = [
+                candidate for candidate in transcript_texts if candidate in candidates_to_process
+            ]
+            results = run("align", [transcript_texts[candidate] for candidate in candidates_to_process])
+            self._update_best_modalities(best_modalities, zip(candidates_to_process, results))
+        return best_modalities
+
+    def _select_transcripts(self,
+                            video_id: str,
+                            audio_path: Path,
+                            best_modalities: Dict[str, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Select the best transcript(s) across all transcript IDs and save them.
+        
+        Args:
+            video_id: The video ID
+            audio_path: Path to the audio file
+            best_modalities: Best format of each transcript ID (see _align_candidates)
+            
+        Returns:
+            Results dictionary or None if no transcript was selected
+        """
+        for transcript_id, data in best_modalities.items():
+            print(f"Best modality for {transcript_id}: {data['format']} with CER {data['cer']:.4f}")
         
         if not best_modalities:
             print(f"No valid alignments found for any transcript")
@@ -592,6 +855,92 @@ class AlignmentPipeline:
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(summary_results, f, indent=2, ensure_ascii=False)
     
+    def _process_pipelined(self, video_ids: List[str], metadata: Dict[str, List[str]], skip_existing: bool) -> None:
+        """
+        Process videos in three concurrent stages (see prefetch_videos and StagedExecutor):
+        
+        1. prepare (CPU): find the files, preprocess the transcripts and convert, decode and
+           segment the audio (or load the cached segments) of the next videos
+        2. asr: transcribe the current video and cache its segments
+        3. align (CPU): screen, align, select and save the transcripts of the previous video
+        
+        Args:
+            video_ids: Video IDs to process, in order
+            metadata: The metadata dictionary
+            skip_existing: Whether to skip videos that already exist in the Supabase database
+        """
+        executor = StagedExecutor([
+            Stage("prepare", partial(self._prepare_video, metadata=metadata, skip_existing=skip_existing)),
+            Stage("asr", self._transcribe_video, queue_size=self.prefetch_videos),
+            Stage("align", self._align_video),
+        ], on_error=self._video_failed)
+        audio_durations = executor.run(video_ids)
+
+        print(f"\n{summarize_stages(executor.stats, executor.wall_time)}")
+        audio_hours = sum(audio_durations) / 3600
+        wall_hours = executor.wall_time / 3600
+        print(f"Throughput: {audio_hours / wall_hours if wall_hours else 0.0:.2f} audio hours per hour "
+              f"({len(audio_durations)} videos, {audio_hours:.2f} hours of audio in {wall_hours:.2f} hours)")
+
+    def _prepare_video(self, video_id: str, metadata: Dict[str, List[str]], skip_existing: bool) -> Optional["_VideoJob"]:
+        """Stage 1 of _process_pipelined: everything before the ASR. Returns None to skip the video."""
+        if video_id not in metadata:
+            print(f"Video ID {video_id} not found in metadata")
+            return None
+        if self.supabase_client:
+            is_new = self.supabase_client.start_video_alignment(video_id)
+            if skip_existing and not is_new:
+                print(f"Video {video_id} already exists in the database, skipping")
+                return None
+
+        print(f"\nPreparing audio file for video_id: {video_id}")
+        found = self._find_candidates(video_id, metadata)
+        if found is None:
+            return None
+        audio_path, candidates = found
+        job = _VideoJob(video_id, audio_path, candidates)
+        job.transcript_texts = {
+            (transcript_id, format_type):
+                preprocess_transcript(file_path, format_type, self.html_processor, self.abbreviations)
+            for transcript_id, format_type, file_path in candidates
+        }
+
+        cache_path = self._get_cache_path(video_id)
+        if self.use_cache and cache_path.exists():
+            print(f"Using cached segments for {video_id}")
+            job.segments = load_transcribed_segments(cache_path)
+            job.duration = job.segments[-1].end if job.segments else 0.0
+        else:
+            job.prepared = self.audio_segmenter.prepare_audio(str(audio_path), video_id=video_id)
+            job.duration = job.prepared.duration
+        return job
+
+    def _transcribe_video(self, job: "_VideoJob") -> "_VideoJob":
+        """Stage 2 of _process_pipelined: transcribe the prepared audio and cache the segments."""
+        if job.prepared is not None:
+            print(f"Transcribing audio for {job.video_id}")
+            job.segments = list(self.audio_segmenter.iter_transcribe(job.prepared))
+            job.prepared = None  # Free the decoded audio before the alignment
+
+            print(f"Caching segments for {job.video_id}")
+            save_transcribed_segments(job.segments, self._get_cache_path(job.video_id))
+        return job
+
+    def _align_video(self, job: "_VideoJob") -> float:
+        """Stage 3 of _process_pipelined: align, select and save the transcripts. Returns the audio duration."""
+        print(f"\nAligning transcripts for video_id: {job.video_id}")
+        best_modalities = self._align_candidates(job.segments, job.candidates, job.transcript_texts)
+        self._select_transcripts(job.video_id, job.audio_path, best_modalities)
+        return job.duration
+
+    def _video_failed(self, item: Union[str, "_VideoJob"], stage: str, error: Exception) -> None:
+        """Report a video that failed in a stage of _process_pipelined, the other videos continue."""
+        video_id = item if isinstance(item, str) else item.video_id
+        print(f"Error processing video {video_id} ({stage}): {error}")
+        traceback.print_exc()
+        if self.supabase_client:
+            self.supabase_client.fail_video_alignment(video_id, str(error))
+
     def process_all(self) -> None:
         """Process all audio files found in the metadata."""
         print(f"Loading metadata from {self.csv_path}")
@@ -599,6 +948,9 @@ class AlignmentPipeline:
         
         print(f"Found {len(metadata)} video IDs in metadata")
 
+        if self.prefetch_videos > 0:
+            self._process_pipelined(list(metadata), metadata, skip_existing=True)
+            return
         
         for video_id in metadata:
             if self.supabase_client:
@@ -628,7 +980,9 @@ class AlignmentPipeline:
         metadata = self._load_csv_metadata()
         print(f"Found {len(metadata)} video IDs in metadata")
         
-        
+        if self.prefetch_videos > 0:
+            self._process_pipelined(video_ids, metadata, skip_existing=False)
+            return
         
         for video_id in video_ids:
             if video_id in metadata:
@@ -643,3 +997,133 @@ class AlignmentPipeline:
                         self.supabase_client.fail_video_alignment(video_id, str(e))
             else:
                 print(f"Video ID {video_id} not found in metadata")
+
+
+def preprocess_transcript(transcript_path: Path,
+                          format_type: str,
+                          html_processor: Optional[Callable] = None,
+                          abbreviations: Optional[Dict[str, str]] = None) -> str:
+    """
+    Preprocess a transcript file using appropriate preprocessor.
+    
+    Args:
+        transcript_path: Path to the transcript file
+        format_type: The format type (pdf, html, txt, srt)
+        html_processor: Custom function for processing HTML transcripts
+        abbreviations: Dictionary mapping abbreviations to their full forms
+        
+    Returns:
+        The preprocessed text
+    """
+    print(f"Preprocessing {format_type} transcript: {transcript_path}")
+    
+    # Create preprocessor config
+    config = {}
+    
+    # Add HTML processor to config if available and this is an HTML file
+    if format_type == 'html' and html_processor:
+        config['html_processor'] = html_processor
+        print(f"Using custom HTML processor for {transcript_path}")
+    
+    # Use the factory to create an appropriate preprocessor
+    preprocessor = create_preprocessor(str(transcript_path), config=config)
+    if abbreviations:
+        preprocessor.abbreviations = abbreviations
+    
+    # Preprocess the transcript
+    return preprocessor.preprocess(str(transcript_path))
+
+
+@dataclass
+class _VideoJob:
+    """A video passed between the stages of AlignmentPipeline._process_pipelined."""
+    video_id: str
+    audio_path: Path
+    candidates: List[Tuple[str, str, Path]]
+    transcript_texts: Optional[Dict[Tuple[str, str], str]] = None
+    prepared: Optional[PreparedAudio] = None  # Decoded and segmented audio, until it is transcribed
+    segments: Optional[List[TranscribedSegment]] = None
+    duration: float = 0.0
+
+
+class _CandidateWorker:
+    """
+    Runs the CPU-only steps for the transcript candidates of one video: preprocessing,
+    screening on a sample of segments and full alignment. Used in the calling process
+    or in the worker processes of AlignmentPipeline (see alignment_workers), which
+    receive the segments once.
+    """
+
+    def __init__(self,
+                 aligner: TranscriptAligner,
+                 segments: List[TranscribedSegment],
+                 html_processor: Optional[Callable],
+                 abbreviations: Optional[Dict[str, str]],
+                 screening_sample_size: Optional[int],
+                 screening_confidence: float):
+        self.aligner = aligner
+        self.segments = segments
+        self.html_processor = html_processor
+        self.abbreviations = abbreviations
+        self.screening_confidence = screening_confidence
+        self.sample = stratified_sample(segments, screening_sample_size) if screening_sample_size else []
+
+    def preprocess(self, task: Tuple[Path, str]) -> str:
+        transcript_path, format_type = task
+        return preprocess_transcript(transcript_path, format_type, self.html_processor, self.abbreviations)
+
+    def screen(self, transcript_text: str):
+        aligned_segments = self.aligner.align_transcript(self.sample, transcript_text)
+        return median_confidence_interval(
+            [segment.cer for segment in aligned_segments if segment is not None],
+            confidence=self.screening_confidence
+        )
+
+    def align(self, transcript_text: str) -> List[AlignedTranscript]:
+        print(f"Aligning transcript with {len(self.segments)} segments using the {self.aligner.engine} engine")
+        try:
+            alignment_start_time = time.time()
+            aligned_segments = self.aligner.align_transcript(self.segments, transcript_text)
+            print(f"Alignment duration: {time.time() - alignment_start_time} seconds")
+            print(f"Alignment stats: {self.aligner.stats.to_dict()}")
+        except Exception as e:
+            print(f"Error aligning transcript: {e}")
+            traceback.print_exc()
+            raise e
+        # remove all none elements from aligned_segments
+        #TODO: maybe we should add logging here if we have removed many elements
+        return [segment for segment in aligned_segments if segment is not None]
+
+
+# Worker of the current process when the candidates are processed with a process pool
+_candidate_worker: Optional[_CandidateWorker] = None
+
+
+def _init_candidate_worker(aligner_config: Dict[str, Any], *worker_args) -> None:
+    global _candidate_worker
+    _candidate_worker = _CandidateWorker(TranscriptAligner(**aligner_config), *worker_args)
+
+
+def _run_candidate_task(task: Tuple[str, Any]):
+    method, argument = task
+    return getattr(_candidate_worker, method)(argument)
+
+
+def _iter_queue(segment_queue: queue.Queue) -> Iterator[TranscribedSegment]:
+    """Yield the segments put into the queue until the None sentinel."""
+    while True:
+        segment = segment_queue.get()
+        if segment is None:
+            return
+        yield segment
+
+
+def _bounded_ordered_map(executor: ProcessPoolExecutor, function: Callable, tasks: List[Any], max_pending: int):
+    """Like executor.map, but with at most max_pending tasks submitted and not yet consumed."""
+    pending = deque()
+    for task in tasks:
+        pending.append(executor.submit(function, task))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
@@ -0,0 +1,113 @@
+"""
+Candidate Screening
+
+Helpers to estimate the median CER of a transcript candidate from a sample of
+ASR segments, so that candidates that can neither be selected nor pass the CER
+threshold are not aligned in full.
+"""
+
+import math
+import random
+import statistics
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Sequence, Set
+
+from ..data_models.models import TranscribedSegment
+
+
+@dataclass
+class MedianEstimate:
+    """Median CER of a candidate estimated from a sample, with a confidence interval."""
+    median: float
+    lower: float
+    upper: float
+    sample_size: int
+
+
+def stratified_sample(segments: List[TranscribedSegment], sample_size: int, seed: int = 0) -> List[TranscribedSegment]:
+    """Draw one segment from each of sample_size equally long stretches of the session.
+
+    Args:
+        segments: ASR segments in temporal order
+        sample_size: Number of segments to draw
+        seed: Random seed, so that every candidate is screened with the same sample
+
+    Returns:
+        Sampled segments in temporal order (all segments if there are not more than sample_size)
+    """
+    if len(segments) <= sample_size:
+        return list(segments)
+    rnd = random.Random(seed)
+    boundaries = [round(stratum * len(segments) / sample_size) for stratum in range(sample_size + 1)]
+    return [segments[rnd.randrange(start, end)] for start, end in zip(boundaries[:-1], boundaries[1:])]
+
+
+def median_confidence_interval(values: Sequence[float], confidence: float = 0.99) -> Optional[MedianEstimate]:
+    """Estimate the median with a distribution-free confidence interval.
+
+    The interval is bounded by order statistics of the sample: the number of
+    values below the true median follows a Binomial(n, 1/2) distribution.
+
+    Args:
+        values: Sampled values
+        confidence: Confidence level of the interval
+
+    Returns:
+        MedianEstimate, or None for an empty sample
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    n = len(values)
+    # Largest rank j with P(X < j) <= alpha / 2 for X ~ Binomial(n, 1/2)
+    alpha_half = (1 - confidence) / 2
+    rank = 0
+    cumulative = 0.0
+    while rank < n // 2:
+        cumulative += math.comb(n, rank) / 2 ** n
+        if cumulative > alpha_half:
+            break
+        rank += 1
+    return MedianEstimate(
+        median=statistics.median(values),
+        lower=values[rank],
+        upper=values[n - 1 - rank],
+        sample_size=n
+    )
+
+
+def candidates_to_align(estimates: Dict[Hashable, MedianEstimate],
+                        groups: Dict[Hashable, Hashable],
+                        strategy: str,
+                        cer_threshold: float) -> Set[Hashable]:
+    """Select the candidates that could still be selected by the multi-transcript strategy.
+
+    A candidate is dropped if it is certainly worse than another candidate it
+    competes with (its lower bound is above the other's upper bound), or, unless
+    all transcripts are kept anyway, if it certainly misses the CER threshold.
+    The modalities of a transcript ID always compete with each other; with
+    "best_only" all candidates compete.
+
+    Args:
+        estimates: Median CER estimate of each candidate
+        groups: Transcript ID of each candidate
+        strategy: Multi-transcript strategy ("best_only", "threshold_all", "force_all")
+        cer_threshold: Maximum acceptable median CER
+
+    Returns:
+        The candidates to align in full
+    """
+    competitors: Dict[Hashable, float] = {}
+    for candidate, estimate in estimates.items():
+        group = groups[candidate] if strategy != "best_only" else None
+        competitors[group] = min(competitors.get(group, math.inf), estimate.upper)
+
+    selected = set()
+    for candidate, estimate in estimates.items():
+        group = groups[candidate] if strategy != "best_only" else None
+        if estimate.lower > competitors[group]:
+            continue
+        if strategy != "force_all" and estimate.lower > cer_threshold:
+            continue
+        selected.add(candidate)
+    return selected
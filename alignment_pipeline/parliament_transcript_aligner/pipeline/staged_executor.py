@@ -0,0 +1,147 @@
+"""
+Staged Executor
+
+Runs many items through a sequence of stages, every stage in its own thread,
+connected by bounded queues. While the ASR transcribes video N, the CPU
+preparation of video N+1 and the alignment of video N-1 run concurrently. The
+queue sizes bound how far a stage can run ahead, and with that the number of
+decoded recordings in memory.
+"""
+
+import queue
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Optional
+
+# Sentinel passed down the stages after the last item
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    """A step of the StagedExecutor.
+
+    The function receives the output of the previous stage (or an input item for
+    the first stage). Returning None drops the item, e.g. a video without audio file.
+    """
+    name: str
+    function: Callable[[Any], Any]
+    queue_size: int = 1  # Items waiting for this stage
+
+
+@dataclass
+class StageStats:
+    """Time a stage spent working, waiting for input and waiting for room in the next queue."""
+    name: str
+    items: int = 0
+    busy_time: float = 0.0
+    starved_time: float = 0.0
+    blocked_time: float = 0.0
+
+    def utilization(self, wall_time: float) -> float:
+        return self.busy_time / wall_time if wall_time else 0.0
+
+
+class StagedExecutor:
+    """Pipelines items through stages that run concurrently, one thread per stage.
+
+    Every stage processes the items in input order, one at a time. A stage that
+    is much slower than the others (e.g. the ASR on the GPU) is busy most of the
+    time, while the other stages wait for it (blocked) or for input (starved).
+    """
+
+    def __init__(self, stages: List[Stage], on_error: Optional[Callable[[Any, str, Exception], None]] = None):
+        """Initialize the executor.
+
+        Args:
+            stages: Stages in processing order
+            on_error: Called with the item, the stage name and the exception when a stage function raises, inside the
+                except block. The item is dropped and the other items continue, also if on_error raises
+                (default: print the traceback)
+        """
+        self.stages = stages
+        self.on_error = on_error
+        self.stats: List[StageStats] = [StageStats(stage.name) for stage in stages]
+        self.wall_time = 0.0
+
+    def run(self, items: Iterable[Any]) -> List[Any]:
+        """Run the items through all stages.
+
+        Args:
+            items: Inputs of the first stage
+
+        Returns:
+            Outputs of the last stage that are not None, in input order
+        """
+        self.stats = [StageStats(stage.name) for stage in self.stages]
+        queues = [queue.Queue(maxsize=max(stage.queue_size, 1)) for stage in self.stages] + [queue.Queue()]
+        threads = [
+            threading.Thread(target=self._work, args=(index, queues[index], queues[index + 1]), daemon=True)
+            for index in range(len(self.stages))
+        ]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for item in items:
+            queues[0].put(item)
+        queues[0].put(_DONE)
+
+        outputs = []
+        while True:
+            output = queues[-1].get()
+            if output is _DONE:
+                break
+            outputs.append(output)
+        for thread in threads:
+            thread.join()
+        self.wall_time = time.perf_counter() - start
+        return outputs
+
+    def _work(self, index: int, inbox: queue.Queue, outbox: queue.Queue) -> None:
+        stage = self.stages[index]
+        stats = self.stats[index]
+        while True:
+            wait_start = time.perf_counter()
+            item = inbox.get()
+            stats.starved_time += time.perf_counter() - wait_start
+            if item is _DONE:
+                outbox.put(_DONE)
+                return
+
+            busy_start = time.perf_counter()
+            try:
+                output = stage.function(item)
+            except Exception as e:
+                output = None
+                self._handle_error(item, stage.name, e)
+            stats.busy_time += time.perf_counter() - busy_start
+            stats.items += 1
+
+            if output is not None:
+                wait_start = time.perf_counter()
+                outbox.put(output)
+                stats.blocked_time += time.perf_counter() - wait_start
+
+    def _handle_error(self, item: Any, stage_name: str, error: Exception) -> None:
+        """Report a failed item, an error of on_error itself must not stop the stage."""
+        if self.on_error is not None:
+            try:
+                self.on_error(item, stage_name, error)
+                return
+            except Exception as e:
+                print(f"Error handling the error in stage {stage_name}: {e}")
+                traceback.print_exc()
+        print(f"Error in stage {stage_name}: {error}")
+        traceback.print_exc()
+
+
+def summarize_stages(stats: List[StageStats], wall_time: float) -> str:
+    """Summarize the utilization of every stage, e.g. to find the stage that limits the throughput."""
+    lines = [f"Stages ({wall_time:.1f}s wall time):"]
+    for stage in stats:
+        lines.append(f"  {stage.name}: {stage.items} items, busy {stage.busy_time:.1f}s "
+                     f"({stage.utilization(wall_time):.0%}), waiting for input {stage.starved_time:.1f}s, "
+                     f"waiting for the next stage {stage.blocked_time:.1f}s")
+    return "\n".join(lines)
@@ -1,44 +1,292 @@
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, asdict, replace
+from typing import List, Optional, Dict, Any, Union, Tuple, Iterable, Iterator
+import math
+import os
 import Levenshtein
+import numpy as np
 from tqdm import tqdm
 import heapq
 
 from ..data_models.models import TranscribedSegment, AlignedTranscript
+from .anchor_index import NGramAnchorIndex
+from .global_alignment import intern_tokens, anchor_guide, banded_monotonic_alignment, longest_increasing_subsequence
+from .edit_distance import BitParallelPattern, batch_distances
+from .transcript_view import TranscriptView
+from .cer_cache import WindowCERCache
+from .position_prior import SpeechRatePositionPrior
+from .normalization import TextNormalizer
+
+ALIGNMENT_ENGINES = ("greedy", "global", "anchored")
+
+# Below this ASR text length (~15 words), scoring the windows with one batched native call is faster
+# than the shared-start bit-parallel sweep (see benchmarks/benchmark_cer_batch.py)
+_INCREMENTAL_MIN_ASR_CHARS = 80
+
+# Below this number of segments per worker, the anchored engine aligns in the calling process: starting the
+# process pool would cost more than it saves (see benchmarks/benchmark_anchored_alignment.py)
+_ANCHORED_MIN_SEGMENTS_PER_WORKER = 100
+
+
+@dataclass
+class AlignerStats:
+    """Counters collected while aligning one transcript."""
+    segments: int = 0
+    cer_evaluations: int = 0
+    anchor_searches: int = 0
+    anchor_misses: int = 0
+    cer_length_rejections: int = 0  # Bounded evaluations rejected by the length difference alone
+    cer_abandoned: int = 0  # Bounded evaluations abandoned once the distance exceeded the bound
+    cer_cache_hits: int = 0
+    cer_cache_misses: int = 0
+    prior_band_searches: int = 0  # Retries restricted to the band predicted from the speech rate
+    full_rescans: int = 0  # Retries scanning the transcript from its start
+    anchor_segments: int = 0  # Segments fixed as anchors by the "anchored" engine
+    word_evaluations: int = 0  # Windows scored by the word-level region scan
+
+    @property
+    def cer_evaluations_per_segment(self) -> float:
+        return self.cer_evaluations / self.segments if self.segments else 0.0
+
+    @property
+    def cer_cache_hit_rate(self) -> float:
+        lookups = self.cer_cache_hits + self.cer_cache_misses
+        return self.cer_cache_hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        data = asdict(self)
+        data["cer_evaluations_per_segment"] = self.cer_evaluations_per_segment
+        data["cer_cache_hit_rate"] = self.cer_cache_hit_rate
+        return data
+
+    def add(self, counters: Dict[str, int]) -> None:
+        """Add counters collected by another aligner, e.g. in a worker process."""
+        for name, value in counters.items():
+            setattr(self, name, getattr(self, name) + value)
+
 
 class TranscriptAligner:
     def __init__(self, 
                  window_token_margin: int = 30,
                  region_cer_threshold: float = 0.3,
-                 finetune_cer_threshold: float = 0.05):
+                 finetune_cer_threshold: float = 0.05,
+                 use_anchor_index: bool = True,
+                 anchor_ngram_size: int = 3,
+                 engine: str = "greedy",
+                 global_band_width: int = 250,
+                 incremental_fine_tune: bool = False,
+                 bounded_cer: bool = True,
+                 cer_cache_size: Optional[int] = None,
+                 use_position_prior: bool = True,
+                 anchor_cer_threshold: float = 0.1,
+                 anchored_workers: Optional[int] = None,
+                 word_level_search: bool = False,
+                 word_region_threshold: float = 0.3,
+                 normalize_text: bool = True,
+                 expand_numbers: bool = False,
+                 language: str = "en"):
         """Initialize the TranscriptAligner.
         
         Args:
             window_token_margin: Extra tokens to consider on each side of the window
             region_cer_threshold: Maximum allowable Character Error Rate for a region to be considered a good match
             finetune_cer_threshold: Maximum allowable Character Error Rate for early stopping during fine-tuning
+            use_anchor_index: Whether to look up candidate regions in an n-gram anchor index instead of
+                scanning the transcript with sliding windows
+            anchor_ngram_size: Number of words per n-gram in the anchor index
+            engine: Alignment engine. "greedy" matches each segment independently, starting from the end
+                of the previous match. "global" aligns the whole ASR token stream to the transcript in one
+                banded dynamic programming pass and cuts the result at segment boundaries. "anchored" first
+                fixes the segments whose position is unambiguous from n-grams that occur only once in the
+                transcript, then aligns the segments between consecutive anchors greedily, each gap
+                restricted to the transcript span between its anchors and the gaps in parallel.
+            global_band_width: Number of transcript tokens the "global" engine keeps on each side of the
+                band center, which follows unique n-gram anchors between ASR output and transcript
+            incremental_fine_tune: Whether fine-tuning scores all candidate windows in one bit-parallel sweep
+                per region (sharing the DP work of windows with a common start) instead of computing every
+                window's distance from scratch. Both modes return the same matches. Off by default: the sweep
+                computes every window exactly, so the bounded window-by-window search (bounded_cer) is faster
+                (see benchmarks/benchmark_fine_tune.py). Short ASR texts are always scored window by window.
+            bounded_cer: Whether window-by-window searches only compute CERs exactly up to the bound at
+                which a window can still change the result (the current k-th best region, or the current
+                best match), abandoning worse windows early. Does not change the results.
+            cer_cache_size: Number of window CERs kept across segments. The windows of the current segment
+                are always memoized, so the retry from the transcript start and the fallback of
+                find_best_match do not score windows again. 0 only keeps the per-segment memo,
+                None disables caching (default: None, as only ~7% of the lookups hit and the lookups
+                cost more than they save, see benchmarks/benchmark_cer_cache.py)
+            use_position_prior: Whether segments that do not match near the end of the previous match are
+                searched for in the band predicted from their audio time and the speech rate of the
+                segments aligned so far, instead of in the whole transcript
+            anchor_cer_threshold: Maximum Character Error Rate of a segment to be fixed as an anchor
+                by the "anchored" engine
+            anchored_workers: Number of worker processes of the "anchored" engine. None uses one per CPU,
+                1 aligns in the calling process. Sessions with few segments are aligned in the calling process
+                as well. The process pool is started on first use and kept until close() is called
+            word_level_search: Whether the window scan for candidate regions scores windows by their
+                normalized words (integer IDs, vectorized with NumPy) instead of computing their CER.
+                The exact match boundaries are still fine-tuned with the CER.
+            word_region_threshold: Share of ASR words missing from a window at which the word-level
+                scan stops at that window (the counterpart of the CER threshold of the character scan)
+            normalize_text: Whether the transcript and the ASR segments are compared after normalization
+                (lowercase, punctuation removed, see TextNormalizer). Both are split into normalized words
+                with the same function, the transcript once per alignment and every segment once. The
+                human_text, start_idx and end_idx of the results still refer to the original transcript tokens
+            expand_numbers: Whether normalization spells out numbers (requires num2words)
+            language: Language of the transcript as ISO 639-1 code, used to spell out numbers
+
+        Raises:
+            ValueError: If the engine is unknown
         """
+        if engine not in ALIGNMENT_ENGINES:
+            raise ValueError(f"Unknown alignment engine: {engine}. Expected one of {ALIGNMENT_ENGINES}")
         self.window_token_margin = window_token_margin
         self.region_cer_threshold = region_cer_threshold
         self.finetune_cer_threshold = finetune_cer_threshold
+        self.use_anchor_index = use_anchor_index
+        self.anchor_ngram_size = anchor_ngram_size
+        self.engine = engine
+        self.global_band_width = global_band_width
+        self.incremental_fine_tune = incremental_fine_tune
+        self.bounded_cer = bounded_cer
+        self.cer_cache_size = cer_cache_size
+        self.use_position_prior = use_position_prior
+        self.anchor_cer_threshold = anchor_cer_threshold
+        self.anchored_workers = anchored_workers
+        self.word_level_search = word_level_search
+        self.word_region_threshold = word_region_threshold
+        self.normalizer = TextNormalizer(expand_numbers=expand_numbers, language=language) if normalize_text else None
+        self.stats = AlignerStats()
+        # Window CER cache of the transcript currently being aligned
+        self._cer_cache: Optional[WindowCERCache] = None
+        # Process pool of the anchored engine, reused across transcripts
+        self._anchored_executor: Optional[ProcessPoolExecutor] = None
+
+    def close(self) -> None:
+        """Stop the worker processes of the anchored engine, if they were started."""
+        if self._anchored_executor is not None:
+            self._anchored_executor.shutdown()
+            self._anchored_executor = None
+
+    def __enter__(self) -> "TranscriptAligner":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
         
-    def compute_cer(self, asr_text: str, human_text: str) -> float:
-        """Compute Character Error Rate between two strings.
+    def compute_cer(self, asr_text: str, human_text: str, max_cer: Optional[float] = None) -> float:
+        """Compute the Character Error Rate of the ASR text against the human text.
         
         Args:
-            text1: First text string
-            text2: Second text string
+            asr_text: Text from ASR
+            human_text: Text from the human transcript
+            max_cer: Optional bound. If the CER exceeds it, the computation is abandoned
+                early and some value above max_cer is returned instead of the exact CER
             
         Returns:
-            Character Error Rate between 0 and 1
+            Edit distance divided by len(asr_text) (1.0 for an empty ASR text). It can
+            exceed 1 if the human text is much longer than the ASR text
         """
-        distance = Levenshtein.distance(asr_text, human_text)
+        self.stats.cer_evaluations += 1
         asr_len = len(asr_text)  # Length of ASR text. We use this as baseline length for CER
-        return distance / asr_len if asr_len > 0 else 1.0
+        if asr_len == 0:
+            return 1.0
+        if max_cer is None:
+            return Levenshtein.distance(asr_text, human_text) / asr_len
+
+        max_distance = self._max_distance(asr_len, max_cer)
+        if abs(len(human_text) - asr_len) > max_distance:
+            self.stats.cer_length_rejections += 1
+            return (max_distance + 1) / asr_len
+        distance = Levenshtein.distance(asr_text, human_text, score_cutoff=max_distance)
+        if distance > max_distance:
+            self.stats.cer_abandoned += 1
+        return distance / asr_len
+
+    def compute_cer_batch(self,
+                          asr_text: str,
+                          candidates: List[str],
+                          max_cer: Optional[float] = None) -> List[float]:
+        """Compute the Character Error Rate of one ASR text against many candidate texts.
+        
+        Equivalent to calling compute_cer for every candidate, but all distances are
+        computed in one native call that prepares the ASR text only once.
+        
+        Args:
+            asr_text: Text from ASR
+            candidates: Candidate texts from the human transcript
+            max_cer: Optional bound, see compute_cer
+            
+        Returns:
+            Character Error Rate of each candidate
+        """
+        self.stats.cer_evaluations += len(candidates)
+        asr_len = len(asr_text)
+        if asr_len == 0:
+            return [1.0] * len(candidates)
+        if max_cer is None:
+            return [distance / asr_len for distance in batch_distances(asr_text, candidates)]
+
+        max_distance = self._max_distance(asr_len, max_cer)
+        cers = [(max_distance + 1) / asr_len] * len(candidates)
+        # The length difference is a lower bound of the edit distance
+        remaining = [idx for idx, candidate in enumerate(candidates)
+                     if abs(len(candidate) - asr_len) <= max_distance]
+        self.stats.cer_length_rejections += len(candidates) - len(remaining)
+        distances = batch_distances(asr_text, [candidates[idx] for idx in remaining], max_distance)
+        for idx, distance in zip(remaining, distances):
+            if distance > max_distance:
+                self.stats.cer_abandoned += 1
+            cers[idx] = distance / asr_len
+        return cers
+
+    def _score_windows(self,
+                       asr_text: str,
+                       transcript: TranscriptView,
+                       windows: List[tuple],
+                       max_cer: Optional[float] = None) -> List[float]:
+        """Compute the CERs of token windows, reusing cached values where possible.
+        
+        Args:
+            asr_text: Text from ASR
+            transcript: View of the full transcript
+            windows: (start, end) token windows
+            max_cer: Optional bound, see compute_cer
+            
+        Returns:
+            CER of each window
+        """
+        cache = self._cer_cache
+        if cache is None:
+            return self.compute_cer_batch(
+                asr_text, [transcript.window_text(start, end) for start, end in windows], max_cer=max_cer
+            )
+
+        cers = cache.lookup(windows, max_cer)
+        missing = [idx for idx, cer in enumerate(cers) if cer is None]
+        if missing:
+            missing_windows = [windows[idx] for idx in missing]
+            computed = self.compute_cer_batch(
+                asr_text, [transcript.window_text(start, end) for start, end in missing_windows], max_cer=max_cer
+            )
+            for idx, cer in zip(missing, computed):
+                cers[idx] = cer
+            cache.store(missing_windows, computed, max_cer)
+        return cers
+
+    @staticmethod
+    def _max_distance(asr_len: int, max_cer: float) -> int:
+        """Largest edit distance with a CER of at most max_cer (tolerating float rounding)."""
+        return math.floor(max_cer * asr_len + 1e-9)
         
     def find_best_match(self, 
                        asr_segment: TranscribedSegment,
-                       transcript_tokens: List[str],
-                       start_search_idx: int = 0) -> AlignedTranscript:
+                       transcript_tokens: Union[List[str], TranscriptView],
+                       start_search_idx: int = 0,
+                       anchor_index: Optional[NGramAnchorIndex] = None,
+                       position_prior: Optional[SpeechRatePositionPrior] = None) -> AlignedTranscript:
         """Find best matching segment in human transcript for ASR segment.
         
         Uses a two-phase approach:
@@ -46,24 +294,38 @@ class TranscriptAligner:
         2. Fine-tune the exact match boundaries within that region
         
         Args:
-            asr_segment: TranscribedSegment from ASR
-            transcript_tokens: Tokenized human transcript
+            asr_segment: TranscribedSegment from ASR. Its text is compared as is, so it must be
+                normalized like the transcript tokens (see TextNormalizer)
+            transcript_tokens: Tokenized human transcript, or a TranscriptView of it to avoid
+                rebuilding the view for every segment
             start_search_idx: Index to start searching from
+            anchor_index: Optional n-gram anchor index of transcript_tokens used to find
+                candidate regions without scanning the transcript
+            position_prior: Optional speech rate prior. If it can predict the position of the segment,
+                the retry searches the predicted band instead of the whole transcript
             
         Returns:
             AlignedTranscript containing the best match
         """
+        if isinstance(transcript_tokens, TranscriptView):
+            transcript = transcript_tokens
+        else:
+            transcript = TranscriptView(transcript_tokens)
+        if self._cer_cache is not None:
+            self._cer_cache.begin_segment(asr_segment.text)
+
         # Phase 1: Find the best matching region
-        region_start_idxs = self._find_match_region(
+        region_start_idxs = self._find_candidate_regions(
             asr_segment.text,
-            transcript_tokens,
-            start_search_idx, 
-            coarse_window_size=len(asr_segment.text.split())
+            transcript,
+            start_search_idx,
+            anchor_index,
+            max_backward_search=250
         )
         
         best_matches = []
         for region_start_idx in region_start_idxs:
-            best_match = self._fine_tune_match(asr_segment, transcript_tokens, region_start_idx)
+            best_match = self._fine_tune_match(asr_segment, transcript, region_start_idx)
             if not best_match:
                 #TODO: maybe we should add some logging here
                 continue
@@ -73,17 +335,32 @@ class TranscriptAligner:
         if best_matches:
             return min(best_matches, key=lambda x: x.cer)
             
-        # No good matching region found, try from beginning
-        region_start_idxs = self._find_match_region(
-            asr_segment.text,
-            transcript_tokens,
-            0,
-            coarse_window_size=len(asr_segment.text.split()),
-        )
+        estimate = position_prior.predict(asr_segment.start, len(transcript)) if position_prior else None
+        if estimate is not None:
+            # No good matching region found, try the band predicted from the speech rate
+            self.stats.prior_band_searches += 1
+            region_start_idxs = self._find_candidate_regions(
+                asr_segment.text,
+                transcript,
+                estimate.expected_idx,
+                anchor_index,
+                max_backward_search=estimate.expected_idx - estimate.start_idx,
+                max_forward_search=estimate.end_idx - estimate.expected_idx
+            )
+        else:
+            # No good matching region found, try from beginning
+            self.stats.full_rescans += 1
+            region_start_idxs = self._find_candidate_regions(
+                asr_segment.text,
+                transcript,
+                0,
+                anchor_index,
+                reference_idx=start_search_idx
+            )
         
         best_matches = []
         for region_start_idx in region_start_idxs:
-            best_match = self._fine_tune_match(asr_segment, transcript_tokens, region_start_idx)
+            best_match = self._fine_tune_match(asr_segment, transcript, region_start_idx)
             if not best_match:
                 #TODO: maybe we should add some logging here
                 continue
@@ -94,25 +371,84 @@ class TranscriptAligner:
             return min(best_matches, key=lambda x: x.cer)
 
         # No good matching region found, create fallback alignment
-        return self._create_fallback_alignment(asr_segment, transcript_tokens, start_search_idx)
+        return self._create_fallback_alignment(asr_segment, transcript, start_search_idx)
+
+    def _find_candidate_regions(self,
+                                asr_text: str,
+                                transcript: TranscriptView,
+                                start_search_idx: int,
+                                anchor_index: Optional[NGramAnchorIndex],
+                                max_backward_search: Optional[int] = None,
+                                max_forward_search: Optional[int] = None,
+                                reference_idx: Optional[int] = None,
+                                top_k: int = 3) -> List[int]:
+        """Find candidate region starts, using the anchor index if available.
+
+        If the anchor index has no candidate, the transcript is scanned with _find_match_region.
+        
+        Args:
+            asr_text: Text from ASR segment
+            transcript: View of the full transcript
+            start_search_idx: Starting point for search
+            anchor_index: Optional n-gram anchor index of the transcript tokens
+            max_backward_search: Maximum tokens to search backward (None searches from start_search_idx on)
+            max_forward_search: Maximum tokens to search forward (None searches to the end of the transcript)
+            reference_idx: Position preferred when anchor candidates are tied (default: start_search_idx)
+            top_k: Number of candidate regions to return
+            
+        Returns:
+            List of starting indices for candidate regions
+        """
+        asr_tokens = asr_text.split()
+        if anchor_index is not None:
+            self.stats.anchor_searches += 1
+            min_idx = start_search_idx
+            if max_backward_search is not None:
+                min_idx = max(0, start_search_idx - max_backward_search)
+            max_idx = None if max_forward_search is None else start_search_idx + max_forward_search
+            candidates = anchor_index.candidate_starts(
+                asr_tokens,
+                top_k=top_k,
+                min_idx=min_idx,
+                max_idx=max_idx,
+                merge_distance=max(self.window_token_margin // 2, 1),
+                reference_idx=start_search_idx if reference_idx is None else reference_idx
+            )
+            if candidates:
+                return candidates
+            # No n-gram in common (e.g. ASR errors in every few words): fall back to the window scan,
+            # which can still match the segment character by character
+            self.stats.anchor_misses += 1
+
+        kwargs = {} if max_backward_search is None else {"max_backward_search": max_backward_search}
+        return self._find_match_region(
+            asr_text,
+            transcript,
+            start_search_idx,
+            coarse_window_size=len(asr_tokens),
+            top_k=top_k,
+            max_forward_search=max_forward_search,
+            **kwargs
+        )
 
     def _find_match_region(self,
                           asr_text: str,
-                          transcript_tokens: List[str],
+                          transcript: TranscriptView,
                           start_search_idx: int,
                           coarse_window_size: int = 50,
                           region_cer_threshold: float = 0.3,
                           max_backward_search: int = 250,
                           forward_priority: int = 5,
                           step_size: float = 0.5,
-                          top_k: int = 3) -> List[int]:
+                          top_k: int = 3,
+                          max_forward_search: Optional[int] = None) -> List[int]:
         """Find the most promising region for matching.
         
         Uses an expanding search pattern that prioritizes forward search.
         
         Args:
             asr_text: Text from ASR segment
-            transcript_tokens: Full transcript tokens
+            transcript: View of the full transcript
             start_search_idx: Starting point for search
             coarse_window_size: Size of window for coarse search
             region_cer_threshold: Maximum CER to consider a region as promising
@@ -120,17 +456,31 @@ class TranscriptAligner:
             forward_priority: Number of forward windows to check before each backward window
             step_size: Step size for window movement
             top_k: Number of top matches to return
+            max_forward_search: Maximum tokens to search forward (None searches to the end of the transcript)
             
         Returns:
             List of starting indices for best matching regions
         """
+        if self.word_level_search and asr_text.split():
+            return self._find_match_region_words(
+                asr_text, transcript, start_search_idx, coarse_window_size,
+                max_backward_search, forward_priority, step_size, top_k, max_forward_search
+            )
+
         best_matches = []
         best_cer = float('inf')
         best_start_idx = None
+        # Largest CERs of the top_k best windows so far (negated, as a max-heap). A window with a higher
+        # CER than all of them can neither become one of the returned regions nor end the search, so
+        # its CER only has to be computed up to that bound.
+        top_cers = []
         
         # Initialize search boundaries
         backward_limit = max(0, start_search_idx - max_backward_search)
-        forward_limit = len(transcript_tokens)
+        forward_limit = len(transcript)
+        forward_search_limit = forward_limit
+        if max_forward_search is not None:
+            forward_search_limit = min(forward_limit, start_search_idx + max_forward_search)
         
         # Initialize positions
         forward_pos = start_search_idx
@@ -139,26 +489,33 @@ class TranscriptAligner:
         reached_forward_limit = False
         
         while True:
-            # Check forward positions with priority
-            while forward_steps < forward_priority and forward_pos < forward_limit and (not reached_forward_limit):
+            # Check forward positions with priority, scoring them in one batch
+            forward_windows = []
+            while forward_steps < forward_priority and forward_pos < forward_search_limit and (not reached_forward_limit):
                 if forward_pos + coarse_window_size > forward_limit:
                     forward_pos = forward_limit - coarse_window_size
                     reached_forward_limit = True
                     
                 candidate_end = min(forward_pos + coarse_window_size, forward_limit)
-                candidate_text = " ".join(transcript_tokens[forward_pos:candidate_end])
-                cer = self.compute_cer(asr_text, candidate_text)
-                best_matches.append((cer, forward_pos))
+                forward_windows.append((forward_pos, candidate_end))
+                forward_pos += max(int(coarse_window_size*step_size), 1)
+                forward_steps += 1
+
+            forward_cers = self.compute_cer_batch(
+                asr_text,
+                [transcript.window_text(window_start, window_end) for window_start, window_end in forward_windows],
+                max_cer=self._region_cer_bound(top_cers, top_k)
+            )
+            for (window_start, _), cer in zip(forward_windows, forward_cers):
+                best_matches.append((cer, window_start))
+                self._push_top_cer(top_cers, cer, top_k)
                 
                 if cer < best_cer:
                     best_cer = cer
-                    best_start_idx = forward_pos
+                    best_start_idx = window_start
                     
                     if cer <= region_cer_threshold:
-                        return [forward_pos]
-                        
-                forward_pos += max(int(coarse_window_size*step_size), 1)
-                forward_steps += 1
+                        return [window_start]
             
             # Reset forward steps counter
             forward_steps = 0
@@ -168,9 +525,10 @@ class TranscriptAligner:
                 backwards_step = max(int(coarse_window_size*step_size), 1)
                 backward_pos = max(backward_pos - backwards_step, backward_limit)
                 candidate_end = min(backward_pos + coarse_window_size, forward_limit)
-                candidate_text = " ".join(transcript_tokens[backward_pos:candidate_end])
-                cer = self.compute_cer(asr_text, candidate_text)
+                candidate_text = transcript.window_text(backward_pos, candidate_end)
+                cer = self.compute_cer(asr_text, candidate_text, max_cer=self._region_cer_bound(top_cers, top_k))
                 best_matches.append((cer, backward_pos))
+                self._push_top_cer(top_cers, cer, top_k)
                 
                 if cer < best_cer:
                     best_cer = cer
@@ -180,21 +538,118 @@ class TranscriptAligner:
                         return [backward_pos]
             
             # Stop if we've searched the entire valid range
-            if (forward_pos >= forward_limit or reached_forward_limit) and backward_pos <= backward_limit:
+            if (forward_pos >= forward_search_limit or reached_forward_limit) and backward_pos <= backward_limit:
                 break
 
         return [match[1] for match in heapq.nsmallest(top_k, best_matches)]
 
+    def _find_match_region_words(self,
+                                 asr_text: str,
+                                 transcript: TranscriptView,
+                                 start_search_idx: int,
+                                 coarse_window_size: int,
+                                 max_backward_search: int,
+                                 forward_priority: int,
+                                 step_size: float,
+                                 top_k: int,
+                                 max_forward_search: Optional[int]) -> List[int]:
+        """Find the most promising regions by word overlap instead of CER.
+        
+        Visits the windows in the same order as _find_match_region, but a window is
+        scored by the share of ASR words it lacks (bag of normalized word IDs). The
+        scores of all windows in the search range come from one cumulative sum over
+        the transcript, so no string is built or compared.
+        
+        Args: see _find_match_region
+            
+        Returns:
+            List of starting indices for best matching regions
+        """
+        asr_ids = transcript.encode_words(asr_text.split())
+        num_asr_words = len(asr_ids)
+        forward_limit = len(transcript)
+        forward_search_limit = forward_limit
+        if max_forward_search is not None:
+            forward_search_limit = min(forward_limit, start_search_idx + max_forward_search)
+        backward_limit = max(0, start_search_idx - max_backward_search)
+        step = max(int(coarse_window_size * step_size), 1)
+
+        # Number of transcript words that also occur in the ASR text, up to every position of the range
+        range_start = max(min(backward_limit, forward_limit - coarse_window_size), 0)
+        range_end = min(max(forward_search_limit, start_search_idx) + coarse_window_size, forward_limit)
+        hits = np.isin(transcript.word_ids()[range_start:range_end], asr_ids[asr_ids >= 0])
+        cumulative_hits = np.concatenate(([0], np.cumsum(hits)))
+
+        positions = self._region_scan_order(
+            start_search_idx, coarse_window_size, step, forward_priority,
+            backward_limit, forward_limit, forward_search_limit
+        )
+        first = np.clip(positions, range_start, range_end) - range_start
+        last = np.maximum(np.minimum(positions + coarse_window_size, range_end) - range_start, first)
+        overlap = np.minimum(cumulative_hits[last] - cumulative_hits[first], num_asr_words)
+        rates = (num_asr_words - overlap) / num_asr_words
+
+        promising = np.flatnonzero(rates <= self.word_region_threshold)
+        if len(promising):
+            self.stats.word_evaluations += int(promising[0]) + 1
+            return [int(positions[promising[0]])]
+        self.stats.word_evaluations += len(positions)
+        best = np.lexsort((positions, rates))[:top_k]
+        return positions[best].tolist()
+
+    @staticmethod
+    def _region_scan_order(start_search_idx: int,
+                           window_size: int,
+                           step: int,
+                           forward_priority: int,
+                           backward_limit: int,
+                           forward_limit: int,
+                           forward_search_limit: int) -> np.ndarray:
+        """Window starts of the region scan in the order in which _find_match_region visits them.
+        
+        Groups of forward_priority forward positions alternate with one backward
+        position, until both directions are exhausted.
+        """
+        forward = np.arange(start_search_idx, max(forward_search_limit, start_search_idx), step, dtype=np.int64)
+        beyond = np.flatnonzero(forward + window_size > forward_limit)
+        if len(beyond):
+            # The first window beyond the transcript end is moved back to end there, and is the last one
+            forward = forward[:beyond[0] + 1]
+            forward[-1] = forward_limit - window_size
+        num_backward = -(-(start_search_idx - backward_limit) // step) if start_search_idx > backward_limit else 0
+        backward = np.maximum(start_search_idx - step * np.arange(1, num_backward + 1, dtype=np.int64), backward_limit)
+
+        groups = np.concatenate((np.arange(len(forward)) // forward_priority, np.arange(len(backward))))
+        directions = np.concatenate((np.zeros(len(forward), dtype=np.int64), np.ones(len(backward), dtype=np.int64)))
+        return np.concatenate((forward, backward))[np.lexsort((directions, groups))]
+
+    def _region_cer_bound(self, top_cers: List[float], top_k: int) -> Optional[float]:
+        """CER bound for the region search: the k-th best CER so far, once top_k windows were scored."""
+        if not self.bounded_cer or len(top_cers) < top_k:
+            return None
+        return -top_cers[0]
+
+    @staticmethod
+    def _push_top_cer(top_cers: List[float], cer: float, top_k: int) -> None:
+        """Keep the top_k smallest CERs in the negated max-heap top_cers."""
+        if len(top_cers) < top_k:
+            heapq.heappush(top_cers, -cer)
+        elif cer < -top_cers[0]:
+            heapq.heapreplace(top_cers, -cer)
+
     def _fine_tune_match(self,
                         asr_segment: TranscribedSegment,
-                        transcript_tokens: List[str],
+                        transcript: TranscriptView,
                         region_start_idx: int) -> AlignedTranscript:
         """Fine-tune the exact match boundaries within the identified region."""
+        if self.incremental_fine_tune and len(asr_segment.text) >= _INCREMENTAL_MIN_ASR_CHARS:
+            return self._fine_tune_match_incremental(asr_segment, transcript, region_start_idx)
+
         asr_tokens = asr_segment.text.split()
         num_predicted = len(asr_tokens)
         best_cer = float('inf')
         crossed_cer_threshold = False
-        best_match = None
+        best_window = None
         
         # Search within a smaller window around the identified region
         local_margin = self.window_token_margin // 2
@@ -206,75 +661,540 @@ class TranscriptAligner:
                 
             best_cer_for_candidate_start = float('inf')
                 
+            candidate_ends = []
             for window_tokens in range(num_predicted - local_margin, 
                                      num_predicted + local_margin + 1):
                 candidate_end = candidate_start + window_tokens
-                if candidate_end > len(transcript_tokens):
+                if candidate_end > len(transcript):
                     break
-                    
-                candidate_text = " ".join(transcript_tokens[candidate_start:candidate_end])
-                cer = self.compute_cer(asr_segment.text, candidate_text)
+                candidate_ends.append(candidate_end)
+
+            # Windows worse than the best match and the early stopping threshold cannot change the result
+            max_cer = None
+            if self.bounded_cer and best_window is not None:
+                max_cer = max(best_cer, self.finetune_cer_threshold)
+            cers = self._score_windows(
+                asr_segment.text,
+                transcript,
+                [(candidate_start, candidate_end) for candidate_end in candidate_ends],
+                max_cer=max_cer
+            )
+            for candidate_end, cer in zip(candidate_ends, cers):
                 best_cer_for_candidate_start = min(best_cer_for_candidate_start, cer)
                 
                 if cer < best_cer:
                     best_cer = cer
-                    best_match = AlignedTranscript(
-                        asr_segment=asr_segment,
-                        human_text=candidate_text,
-                        start_idx=candidate_start,
-                        end_idx=candidate_end,
-                        cer=cer
-                    )
+                    best_window = (candidate_start, candidate_end)
                     
                     if cer <= self.finetune_cer_threshold:
                         crossed_cer_threshold = True
             
             if crossed_cer_threshold and best_cer_for_candidate_start > self.finetune_cer_threshold:
-                return best_match
-        if best_match is None:
-            """
-            print(f"No best match found for {asr_segment.text}")
-            # print the values relevant for the for looops, to see if we didn't go into some loops/ break always
-            print(f"num_predicted: {num_predicted}")
-            print(f"local_margin: {local_margin}")
-            print(f"region_start_idx: {region_start_idx}")
-            print(f"transcript_tokens length: {len(transcript_tokens)}")
-            """
+                break
+        if best_window is None:
+            return None
+
+        return self._make_alignment(asr_segment, transcript, *best_window, best_cer)
+
+    def _fine_tune_match_incremental(self,
+                                     asr_segment: TranscribedSegment,
+                                     transcript: TranscriptView,
+                                     region_start_idx: int) -> Optional[AlignedTranscript]:
+        """Fine-tune the match boundaries with one shared edit distance sweep.
+        
+        Scores the same candidate windows in the same order as the window-by-window
+        search, so the selected match (including early stopping) is identical.
+        
+        Args:
+            asr_segment: TranscribedSegment from ASR
+            transcript: View of the full transcript
+            region_start_idx: Start index of the region found by the coarse search
+            
+        Returns:
+            AlignedTranscript of the best window, or None if no window fits into the transcript
+        """
+        asr_text = asr_segment.text
+        num_predicted = len(asr_text.split())
+        num_tokens = len(transcript)
+        local_margin = self.window_token_margin // 2
+        window_sizes = range(num_predicted - local_margin, num_predicted + local_margin + 1)
+
+        # Candidate windows per start, in the order of the window-by-window search
+        candidate_windows = []
+        for start_offset in range(-local_margin, local_margin + 1):
+            candidate_start = region_start_idx + start_offset
+            if candidate_start < 0:
+                continue
+            ends = []
+            for window_tokens in window_sizes:
+                candidate_end = candidate_start + window_tokens
+                if candidate_end > num_tokens:
+                    break
+                ends.append(candidate_end)
+            candidate_windows.append((candidate_start, ends))
+
+        if not any(ends for _, ends in candidate_windows):
+            return None
+        cers = self._score_windows_incremental(asr_text, transcript, candidate_windows)
+
+        best_cer = float('inf')
+        best_window = None
+        crossed_cer_threshold = False
+        for candidate_start, ends in candidate_windows:
+            best_cer_for_candidate_start = float('inf')
+            for candidate_end in ends:
+                cer = cers[(candidate_start, candidate_end)]
+                best_cer_for_candidate_start = min(best_cer_for_candidate_start, cer)
+
+                if cer < best_cer:
+                    best_cer = cer
+                    best_window = (candidate_start, candidate_end)
+                    if cer <= self.finetune_cer_threshold:
+                        crossed_cer_threshold = True
+
+            if crossed_cer_threshold and best_cer_for_candidate_start > self.finetune_cer_threshold:
+                break
+
+        if best_window is None:
+            return None
+        return self._make_alignment(asr_segment, transcript, *best_window, best_cer)
+
+    def _score_windows_incremental(self,
+                                   asr_text: str,
+                                   transcript: TranscriptView,
+                                   candidate_windows: List[tuple]) -> Dict[tuple, float]:
+        """Compute the exact CERs of groups of windows sharing their start in one sweep.
+        
+        Args:
+            asr_text: Text from ASR
+            transcript: View of the full transcript
+            candidate_windows: (start, ends) window groups
             
+        Returns:
+            Mapping from (start, end) window to CER
+        """
+        cache = self._cer_cache
+        cers: Dict[tuple, float] = {}
+        missing = candidate_windows
+        if cache is not None:
+            windows = [(start, end) for start, ends in candidate_windows for end in ends]
+            cached = cache.lookup(windows)
+            if cached.count(None) < len(cached):
+                cers.update((window, cer) for window, cer in zip(windows, cached) if cer is not None)
+                missing = []
+                for start, ends in candidate_windows:
+                    missing_ends = [end for end in ends if (start, end) not in cers]
+                    if missing_ends:
+                        missing.append((start, missing_ends))
 
-        return best_match
+        # Non-empty windows are scored in one sweep over the joined transcript text. Empty windows
+        # (end <= start) have distance len(asr_text), negative ends index from the end of the
+        # transcript and are scored separately.
+        asr_len = len(asr_text)
+        lane_starts = []
+        lane_ends = []
+        wrapped = []
+        for start, ends in missing:
+            self.stats.cer_evaluations += sum(end >= 0 for end in ends)
+            wrapped.extend((start, end) for end in ends if end < 0)
+            for end in ends:
+                if 0 <= end <= start:
+                    cers[(start, end)] = 1.0
+            ends = [end for end in ends if end > start]
+            if ends:
+                lane_starts.append(start)
+                lane_ends.append(ends)
+        if asr_len == 0:
+            cers.update((window, 1.0) for window in wrapped)
+            cers.update(((start, end), 1.0) for start, ends in zip(lane_starts, lane_ends) for end in ends)
+            self.stats.cer_evaluations += len(wrapped)
+        else:
+            if wrapped:
+                cers.update(zip(wrapped, self.compute_cer_batch(
+                    asr_text, [transcript.window_text(start, end) for start, end in wrapped]
+                )))
+            lane_spans = [[transcript.char_span(start, end) for end in ends] for start, ends in zip(lane_starts, lane_ends)]
+            lane_distances = BitParallelPattern(asr_text).window_distances(
+                transcript.text,
+                [spans[0][0] for spans in lane_spans],
+                [[span[1] for span in spans] for spans in lane_spans]
+            )
+            for start, ends, lane in zip(lane_starts, lane_ends, lane_distances):
+                cers.update(((start, end), distance / asr_len) for end, distance in zip(ends, lane))
+
+        if cache is not None:
+            cache.store_exact(cers)
+        return cers
+
+    def _make_alignment(self,
+                        asr_segment: TranscribedSegment,
+                        transcript: TranscriptView,
+                        start_idx: int,
+                        end_idx: int,
+                        cer: float) -> AlignedTranscript:
+        """Create the AlignedTranscript of a selected window, materializing its human text."""
+        return AlignedTranscript(
+            asr_segment=asr_segment,
+            human_text=transcript.original_window_text(start_idx, end_idx),
+            start_idx=start_idx,
+            end_idx=end_idx,
+            cer=cer
+        )
 
     def _create_fallback_alignment(self,
                                  asr_segment: TranscribedSegment,
-                                 transcript_tokens: List[str],
+                                 transcript: TranscriptView,
                                  start_search_idx: int) -> AlignedTranscript:
         """Create a fallback alignment when no good match is found."""
-        return self._fine_tune_match(asr_segment, transcript_tokens, start_search_idx)
+        return self._fine_tune_match(asr_segment, transcript, start_search_idx)
 
     def align_transcript(self, 
-                        transcribed_segments: List[TranscribedSegment],
+                        transcribed_segments: Iterable[TranscribedSegment],
                         human_transcript: str) -> List[AlignedTranscript]:
         """Align all ASR segments with human transcript.
         
+        The greedy engine consumes the segments one at a time, so they can be an
+        iterator that yields them while the ASR is still running (see
+        AudioSegmenter.iter_segment_and_transcribe). The global and anchored
+        engines need all segments and collect them first.
+        
         Args:
-            transcribed_segments: List of TranscribedSegments from ASR
+            transcribed_segments: TranscribedSegments from ASR, in temporal order
             human_transcript: Full human transcript text
             
         Returns:
             List of AlignedTranscript objects
         """
-        transcript_tokens = human_transcript.split()
+        self.stats = AlignerStats()
+        original_segments = []
+        if self.normalizer is not None:
+            transcript = TranscriptView.normalized(human_transcript, self.normalizer)
+            segments = self._normalized_segments(transcribed_segments, original_segments)
+        else:
+            transcript = TranscriptView.from_text(human_transcript)
+            segments = transcribed_segments
+
+        if self.engine == "global":
+            aligned_segments = self._align_transcript_global(list(segments), transcript)
+        elif self.engine == "anchored":
+            aligned_segments = self._align_transcript_anchored(list(segments), transcript)
+        else:
+            aligned_segments = self._align_transcript_greedy(segments, transcript)
+
+        # Report the original ASR segments and transcript tokens, not the normalized ones
+        for aligned, segment in zip(aligned_segments, original_segments):
+            if aligned is not None:
+                aligned.asr_segment = segment
+                aligned.start_idx, aligned.end_idx = transcript.original_span(aligned.start_idx, aligned.end_idx)
+        return aligned_segments
+
+    def _normalized_segments(self,
+                             transcribed_segments: Iterable[TranscribedSegment],
+                             original_segments: List[TranscribedSegment]) -> Iterator[TranscribedSegment]:
+        """Yield normalized copies of the segments, collecting the originals as they are consumed."""
+        for segment in transcribed_segments:
+            original_segments.append(segment)
+            yield replace(segment, text=self.normalizer.normalize_text(segment.text))
+
+    def _align_transcript_greedy(self,
+                                 transcribed_segments: Iterable[TranscribedSegment],
+                                 transcript: TranscriptView,
+                                 show_progress: bool = True) -> List[AlignedTranscript]:
+        """Align the ASR segments one after another, each starting from the end of the previous match.
+        
+        Args:
+            transcribed_segments: TranscribedSegments from ASR, consumed one at a time
+            transcript: View of the human transcript
+            show_progress: Whether to show a progress bar
+            
+        Returns:
+            List of AlignedTranscript objects (None for segments without any match)
+        """
+        anchor_index = NGramAnchorIndex(transcript.tokens, n=self.anchor_ngram_size) if self.use_anchor_index else None
+        cer_cache = WindowCERCache(self.cer_cache_size) if self.cer_cache_size is not None else None
+        position_prior = SpeechRatePositionPrior() if self.use_position_prior else None
+
         aligned_segments = []
         last_end_idx = 0
         
-        # Add progress bar for alignment
-        for segment in tqdm(transcribed_segments, desc="Aligning segments", mininterval=60.0):
-            aligned = self.find_best_match(
-                segment, 
-                transcript_tokens,
-                start_search_idx=last_end_idx
-            )
-            aligned_segments.append(aligned)
-            last_end_idx = aligned.end_idx if aligned else last_end_idx
+        self._cer_cache = cer_cache
+        try:
+            # Add progress bar for alignment
+            for segment in tqdm(transcribed_segments, desc="Aligning segments", mininterval=60.0,
+                                disable=not show_progress):
+                self.stats.segments += 1
+                aligned = self.find_best_match(
+                    segment, 
+                    transcript,
+                    start_search_idx=last_end_idx,
+                    anchor_index=anchor_index,
+                    position_prior=position_prior
+                )
+                aligned_segments.append(aligned)
+                last_end_idx = aligned.end_idx if aligned else last_end_idx
+                if position_prior is not None and aligned and aligned.cer <= self.region_cer_threshold:
+                    position_prior.observe(segment.start, segment.end, aligned.start_idx, aligned.end_idx)
+        finally:
+            self._cer_cache = None
+
+        if cer_cache is not None:
+            self.stats.cer_cache_hits = cer_cache.hits
+            self.stats.cer_cache_misses = cer_cache.misses
+        return aligned_segments 
+
+    def _align_transcript_global(self,
+                                 transcribed_segments: List[TranscribedSegment],
+                                 transcript: TranscriptView) -> List[AlignedTranscript]:
+        """Align all ASR segments in one monotonic pass over the whole session.
+        
+        Args:
+            transcribed_segments: List of TranscribedSegments from ASR
+            transcript: View of the human transcript
+            
+        Returns:
+            List of AlignedTranscript objects, one per segment
+        """
+        segment_tokens = [segment.text.split() for segment in transcribed_segments]
+        asr_tokens = [token for tokens in segment_tokens for token in tokens]
+
+        vocabulary: Dict[str, int] = {}
+        human_ids = intern_tokens(transcript.tokens, vocabulary)
+        asr_ids = intern_tokens(asr_tokens, vocabulary)
+
+        mapping = banded_monotonic_alignment(
+            asr_ids,
+            human_ids,
+            band_width=self.global_band_width,
+            guide=anchor_guide(asr_ids, human_ids, n=self.anchor_ngram_size)
+        )
+
+        aligned_segments = []
+        asr_pos = 0
+        last_end_idx = 0
+        for segment, tokens in zip(transcribed_segments, segment_tokens):
+            self.stats.segments += 1
+            matched = mapping[asr_pos:asr_pos + len(tokens)]
+            matched = matched[matched >= 0]
+            asr_pos += len(tokens)
+
+            if len(matched):
+                start_idx, end_idx = int(matched[0]), int(matched[-1]) + 1
+            else:
+                # Nothing of this segment is in the transcript
+                start_idx, end_idx = last_end_idx, last_end_idx
+
+            cer = self.compute_cer(segment.text, transcript.window_text(start_idx, end_idx))
+            aligned_segments.append(self._make_alignment(segment, transcript, start_idx, end_idx, cer))
+            last_end_idx = end_idx
+
+        return aligned_segments
+
+    def _align_transcript_anchored(self,
+                                   transcribed_segments: List[TranscribedSegment],
+                                   transcript: TranscriptView) -> List[AlignedTranscript]:
+        """Align the ASR segments between unambiguous anchors, with the gaps in parallel.
+        
+        1. Segments whose start is unambiguous from n-grams occurring only once in the
+           transcript are fine-tuned there and kept if their CER is below
+           anchor_cer_threshold.
+        2. The longest chain of anchors that is monotonic in the transcript is kept.
+        3. The segments between two consecutive anchors are aligned greedily against
+           the transcript span between the anchors only, extended by the fine-tuning
+           margin so that matches may overlap the anchors as with the greedy engine.
+        
+        Args:
+            transcribed_segments: List of TranscribedSegments from ASR
+            transcript: View of the human transcript
             
-        return aligned_segments 
\ No newline at end of file
+        Returns:
+            List of AlignedTranscript objects, one per segment
+        """
+        self.stats.segments = len(transcribed_segments)
+        anchor_index = NGramAnchorIndex(transcript.tokens, n=self.anchor_ngram_size)
+        candidates = []
+        for segment_idx, segment in enumerate(transcribed_segments):
+            region_start = anchor_index.unique_anchor(segment.text.split())
+            if region_start is not None:
+                candidates.append((segment_idx, region_start))
+
+        workers = self.anchored_workers or os.cpu_count() or 1
+        if len(transcribed_segments) < 2 * _ANCHORED_MIN_SEGMENTS_PER_WORKER:
+            workers = 1
+        if workers > 1:
+            if self._anchored_executor is None:
+                # The tasks carry the transcript spans they need, so the pool does not depend on the transcript
+                self._anchored_executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_anchored_worker,
+                    initargs=(self._greedy_config(),)
+                )
+            executor = self._anchored_executor
+        else:
+            executor = None
+            local_worker = _AnchoredWorker(self._greedy_config())
+
+        def run(method: str, tasks: List[Any]) -> List[Any]:
+            if executor is None:
+                return [getattr(local_worker, method)(task) for task in tasks]
+            chunksize = max(1, len(tasks) // (4 * workers))
+            try:
+                return list(executor.map(_run_anchored_task, [(method, task) for task in tasks], chunksize=chunksize))
+            except BrokenProcessPool:
+                # A worker died, the next alignment starts a new pool
+                self.close()
+                raise
+
+        # 1. Verify the anchor candidates
+        verified = []
+        tasks = [
+            (transcribed_segments[segment_idx], region_start,
+             *self._anchor_span(transcribed_segments[segment_idx], region_start, transcript))
+            for segment_idx, region_start in candidates
+        ]
+        for (segment_idx, _), (match, counters) in zip(candidates, run("verify_anchor", tasks)):
+            self.stats.add(counters)
+            if match is not None and match[2] <= self.anchor_cer_threshold:
+                verified.append((segment_idx, *match))
+
+        # 2. Keep a monotonic, non-overlapping chain of anchors
+        anchors = []
+        for idx in longest_increasing_subsequence([start_idx for _, start_idx, _, _ in verified]):
+            if not anchors or verified[idx][1] >= anchors[-1][2]:
+                anchors.append(verified[idx])
+        self.stats.anchor_segments = len(anchors)
+
+        # 3. Align the gaps between the anchors
+        gaps = []
+        overlap = self.window_token_margin // 2
+        previous_segment_idx, previous_end_idx = -1, 0
+        for segment_idx, start_idx, end_idx, _ in anchors + [(len(transcribed_segments), len(transcript), None, None)]:
+            if segment_idx > previous_segment_idx + 1:
+                gaps.append((
+                    previous_segment_idx + 1,
+                    segment_idx,
+                    max(previous_end_idx - overlap, 0),
+                    min(start_idx + overlap, len(transcript))
+                ))
+            previous_segment_idx, previous_end_idx = segment_idx, end_idx
+        tasks = [(transcribed_segments[first:last], span_start, transcript.tokens[span_start:span_end])
+                 for first, last, span_start, span_end in gaps]
+        gap_results = tqdm(run("align_gap", tasks), total=len(tasks), desc="Aligning gaps", mininterval=60.0)
+
+        matches: List[Optional[Tuple[int, int, float]]] = [None] * len(transcribed_segments)
+        for segment_idx, start_idx, end_idx, cer in anchors:
+            matches[segment_idx] = (start_idx, end_idx, cer)
+        for (first, _, _, _), (gap_matches, counters) in zip(gaps, gap_results):
+            self.stats.add(counters)
+            matches[first:first + len(gap_matches)] = gap_matches
+
+        aligned_segments = []
+        last_end_idx = 0
+        for segment, match in zip(transcribed_segments, matches):
+            if match is None:
+                # No match within the gap
+                start_idx, end_idx = last_end_idx, last_end_idx
+                match = (start_idx, end_idx, self.compute_cer(segment.text, ""))
+            aligned_segments.append(self._make_alignment(segment, transcript, *match))
+            last_end_idx = match[1]
+        return aligned_segments
+
+    def _anchor_span(self,
+                     segment: TranscribedSegment,
+                     region_start: int,
+                     transcript: TranscriptView) -> Tuple[int, List[str]]:
+        """Transcript span that contains every window fine-tuning may score for an anchor candidate.
+
+        Args:
+            segment: ASR segment of the anchor candidate
+            region_start: Start of the candidate region
+            transcript: View of the human transcript
+
+        Returns:
+            Tuple of (span start index, span tokens)
+        """
+        margin = self.window_token_margin // 2
+        num_predicted = len(segment.text.split())
+        # Windows start at most margin tokens from region_start and are at most margin tokens longer or
+        # shorter than the segment. One more margin before the first start keeps the ends of shorter
+        # windows inside the span.
+        span_start = max(region_start - 2 * margin, 0)
+        span_end = min(region_start + 2 * margin + num_predicted, len(transcript))
+        if span_start == 0 and num_predicted < margin:
+            # Windows may end before the transcript start, which indexes from the end of the transcript
+            span_end = len(transcript)
+        return span_start, transcript.tokens[span_start:span_end]
+
+    def _greedy_config(self) -> Dict[str, Any]:
+        """Arguments of a "greedy" aligner with the same configuration."""
+        return dict(
+            window_token_margin=self.window_token_margin,
+            region_cer_threshold=self.region_cer_threshold,
+            finetune_cer_threshold=self.finetune_cer_threshold,
+            use_anchor_index=self.use_anchor_index,
+            anchor_ngram_size=self.anchor_ngram_size,
+            incremental_fine_tune=self.incremental_fine_tune,
+            bounded_cer=self.bounded_cer,
+            cer_cache_size=self.cer_cache_size,
+            use_position_prior=self.use_position_prior,
+            word_level_search=self.word_level_search,
+            word_region_threshold=self.word_region_threshold
+        )
+
+
+class _AnchoredWorker:
+    """Aligns anchors and gaps of the "anchored" engine, in a worker process or inline.
+    
+    Every task carries the span of transcript tokens it needs, so a worker process
+    can serve any transcript and the whole transcript is never sent to it.
+    Results are returned as (start_idx, end_idx, cer) tuples relative to the full
+    transcript, together with the counters of the work, so that only small
+    objects are sent back from worker processes.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        self.aligner = TranscriptAligner(**config)
+
+    def verify_anchor(self, task: Tuple[TranscribedSegment, int, int, List[str]]):
+        segment, region_start, span_start, span_tokens = task
+        self.aligner.stats = AlignerStats()
+        match = self.aligner._fine_tune_match(segment, TranscriptView(span_tokens), region_start - span_start)
+        result = None
+        if match is not None:
+            result = (match.start_idx + span_start, match.end_idx + span_start, match.cer)
+        return result, self._counters()
+
+    def align_gap(self, task: Tuple[List[TranscribedSegment], int, List[str]]):
+        segments, span_start, span_tokens = task
+        self.aligner.stats = AlignerStats()
+        if not span_tokens:
+            return [None] * len(segments), self._counters()
+        span = TranscriptView(span_tokens)
+        aligned = self.aligner._align_transcript_greedy(segments, span, show_progress=False)
+        matches = []
+        for match in aligned:
+            if match is None:
+                matches.append(None)
+                continue
+            # Windows are slices of the span: resolve negative indices before shifting them
+            start_idx, end_idx, _ = slice(match.start_idx, match.end_idx).indices(len(span))
+            matches.append((start_idx + span_start, max(end_idx, start_idx) + span_start, match.cer))
+        return matches, self._counters()
+
+    def _counters(self) -> Dict[str, int]:
+        counters = asdict(self.aligner.stats)
+        del counters["segments"]
+        return counters
+
+
+# Worker of the current process when aligning with a process pool
+_anchored_worker: Optional[_AnchoredWorker] = None
+
+
+def _init_anchored_worker(config: Dict[str, Any]) -> None:
+    global _anchored_worker
+    _anchored_worker = _AnchoredWorker(config)
+
+
+def _run_anchored_task(task: Tuple[str, Any]):
+    method, argument = task
+    return getattr(_anchored_worker, method)(argument)
@@ -0,0 +1,167 @@
+from typing import List, Dict, Tuple, Optional
+from collections import defaultdict, Counter
+import bisect
+
+from .normalization import TextNormalizer
+
+_ANCHOR_NORMALIZER = TextNormalizer()
+
+
+def normalize_anchor_token(token: str) -> str:
+    """Normalize a token for anchor lookups, like TextNormalizer (lowercase, punctuation removed).
+
+    Tokens that the aligner normalized already are returned unchanged.
+
+    Args:
+        token: Token from the ASR output or the human transcript
+
+    Returns:
+        Normalized token, possibly empty if the token only contained punctuation
+    """
+    return _ANCHOR_NORMALIZER.normalize_token(token)
+
+
+class NGramAnchorIndex:
+    """Inverted index from word n-grams to their token positions in a transcript.
+
+    The index is built once per human transcript. For an ASR segment, every
+    n-gram that also occurs in the transcript votes for the transcript position
+    at which the segment would have to start for the n-gram to line up
+    (the "diagonal" of the hit). Positions with the most votes are the most
+    promising regions, so the expensive CER computation only has to run on them.
+
+    Short or noisy segments may not share a single n-gram with the transcript,
+    so lookups back off to shorter n-grams (down to single rare words).
+    """
+
+    def __init__(self,
+                 transcript_tokens: List[str],
+                 n: int = 3,
+                 max_occurrences: int = 50):
+        """Build the index.
+
+        Args:
+            transcript_tokens: Tokenized human transcript
+            n: Number of words per n-gram
+            max_occurrences: N-grams occurring more often than this are ignored
+                (e.g. "thank you very"), as they carry no positional information
+        """
+        self.n = n
+        self.max_occurrences = max_occurrences
+        self.num_tokens = len(transcript_tokens)
+
+        normalized = [normalize_anchor_token(token) for token in transcript_tokens]
+        postings: Dict[Tuple[str, ...], List[int]] = defaultdict(list)
+        for size in range(1, n + 1):
+            for idx in range(len(normalized) - size + 1):
+                postings[tuple(normalized[idx:idx + size])].append(idx)
+        # Positions are appended in increasing order, so every posting list is sorted
+        self._postings = dict(postings)
+
+    def __len__(self) -> int:
+        return len(self._postings)
+
+    def _vote(self,
+              normalized: List[str],
+              size: int,
+              min_idx: int,
+              max_idx: int) -> Counter:
+        """Collect diagonal votes of all n-grams of the given size."""
+        votes: Counter = Counter()
+        for query_pos in range(len(normalized) - size + 1):
+            ngram = tuple(normalized[query_pos:query_pos + size])
+            if not all(ngram):
+                continue
+            positions = self._postings.get(ngram)
+            if not positions or len(positions) > self.max_occurrences:
+                continue
+            lo = bisect.bisect_left(positions, min_idx)
+            hi = bisect.bisect_left(positions, max_idx)
+            for position in positions[lo:hi]:
+                votes[max(position - query_pos, 0)] += 1
+        return votes
+
+    def candidate_starts(self,
+                         asr_tokens: List[str],
+                         top_k: int = 3,
+                         min_idx: int = 0,
+                         max_idx: Optional[int] = None,
+                         merge_distance: int = 5,
+                         reference_idx: int = 0) -> List[int]:
+        """Find the most promising region starts for an ASR segment.
+
+        Args:
+            asr_tokens: Tokens of the ASR segment
+            top_k: Maximum number of region starts to return
+            min_idx: Smallest transcript position an anchor hit may have
+            max_idx: Largest transcript position an anchor hit may have (exclusive)
+            merge_distance: Candidates closer than this to an already selected
+                candidate are considered the same region and skipped
+            reference_idx: Position used to break ties between equally voted
+                candidates (closer is better)
+
+        Returns:
+            List of region start indices ordered by anchor hits, empty if the
+            segment shares not even a single rare word with the transcript
+        """
+        max_idx = self.num_tokens if max_idx is None else max_idx
+        normalized = [normalize_anchor_token(token) for token in asr_tokens]
+
+        votes: Counter = Counter()
+        for size in range(self.n, 0, -1):
+            votes = self._vote(normalized, size, min_idx, max_idx)
+            if votes:
+                break
+
+        ranked = sorted(votes.items(), key=lambda item: (-item[1], abs(item[0] - reference_idx)))
+
+        selected: List[int] = []
+        for start_idx, _ in ranked:
+            if any(abs(start_idx - other) < merge_distance for other in selected):
+                continue
+            selected.append(start_idx)
+            if len(selected) == top_k:
+                break
+        return selected
+
+    def unique_anchor(self,
+                      asr_tokens: List[str],
+                      min_votes: int = 2,
+                      tolerance: int = 3,
+                      min_agreement: float = 0.8) -> Optional[int]:
+        """Find the start of an ASR segment from n-grams that occur only once in the transcript.
+
+        Unlike candidate_starts, this only returns a position if the evidence is
+        unambiguous, so the segment can serve as a fixed anchor of an alignment.
+
+        Args:
+            asr_tokens: Tokens of the ASR segment
+            min_votes: Minimum number of unique n-grams supporting the start
+            tolerance: Maximum distance (in tokens) between the diagonals of supporting n-grams,
+                which differ by insertions and deletions of the ASR
+            min_agreement: Minimum share of all unique n-gram hits supporting the start
+
+        Returns:
+            Region start index, or None if the segment has no unambiguous unique n-gram match
+        """
+        normalized = [normalize_anchor_token(token) for token in asr_tokens]
+        diagonals = []
+        for query_pos in range(len(normalized) - self.n + 1):
+            ngram = tuple(normalized[query_pos:query_pos + self.n])
+            if not all(ngram):
+                continue
+            positions = self._postings.get(ngram)
+            if positions is not None and len(positions) == 1:
+                diagonals.append(max(positions[0] - query_pos, 0))
+        if len(diagonals) < min_votes:
+            return None
+
+        diagonals.sort()
+        best_start, best_support = diagonals[0], 0
+        for idx, diagonal in enumerate(diagonals):
+            support = bisect.bisect_right(diagonals, diagonal + tolerance) - idx
+            if support > best_support:
+                best_start, best_support = diagonal, support
+        if best_support < max(min_votes, min_agreement * len(diagonals)):
+            return None
+        return best_start
@@ -0,0 +1,133 @@
+from collections import OrderedDict
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+Window = Tuple[int, int]
+
+
+class WindowCERCache:
+    """Memo of window CERs for the ASR segments of one transcript alignment.
+
+    The windows of the current segment live in a per-segment memo keyed by the
+    (start, end) token window, so the search passes and the fallback of one
+    segment never evict each other's entries. When the next segment starts, the
+    memo is moved into a bounded LRU keyed by the ASR text, from which it is
+    restored when the same text (e.g. "Thank you.") is aligned again.
+
+    Most segments are fine-tuned only once, so storing is kept O(1): the CERs
+    of every scoring call are kept as they are and only merged when the
+    segment is looked up again.
+
+    Lower bounds from bounded evaluations (see TranscriptAligner.compute_cer)
+    are only kept for the current segment, and only answer queries whose bound
+    they exceed.
+    """
+
+    def __init__(self, max_entries: int = 100_000):
+        """Create an empty cache.
+
+        Args:
+            max_entries: Maximum number of windows kept in the LRU across segments
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._asr_text: Optional[str] = None
+        self._exact_parts: List[Mapping[Window, float]] = []
+        self._lower_bounds: Dict[Window, float] = {}
+        self._lru: "OrderedDict[str, List[Mapping[Window, float]]]" = OrderedDict()
+        self._lru_entries = 0
+
+    def begin_segment(self, asr_text: str) -> None:
+        """Start memoizing the windows of a new ASR segment.
+
+        Args:
+            asr_text: Text of the ASR segment
+        """
+        if asr_text == self._asr_text:
+            return
+        self._flush_segment()
+        self._asr_text = asr_text
+        parts = self._lru.pop(asr_text, None)
+        if parts is not None:
+            self._lru_entries -= sum(len(part) for part in parts)
+            self._exact_parts = parts
+
+    def lookup(self, windows: Sequence[Window], max_cer: Optional[float] = None) -> List[Optional[float]]:
+        """Look up the CERs of windows of the current segment.
+
+        Args:
+            windows: (start, end) token windows
+            max_cer: Bound of the query, if any. Cached lower bounds above it are returned as well
+
+        Returns:
+            The cached CER (or a value above max_cer) of each window, None on a miss
+        """
+        if not self._exact_parts and not self._lower_bounds:
+            self.misses += len(windows)
+            return [None] * len(windows)
+        exact = self._merged_exact()
+        cers = [exact.get(window) for window in windows]
+        if max_cer is not None and self._lower_bounds:
+            for idx, cer in enumerate(cers):
+                if cer is None:
+                    lower_bound = self._lower_bounds.get(windows[idx])
+                    if lower_bound is not None and lower_bound > max_cer:
+                        cers[idx] = lower_bound
+        misses = cers.count(None)
+        self.misses += misses
+        self.hits += len(cers) - misses
+        return cers
+
+    def store(self, windows: Sequence[Window], cers: Sequence[float], max_cer: Optional[float] = None) -> None:
+        """Store the CERs of windows of the current segment.
+
+        Args:
+            windows: (start, end) token windows
+            cers: The computed CERs
+            max_cer: Bound the CERs were computed with. Values above it are lower bounds
+        """
+        if max_cer is None:
+            self._exact_parts.append(dict(zip(windows, cers)))
+            return
+        exact = {}
+        for window, cer in zip(windows, cers):
+            if cer > max_cer:
+                self._lower_bounds[window] = cer
+            else:
+                exact[window] = cer
+        if exact:
+            self._exact_parts.append(exact)
+
+    def store_exact(self, cers: Mapping[Window, float]) -> None:
+        """Store exact CERs of windows of the current segment.
+
+        Args:
+            cers: Mapping from window to CER. Kept by reference, so it must not be modified afterwards
+        """
+        if cers:
+            self._exact_parts.append(cers)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def _merged_exact(self) -> Mapping[Window, float]:
+        """Merge the exact CERs of the current segment into a single mapping."""
+        if len(self._exact_parts) > 1:
+            merged: Dict[Window, float] = {}
+            for part in self._exact_parts:
+                merged.update(part)
+            self._exact_parts = [merged]
+        return self._exact_parts[0] if self._exact_parts else {}
+
+    def _flush_segment(self) -> None:
+        """Move the memo of the current segment into the LRU."""
+        if self._asr_text is not None and self.max_entries > 0 and self._exact_parts:
+            self._lru[self._asr_text] = self._exact_parts
+            self._lru_entries += sum(len(part) for part in self._exact_parts)
+            while self._lru_entries > self.max_entries:
+                _, evicted = self._lru.popitem(last=False)
+                self._lru_entries -= sum(len(part) for part in evicted)
+        self._exact_parts = []
+        self._lower_bounds = {}
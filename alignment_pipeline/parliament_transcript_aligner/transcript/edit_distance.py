@@ -0,0 +1,158 @@
+from typing import Dict, List, Optional, Sequence
+import Levenshtein
+import numpy as np
+
+try:
+    _popcount = int.bit_count  # Python >= 3.10
+except AttributeError:
+    def _popcount(value: int) -> int:
+        return bin(value).count("1")
+
+try:
+    # Installed as a dependency of python-Levenshtein >= 0.18
+    from rapidfuzz import process as _rapidfuzz_process
+    from rapidfuzz.distance import Levenshtein as _rapidfuzz_levenshtein
+except ImportError:
+    _rapidfuzz_process = None
+
+
+def batch_distances(pattern: str,
+                    texts: Sequence[str],
+                    max_distance: Optional[int] = None) -> List[int]:
+    """Compute the edit distance between one pattern and many texts.
+
+    Uses the one-vs-many kernel of rapidfuzz (bit-parallel, with the pattern
+    bit masks computed once for all texts) in a single native call, falling
+    back to one Levenshtein.distance call per text without rapidfuzz.
+
+    Args:
+        pattern: The fixed string (the ASR text)
+        texts: The strings to compare against (the candidate windows)
+        max_distance: Optional bound. Distances above it are not computed
+            exactly (the computation is abandoned early) and reported as
+            max_distance + 1
+
+    Returns:
+        Edit distance between the pattern and each text
+    """
+    if not texts:
+        return []
+    kwargs = {} if max_distance is None else {"score_cutoff": max_distance}
+    if _rapidfuzz_process is None:
+        return [Levenshtein.distance(pattern, text, **kwargs) for text in texts]
+    return _rapidfuzz_process.cdist(
+        [pattern], texts, scorer=_rapidfuzz_levenshtein.distance, dtype=np.int32, workers=1, **kwargs
+    )[0].tolist()
+
+
+class BitParallelPattern:
+    """Character-level edit distance of a fixed pattern against many texts.
+
+    Implements the bit-parallel Levenshtein algorithm of Myers (1999) in the
+    formulation of Hyyrö (2001): one column of the DP table is encoded in the
+    vertical delta bit vectors VP/VN, so processing one text character costs a
+    constant number of operations on integers of len(pattern) bits. The match
+    masks of the pattern are computed once and reused for every text.
+    """
+
+    def __init__(self, pattern: str):
+        """Precompute the match masks of the pattern.
+
+        Args:
+            pattern: The fixed string (the ASR text)
+        """
+        self.pattern = pattern
+        self.length = len(pattern)
+        match_masks: Dict[str, int] = {}
+        for idx, char in enumerate(pattern):
+            match_masks[char] = match_masks.get(char, 0) | (1 << idx)
+        self._match_masks = match_masks
+
+    def window_distances(self,
+                         text: str,
+                         starts: Sequence[int],
+                         ends: Sequence[Sequence[int]]) -> List[List[int]]:
+        """Compute the edit distance between the pattern and many windows of a text.
+
+        The windows starting at the same offset share their DP table up to the
+        shortest end, and the distance to every end can be read off the last DP
+        row. All start offsets are processed together in a single left-to-right
+        sweep over the text: each start gets its own byte-aligned lane of at
+        least len(pattern) + 1 bits in one wide integer (the spare bits catch
+        carries), and a lane is reset when the sweep reaches its start.
+
+        Args:
+            text: The text containing the windows
+            starts: Start offset of each group of windows
+            ends: For every start, the end offsets (>= start) of its windows
+
+        Returns:
+            For every start, the edit distance between the pattern and
+            text[start:end] for each of its ends
+        """
+        if self.length == 0:
+            return [[end - start for end in group_ends] for start, group_ends in zip(starts, ends)]
+        if not starts:
+            return []
+
+        length = self.length
+        lane_bytes = length // 8 + 1
+        lane_width = 8 * lane_bytes
+        total_bytes = lane_bytes * len(starts)
+        lane_mask = (1 << length) - 1
+        lane_offsets = [lane * lane_width for lane in range(len(starts))]
+        low_bits = sum(1 << offset for offset in lane_offsets)
+        full_mask = lane_mask * low_bits
+
+        # Sweep events: lanes to reset before reading a position, distances to record at a position
+        resets: Dict[int, int] = {}
+        records: Dict[int, List[tuple]] = {}
+        for lane, (start, group_ends) in enumerate(zip(starts, ends)):
+            resets[start] = resets.get(start, 0) | (lane_mask << lane_offsets[lane])
+            for idx, end in enumerate(group_ends):
+                records.setdefault(end, []).append((lane, idx))
+
+        distances: List[List[int]] = [[0] * len(group_ends) for group_ends in ends]
+        replicated_masks: Dict[str, int] = {}
+        vp = full_mask
+        vn = 0
+        first = min(starts)
+        last = max((max(group_ends) for group_ends in ends if group_ends), default=first)
+
+        for position in range(first, last + 1):
+            reset = resets.get(position)
+            if reset:
+                vp |= reset
+                vn &= ~reset
+            position_records = records.get(position)
+            if position_records:
+                vp_bytes = vp.to_bytes(total_bytes, "little")
+                vn_bytes = vn.to_bytes(total_bytes, "little")
+                for lane, idx in position_records:
+                    # D[m][j] = D[0][j] + sum of the vertical deltas of column j
+                    lo = lane * lane_bytes
+                    hi = lo + lane_bytes
+                    distances[lane][idx] = (
+                        position - starts[lane]
+                        + _popcount(int.from_bytes(vp_bytes[lo:hi], "little"))
+                        - _popcount(int.from_bytes(vn_bytes[lo:hi], "little"))
+                    )
+            if position == last:
+                break
+
+            char = text[position]
+            eq = replicated_masks.get(char)
+            if eq is None:
+                eq = self._match_masks.get(char, 0) * low_bits
+                replicated_masks[char] = eq
+            xv = eq | vn
+            xh = (((eq & vp) + vp) ^ vp) | eq
+            hp = vn | (~(xh | vp) & full_mask)
+            hn = vp & xh
+            # Shifting in a 1 keeps the first DP row at D[0][j] = j (global, not substring, distance)
+            hp = ((hp << 1) | low_bits) & full_mask
+            hn = (hn << 1) & full_mask
+            vp = hn | (~(xv | hp) & full_mask)
+            vn = hp & xv
+
+        return distances
@@ -0,0 +1,203 @@
+from typing import List, Dict, Optional, Tuple
+from collections import defaultdict
+import bisect
+import numpy as np
+
+from .anchor_index import normalize_anchor_token
+
+# Backpointer codes of the banded dynamic programming table
+_DIAGONAL = 0  # ASR token aligned to human token (match or substitution)
+_UP = 1        # ASR token without counterpart in the human transcript
+_LEFT = 2      # Human token without counterpart in the ASR output (not spoken / not recognized)
+
+_INFINITY = np.iinfo(np.int64).max // 4
+
+
+def intern_tokens(tokens: List[str], vocabulary: Dict[str, int]) -> np.ndarray:
+    """Map tokens to integer IDs after normalization, extending the vocabulary as needed.
+
+    Args:
+        tokens: Tokens to intern
+        vocabulary: Mapping from normalized token to ID, updated in place
+
+    Returns:
+        Array of token IDs
+    """
+    ids = np.empty(len(tokens), dtype=np.int64)
+    for idx, token in enumerate(tokens):
+        ids[idx] = vocabulary.setdefault(normalize_anchor_token(token), len(vocabulary))
+    return ids
+
+
+def _unique_ngrams(ids: np.ndarray, n: int) -> Dict[Tuple[int, ...], int]:
+    """Map every n-gram occurring exactly once in ids to its position."""
+    positions: Dict[Tuple[int, ...], List[int]] = defaultdict(list)
+    id_list = ids.tolist()
+    for idx in range(len(id_list) - n + 1):
+        positions[tuple(id_list[idx:idx + n])].append(idx)
+    return {ngram: idxs[0] for ngram, idxs in positions.items() if len(idxs) == 1}
+
+
+def longest_increasing_subsequence(values: List[int]) -> List[int]:
+    """Find the longest strictly increasing subsequence (patience sorting with predecessors).
+
+    Args:
+        values: Sequence of values
+
+    Returns:
+        Indices of the subsequence in values, in increasing order
+    """
+    tails: List[int] = []
+    tail_indices: List[int] = []
+    predecessors = [-1] * len(values)
+    for idx, value in enumerate(values):
+        slot = bisect.bisect_left(tails, value)
+        if slot == len(tails):
+            tails.append(value)
+            tail_indices.append(idx)
+        else:
+            tails[slot] = value
+            tail_indices[slot] = idx
+        predecessors[idx] = tail_indices[slot - 1] if slot > 0 else -1
+
+    chain = []
+    idx = tail_indices[-1] if tail_indices else -1
+    while idx >= 0:
+        chain.append(idx)
+        idx = predecessors[idx]
+    chain.reverse()
+    return chain
+
+
+def anchor_guide(asr_ids: np.ndarray,
+                 human_ids: np.ndarray,
+                 n: int = 3) -> Optional[np.ndarray]:
+    """Estimate the human token position of every ASR token from unique n-gram anchors.
+
+    N-grams that occur exactly once in both streams are anchor candidates. The
+    longest chain of candidates that is increasing in both streams is kept, and
+    positions between anchors are interpolated.
+
+    Args:
+        asr_ids: Token IDs of the concatenated ASR output
+        human_ids: Token IDs of the human transcript
+        n: Number of tokens per n-gram
+
+    Returns:
+        Expected human token index per ASR token, or None if no anchor was found
+    """
+    human_ngrams = _unique_ngrams(human_ids, n)
+    pairs = sorted(
+        (asr_pos, human_ngrams[ngram])
+        for ngram, asr_pos in _unique_ngrams(asr_ids, n).items()
+        if ngram in human_ngrams
+    )
+    if not pairs:
+        return None
+
+    chain = [pairs[idx] for idx in longest_increasing_subsequence([human_pos for _, human_pos in pairs])]
+
+    anchor_asr = np.array([asr_pos for asr_pos, _ in chain], dtype=np.float64)
+    anchor_human = np.array([human_pos for _, human_pos in chain], dtype=np.float64)
+    rows = np.arange(len(asr_ids), dtype=np.float64)
+    guide = np.interp(rows, anchor_asr, anchor_human)
+    # Outside the anchored range, assume one human token per ASR token
+    guide = np.where(rows < anchor_asr[0], anchor_human[0] - (anchor_asr[0] - rows), guide)
+    guide = np.where(rows > anchor_asr[-1], anchor_human[-1] + (rows - anchor_asr[-1]), guide)
+    return np.clip(np.rint(guide), 0, len(human_ids)).astype(np.int64)
+
+
+def banded_monotonic_alignment(asr_ids: np.ndarray,
+                               human_ids: np.ndarray,
+                               band_width: int = 250,
+                               guide: Optional[np.ndarray] = None) -> np.ndarray:
+    """Align an ASR token stream to a human token stream in one banded DP pass.
+
+    Computes a word-level edit distance alignment in which leading and trailing
+    human tokens are free (the recording may cover only part of the transcript).
+    Each DP row only keeps a band of 2 * band_width + 1 columns, so runtime and
+    memory are O(len(asr_ids) * band_width). The band is centered on the guide
+    (see anchor_guide) if given, otherwise it follows the cheapest cell of the
+    previous row. It never moves backwards; when it jumps forward, the skipped
+    human tokens are charged as deletions.
+
+    Args:
+        asr_ids: Token IDs of the concatenated ASR output
+        human_ids: Token IDs of the human transcript
+        band_width: Number of columns kept on each side of the band center
+        guide: Optional expected human token index per ASR token
+
+    Returns:
+        Array with the human token index aligned to each ASR token, or -1 for
+        ASR tokens without counterpart
+    """
+    num_asr = len(asr_ids)
+    num_human = len(human_ids)
+    width = min(2 * band_width + 1, num_human + 1)
+    columns = np.arange(width, dtype=np.int64)
+    mapping = np.full(num_asr, -1, dtype=np.int64)
+    if num_asr == 0 or num_human == 0:
+        return mapping
+
+    # Column j of the DP table corresponds to the human prefix of length j
+    padded_human = np.concatenate([[-1], human_ids])
+
+    backpointers = np.empty((num_asr, width), dtype=np.int8)
+    row_offsets = np.empty(num_asr + 1, dtype=np.int64)
+
+    max_offset = num_human + 1 - width
+    start_center = int(guide[0]) if guide is not None else 0
+    offset = int(min(max(start_center - band_width, 0), max_offset))
+    row_offsets[0] = offset
+    previous = np.zeros(width, dtype=np.int64)  # Leading human tokens are free
+
+    for i in range(1, num_asr + 1):
+        previous_offset = offset
+        if guide is not None:
+            center = int(guide[i - 1]) + 1
+        else:
+            center = previous_offset + int(np.argmin(previous))
+        offset = int(min(max(center - band_width, previous_offset), max_offset))
+        shift = offset - previous_offset
+        row_offsets[i] = offset
+
+        # Extend the previous row to the right of its band by deleting human tokens
+        extended = np.concatenate([previous, previous[-1] + np.arange(1, shift + 1, dtype=np.int64)])
+
+        # Cost of aligning ASR token i-1 with the human token left of each column
+        substitution = (padded_human[offset:offset + width] != asr_ids[i - 1]).astype(np.int64)
+
+        up = extended[shift:shift + width] + 1
+        diagonal = np.full(width, _INFINITY, dtype=np.int64)
+        if shift > 0:
+            diagonal[:] = extended[shift - 1:shift - 1 + width] + substitution
+        else:
+            diagonal[1:] = extended[:width - 1] + substitution[1:]
+
+        best_vertical = np.minimum(diagonal, up)
+
+        # Horizontal moves within the row: D[k] = min_{m <= k} best_vertical[m] + (k - m)
+        current = np.minimum.accumulate(best_vertical - columns) + columns
+
+        pointers = np.where(diagonal <= up, _DIAGONAL, _UP).astype(np.int8)
+        pointers[current < best_vertical] = _LEFT
+        backpointers[i - 1] = pointers
+        previous = current
+
+    # Trailing human tokens are free: start the traceback at the cheapest cell of the last row
+    i = num_asr
+    k = int(np.argmin(previous))
+    while i > 0:
+        pointer = backpointers[i - 1, k]
+        j = row_offsets[i] + k
+        if pointer == _LEFT:
+            k -= 1
+            continue
+        if pointer == _DIAGONAL:
+            mapping[i - 1] = j - 1
+            j -= 1
+        i -= 1
+        # Cells right of the previous band were reached by deleting human tokens from its last column
+        k = min(j - row_offsets[i], width - 1)
+
+    return mapping
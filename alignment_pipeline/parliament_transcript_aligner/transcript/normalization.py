@@ -0,0 +1,99 @@
+from typing import List, Tuple
+import re
+
+_PUNCTUATION_PATTERN = re.compile(r"[^\w\s]+|_+", re.UNICODE)
+_WHITESPACE_PATTERN = re.compile(r"\s+", re.UNICODE)
+_NUMBER_PATTERN = re.compile(r"\d+")
+_THOUSANDS_SEPARATOR_PATTERN = re.compile(r"(?<=\d)[,.'](?=\d{3}(?!\d))")
+
+
+class TextNormalizer:
+    """Normalizes transcript and ASR text before they are compared.
+
+    Human transcripts and ASR output differ in casing, punctuation and number
+    formatting (e.g. "Mr. President, 42" vs. "mr president forty two"), which
+    inflates the CER of otherwise identical text. The normalizer maps both to
+    the same form: lowercase, punctuation replaced by spaces, and optionally
+    numbers spelled out in the given language.
+
+    Both the transcript and the ASR text are split into normalized words with
+    normalize_words: a token that only contained punctuation yields no word, a
+    token with separated words or an expanded number yields several. The
+    transcript keeps the index of the original token of every word.
+    """
+
+    def __init__(self,
+                 lowercase: bool = True,
+                 strip_punctuation: bool = True,
+                 expand_numbers: bool = False,
+                 language: str = "en"):
+        """Initialize the normalizer.
+
+        Args:
+            lowercase: Whether to lowercase the text
+            strip_punctuation: Whether to replace punctuation by spaces
+            expand_numbers: Whether to spell out numbers (requires num2words)
+            language: Language of the text as ISO 639-1 code, used to spell out numbers
+
+        Raises:
+            ImportError: If expand_numbers is set but num2words is not installed
+        """
+        self.lowercase = lowercase
+        self.strip_punctuation = strip_punctuation
+        self.expand_numbers = expand_numbers
+        self.language = language
+        self._num2words = None
+        if expand_numbers:
+            try:
+                from num2words import num2words
+            except ImportError:
+                raise ImportError("Please install num2words to expand numbers: pip install num2words")
+            self._num2words = num2words
+
+    def normalize_token(self, token: str) -> str:
+        """Normalize a single token.
+
+        Args:
+            token: Token of a whitespace-tokenized text
+
+        Returns:
+            Normalized token. Empty if it only contained punctuation, and possibly
+            containing spaces if punctuation separated words or a number was expanded
+        """
+        if self.lowercase:
+            token = token.lower()
+        if self.expand_numbers and any(char.isdigit() for char in token):
+            token = _NUMBER_PATTERN.sub(self._expand_number, _THOUSANDS_SEPARATOR_PATTERN.sub("", token))
+        if self.strip_punctuation:
+            token = _WHITESPACE_PATTERN.sub(" ", _PUNCTUATION_PATTERN.sub(" ", token)).strip()
+        return token
+
+    def normalize_words(self, tokens: List[str]) -> Tuple[List[str], List[int]]:
+        """Normalize the tokens of a text into words.
+
+        Args:
+            tokens: Tokens of a whitespace-tokenized text
+
+        Returns:
+            Tuple of (normalized words, index of the token every word comes from)
+        """
+        words = []
+        origins = []
+        for idx, token in enumerate(tokens):
+            for word in self.normalize_token(token).split():
+                words.append(word)
+                origins.append(idx)
+        return words, origins
+
+    def normalize_text(self, text: str) -> str:
+        """Normalize a whitespace-tokenized text (e.g. an ASR segment), words separated by single spaces."""
+        return " ".join(self.normalize_words(text.split())[0])
+
+    def _expand_number(self, match: "re.Match") -> str:
+        try:
+            words = self._num2words(int(match.group()), lang=self.language)
+        except (NotImplementedError, OverflowError, ValueError):
+            # Language not supported by num2words, or number too large
+            return match.group()
+        return f" {words.lower() if self.lowercase else words} "
+
@@ -0,0 +1,99 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
+
+
+@dataclass
+class PositionEstimate:
+    """Expected transcript position of an ASR segment with a confidence band."""
+    expected_idx: int
+    start_idx: int  # First token of the band
+    end_idx: int    # Token after the last token of the band
+
+
+class SpeechRatePositionPrior:
+    """Predicts the transcript position of ASR segments from their audio time.
+
+    Confidently aligned segments are observed as (audio time, token index)
+    points. The speech rate in tokens per second is the slope of a least
+    squares fit over the most recent points, and a new segment is expected at
+    the position of the last point, extrapolated with that rate. The band
+    around the expected position grows with the extrapolated distance (the
+    speech rate varies and the transcript may contain unspoken text) and with
+    the scatter of the points around the fit.
+    """
+
+    def __init__(self,
+                 min_observations: int = 5,
+                 max_observations: int = 50,
+                 min_band_tokens: int = 150,
+                 band_slack: float = 0.5):
+        """Initialize the prior.
+
+        Args:
+            min_observations: Number of observed segments before predictions are made
+            max_observations: Number of most recent segments the speech rate is estimated from
+            min_band_tokens: Minimum number of tokens on each side of the expected position
+            band_slack: Additional band width per extrapolated token, relative to the distance
+                between the last observed and the expected position
+        """
+        self.min_observations = min_observations
+        self.min_band_tokens = min_band_tokens
+        self.band_slack = band_slack
+        self._times = deque(maxlen=2 * max_observations)
+        self._positions = deque(maxlen=2 * max_observations)
+
+    def __len__(self) -> int:
+        return len(self._times) // 2
+
+    def observe(self, start_time: float, end_time: float, start_idx: int, end_idx: int) -> None:
+        """Add a confidently aligned segment.
+
+        Args:
+            start_time: Start of the segment in the audio (seconds)
+            end_time: End of the segment in the audio (seconds)
+            start_idx: First transcript token of the match
+            end_idx: Token after the last transcript token of the match
+        """
+        self._times.extend((start_time, end_time))
+        self._positions.extend((start_idx, end_idx))
+
+    def tokens_per_second(self) -> Optional[float]:
+        """Estimate the current speech rate, or None without enough observations."""
+        if len(self) < self.min_observations:
+            return None
+        times = np.fromiter(self._times, dtype=np.float64)
+        if np.ptp(times) <= 0:
+            return None
+        rate = np.polyfit(times, np.fromiter(self._positions, dtype=np.float64), 1)[0]
+        return float(rate) if rate > 0 else None
+
+    def predict(self, time: float, num_tokens: int) -> Optional[PositionEstimate]:
+        """Predict the transcript position of a segment starting at the given audio time.
+
+        Args:
+            time: Start of the segment in the audio (seconds)
+            num_tokens: Number of tokens in the transcript
+
+        Returns:
+            PositionEstimate, or None if the speech rate cannot be estimated yet
+        """
+        rate = self.tokens_per_second()
+        if rate is None:
+            return None
+        times = np.fromiter(self._times, dtype=np.float64)
+        positions = np.fromiter(self._positions, dtype=np.float64)
+        scatter = float(np.std(positions - rate * times))
+
+        last_time = self._times[-1]
+        last_idx = self._positions[-1]
+        expected = last_idx + rate * (time - last_time)
+        margin = self.min_band_tokens + self.band_slack * abs(expected - last_idx) + 2 * scatter
+
+        expected_idx = int(min(max(round(expected), 0), num_tokens))
+        return PositionEstimate(
+            expected_idx=expected_idx,
+            start_idx=int(min(max(expected - margin, 0), num_tokens)),
+            end_idx=int(min(max(expected + margin, 0), num_tokens))
+        )
@@ -0,0 +1,190 @@
+from typing import Dict, List, Optional
+import numpy as np
+
+from .anchor_index import normalize_anchor_token
+from .global_alignment import intern_tokens
+from .normalization import TextNormalizer
+
+
+def _token_offsets(tokens: List[str]) -> tuple:
+    """Character offsets of the tokens in " ".join(tokens), as (starts, ends) arrays."""
+    lengths = np.fromiter((len(token) for token in tokens), dtype=np.int64, count=len(tokens))
+    # Every token is followed by one space, except the last one
+    starts = np.zeros(len(tokens), dtype=np.int64)
+    starts[1:] = np.cumsum(lengths + 1)[:-1]
+    return starts, starts + lengths
+
+
+class TranscriptView:
+    """Tokenized human transcript with character offsets into one joined string.
+
+    Built once per alignment. The text of any token window is a single slice of
+    the joined string, instead of a list slice plus a join for every candidate
+    window. Python strings cannot be viewed without copying, so the slice is the
+    only allocation left per window; windows that are scored with the
+    bit-parallel kernel are not materialized at all, as the kernel reads the
+    joined string directly between the character offsets.
+
+    The tokens that are compared may be the normalized words of the original
+    tokens (see TextNormalizer.normalize_words), with no, one or several words
+    per original token. Token indices refer to the words, and token_origins maps
+    every word to its original token: the original text of a window is sliced
+    from the joined original tokens, from the original token of its first word
+    to that of its last word.
+    """
+
+    def __init__(self,
+                 tokens: List[str],
+                 original_tokens: Optional[List[str]] = None,
+                 token_origins: Optional[List[int]] = None):
+        """Join the tokens and compute their character offsets.
+
+        Args:
+            tokens: Tokenized human transcript
+            original_tokens: Original tokens if tokens are normalized
+            token_origins: Index of the original token of every token, in increasing order
+                (default: one original token per token)
+        """
+        self.tokens = tokens
+        self.text = " ".join(tokens)
+        self.token_starts, self.token_ends = _token_offsets(tokens)
+        # Plain lists for the per-window lookups, indexing numpy arrays element-wise is slow
+        self._starts = self.token_starts.tolist()
+        self._ends = self.token_ends.tolist()
+        if token_origins is not None and len(token_origins) != len(tokens):
+            raise ValueError("Expected the original token index of every token")
+        if token_origins is None and original_tokens is not None and len(original_tokens) != len(tokens):
+            raise ValueError("Expected one original token per token")
+        self.token_origins = token_origins
+        if original_tokens is None:
+            self.original_tokens = tokens
+            self.original_text = self.text
+            self._original_starts, self._original_ends = self._starts, self._ends
+        else:
+            self.original_tokens = original_tokens
+            self.original_text = " ".join(original_tokens)
+            original_starts, original_ends = _token_offsets(original_tokens)
+            self._original_starts, self._original_ends = original_starts.tolist(), original_ends.tolist()
+        # Word IDs for the word-level region search, interned on first use
+        self._vocabulary: Optional[Dict[str, int]] = None
+        self._word_ids: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_text(cls, text: str) -> "TranscriptView":
+        """Create a view of a whitespace-tokenized transcript text."""
+        return cls(text.split())
+
+    @classmethod
+    def normalized(cls, text: str, normalizer: TextNormalizer) -> "TranscriptView":
+        """Create a view of the normalized words of a transcript text, keeping the original tokens."""
+        original_tokens = text.split()
+        words, origins = normalizer.normalize_words(original_tokens)
+        return cls(words, original_tokens, origins)
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def char_span(self, start_idx: int, end_idx: int) -> tuple:
+        """Get the character offsets of a token window.
+
+        Args:
+            start_idx: First token of the window
+            end_idx: Token after the last token of the window. Follows Python slice
+                semantics, i.e. negative values count from the end of the transcript
+
+        Returns:
+            Tuple of (start, end) character offsets in text, start == end for empty windows
+        """
+        num_tokens = len(self.tokens)
+        if not 0 <= start_idx < end_idx <= num_tokens:
+            start_idx, end_idx, _ = slice(start_idx, end_idx).indices(num_tokens)
+            if end_idx <= start_idx:
+                offset = self._starts[start_idx] if start_idx < num_tokens else len(self.text)
+                return offset, offset
+        return self._starts[start_idx], self._ends[end_idx - 1]
+
+    def window_text(self, start_idx: int, end_idx: int) -> str:
+        """Get the text of a token window.
+
+        Equivalent to " ".join(tokens[start_idx:end_idx]).
+
+        Args:
+            start_idx: First token of the window
+            end_idx: Token after the last token of the window (Python slice semantics)
+
+        Returns:
+            The window text
+        """
+        if 0 <= start_idx < end_idx <= len(self.tokens):
+            return self.text[self._starts[start_idx]:self._ends[end_idx - 1]]
+        start, end = self.char_span(start_idx, end_idx)
+        return self.text[start:end]
+
+    def original_span(self, start_idx: int, end_idx: int) -> tuple:
+        """Map a token window to the window of the original tokens it comes from.
+
+        Args:
+            start_idx: First token of the window
+            end_idx: Token after the last token of the window (Python slice semantics)
+
+        Returns:
+            Tuple of (start, end) original token indices, start == end for empty windows
+        """
+        num_tokens = len(self.tokens)
+        if not 0 <= start_idx < end_idx <= num_tokens:
+            start_idx, end_idx, _ = slice(start_idx, end_idx).indices(num_tokens)
+        origins = self.token_origins
+        if origins is None:
+            return start_idx, max(end_idx, start_idx)
+        start = origins[start_idx] if start_idx < num_tokens else len(self.original_tokens)
+        if end_idx <= start_idx:
+            return start, start
+        return start, origins[end_idx - 1] + 1
+
+    def original_window_text(self, start_idx: int, end_idx: int) -> str:
+        """Get the original (not normalized) text of a token window.
+
+        Equivalent to " ".join(original_tokens[start:end]) for the original window (start, end)
+        of original_span.
+
+        Args:
+            start_idx: First token of the window
+            end_idx: Token after the last token of the window (Python slice semantics)
+
+        Returns:
+            The original window text
+        """
+        start, end = self.original_span(start_idx, end_idx)
+        if end <= start:
+            return ""
+        return self.original_text[self._original_starts[start]:self._original_ends[end - 1]]
+
+    def word_ids(self) -> np.ndarray:
+        """Get the integer IDs of the normalized tokens (see normalize_anchor_token).
+
+        Interned on first use. Equal normalized tokens share an ID, so word windows
+        can be compared as integer arrays instead of strings.
+
+        Returns:
+            ID of every token
+        """
+        if self._word_ids is None:
+            self._vocabulary = {}
+            self._word_ids = intern_tokens(self.tokens, self._vocabulary)
+        return self._word_ids
+
+    def encode_words(self, tokens: List[str]) -> np.ndarray:
+        """Map tokens of another text (e.g. an ASR segment) to the word IDs of this transcript.
+
+        Args:
+            tokens: Tokens to map
+
+        Returns:
+            ID of every token, -1 for tokens that do not occur in the transcript
+        """
+        if self._vocabulary is None:
+            self.word_ids()
+        vocabulary = self._vocabulary
+        return np.fromiter(
+            (vocabulary.get(normalize_anchor_token(token), -1) for token in tokens), dtype=np.int64, count=len(tokens)
+        )
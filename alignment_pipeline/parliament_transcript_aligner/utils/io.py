@@ -5,7 +5,6 @@ from pathlib import Path
 import os
 from typing import List, Tuple, Dict, Any, Optional, Union
 import subprocess
-from pydub import AudioSegment
 import logging
 
 from ..data_models.models import TranscribedSegment, AlignedTranscript
@@ -1,14 +1,14 @@
 import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional, Union, List
-
-import dotenv
-
-from supabase import create_client, Client
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union, List
 
 from ...utils.io import get_audio_directory_stats
 
+if TYPE_CHECKING:
+    # supabase and dotenv are imported when a client is created, so that runs without logging do not import them
+    from supabase import Client
+
 logger = logging.getLogger(__name__)
 
 # Video alignment status constants
@@ -67,7 +67,9 @@ class SupabaseClient:
             key: Supabase API key
             parliament_id: Unique identifier for the parliament
         """
-        self.client: Client = create_client(url, key)
+        from supabase import create_client
+
+        self.client: "Client" = create_client(url, key)
         self.parliament_id = parliament_id
 
         # check if the parliament_id exist in the database
@@ -462,6 +464,7 @@ def get_supabase( parliament_id: str, audio_dirs: List[str], url: Optional[str]
     """
     import os
     if environment_file_path:
+        import dotenv
         dotenv.load_dotenv(environment_file_path)
     
     url = url or os.environ.get('SUPABASE_URL')
@@ -29,6 +29,7 @@ setup(
         "transformers>=4.26.0",
         "torch>=1.13.1",
         "python-Levenshtein>=0.20.9",
+        "rapidfuzz>=2.0.0",
         "pydub>=0.25.1",
         "tqdm>=4.65.0",
         "numpy>=1.24.2",
@@ -0,0 +1,34 @@
+"""Tests of the window scan fallback when the anchor index has no candidate region."""
+
+import random
+
+from pyannote.core import Segment
+
+from parliament_transcript_aligner.data_models.models import TranscribedSegment
+from parliament_transcript_aligner.transcript.aligner import TranscriptAligner
+from parliament_transcript_aligner.transcript.anchor_index import NGramAnchorIndex
+from parliament_transcript_aligner.transcript.transcript_view import TranscriptView
+
+
+def with_typo(word: str, rnd: random.Random) -> str:
+    """Replace one character, so that the word no longer matches any transcript word."""
+    position = rnd.randrange(len(word))
+    return word[:position] + "x" + word[position + 1:]
+
+
+def test_segment_without_common_ngram_is_found_by_the_window_scan():
+    rnd = random.Random(0)
+    words = ["".join(rnd.choice("aeioukmnprst") for _ in range(rnd.randint(4, 9))) for _ in range(2000)]
+    transcript = TranscriptView(words)
+    anchor_index = NGramAnchorIndex(words, n=3)
+    start = 600
+    asr_words = [with_typo(word, rnd) for word in words[start:start + 20]]
+    segment = TranscribedSegment(Segment(0, 8), " ".join(asr_words))
+    assert anchor_index.candidate_starts(asr_words) == []
+
+    aligner = TranscriptAligner()
+    match = aligner.find_best_match(segment, transcript, start - 30, anchor_index=anchor_index)
+
+    assert aligner.stats.anchor_misses == 1
+    assert (match.start_idx, match.end_idx) == (start, start + 20)
+    assert match.cer < 0.2
@@ -0,0 +1,99 @@
+"""Tests of the anchored alignment engine and its process pool."""
+
+import random
+
+import pytest
+from pyannote.core import Segment
+
+from parliament_transcript_aligner.data_models.models import TranscribedSegment
+from parliament_transcript_aligner.transcript import aligner as aligner_module
+from parliament_transcript_aligner.transcript.aligner import TranscriptAligner, _AnchoredWorker
+from parliament_transcript_aligner.transcript.transcript_view import TranscriptView
+
+
+def make_session(num_words: int, seed: int):
+    """Create a transcript and noisy ASR segments covering it."""
+    rnd = random.Random(seed)
+    vocab = [''.join(rnd.choice('aeioukmnprst') for _ in range(rnd.randint(2, 9))) for _ in range(1500)]
+    words = [rnd.choice(vocab) for _ in range(num_words)]
+    segments = []
+    position = 0
+    while position < num_words:
+        length = rnd.randint(3, 40)
+        asr_words = [word if rnd.random() > 0.08 else rnd.choice(vocab) for word in words[position:position + length]]
+        segments.append(TranscribedSegment(Segment(position / 2.5, (position + length) / 2.5), ' '.join(asr_words)))
+        position += length
+    return segments, ' '.join(words)
+
+
+def alignment_keys(aligned_segments):
+    return [(aligned.start_idx, aligned.end_idx, aligned.cer, aligned.human_text) for aligned in aligned_segments]
+
+
+def test_anchor_span_gives_the_fine_tuning_of_the_full_transcript():
+    rnd = random.Random(0)
+    aligner = TranscriptAligner()
+    worker = _AnchoredWorker(aligner._greedy_config())
+    words = [rnd.choice(['a', 'b', 'ab', 'ba', 'ccc']) for _ in range(300)]
+    transcript = TranscriptView(words)
+    for trial in range(500):
+        text = ' '.join(rnd.choice(['a', 'b', 'ab', 'ba', 'ccc']) for _ in range(rnd.randint(1, 40)))
+        segment = TranscribedSegment(Segment(0, 1), text)
+        region_start = rnd.choice([rnd.randint(0, 40), rnd.randint(0, len(words) - 1), len(words) - rnd.randint(1, 40)])
+
+        expected = aligner._fine_tune_match(segment, transcript, region_start)
+        expected = expected and (expected.start_idx, expected.end_idx, expected.cer)
+        actual, _ = worker.verify_anchor((segment, region_start, *aligner._anchor_span(segment, region_start, transcript)))
+        assert actual == expected, f"Trial {trial}: {text!r}, region {region_start}"
+
+
+def test_anchor_span_contains_every_fine_tuning_window():
+    """Every window fine-tuning scores has the same text in the span as in the full transcript."""
+    rnd = random.Random(1)
+    aligner = TranscriptAligner()
+    margin = aligner.window_token_margin // 2
+    transcript = TranscriptView([str(idx) for idx in range(200)])
+    for num_predicted in range(1, 45):
+        for region_start in list(range(0, 50)) + list(range(150, 200)) + [rnd.randint(0, 199) for _ in range(5)]:
+            segment = TranscribedSegment(Segment(0, 1), ' '.join(['x'] * num_predicted))
+            span_start, span_tokens = aligner._anchor_span(segment, region_start, transcript)
+            span = TranscriptView(span_tokens)
+            for start in range(region_start - margin, region_start + margin + 1):
+                local_start = start - span_start
+                assert (start < 0) == (local_start < 0)
+                if start < 0:
+                    continue
+                for end in range(start + num_predicted - margin, start + num_predicted + margin + 1):
+                    local_end = end - span_start
+                    assert (end > len(transcript)) == (local_end > len(span))
+                    if end > len(transcript):
+                        break
+                    assert span.window_text(local_start, local_end) == transcript.window_text(start, end)
+
+
+def test_process_pool_is_reused_and_matches_the_calling_process():
+    sessions = [make_session(6000, seed) for seed in range(2)]
+    inline = TranscriptAligner(engine="anchored", anchored_workers=1)
+    expected = [alignment_keys(inline.align_transcript(segments, transcript)) for segments, transcript in sessions]
+    assert inline._anchored_executor is None
+
+    with TranscriptAligner(engine="anchored", anchored_workers=2) as parallel:
+        actual = [alignment_keys(parallel.align_transcript(*sessions[0]))]
+        executor = parallel._anchored_executor
+        assert executor is not None
+        actual.append(alignment_keys(parallel.align_transcript(*sessions[1])))
+        assert parallel._anchored_executor is executor
+    assert parallel._anchored_executor is None
+    assert actual == expected
+
+
+def test_small_sessions_are_aligned_in_the_calling_process(monkeypatch):
+    segments, transcript = make_session(1000, seed=3)
+    assert len(segments) < 2 * aligner_module._ANCHORED_MIN_SEGMENTS_PER_WORKER
+
+    def no_pool(*args, **kwargs):
+        pytest.fail("a process pool was started for a small session")
+
+    monkeypatch.setattr(aligner_module, "ProcessPoolExecutor", no_pool)
+    aligned = TranscriptAligner(engine="anchored", anchored_workers=4).align_transcript(segments, transcript)
+    assert len(aligned) == len(segments)
@@ -0,0 +1,80 @@
+"""Tests of the ASRWorkerPool with the stub backend."""
+
+from functools import partial
+
+import numpy as np
+import pytest
+from multiprocessing import shared_memory
+
+from parliament_transcript_aligner.audio_processing import asr_pool
+from parliament_transcript_aligner.audio_processing.asr import StubBackend, create_asr_backend
+from parliament_transcript_aligner.audio_processing.asr_pool import ASRWorkerPool
+from parliament_transcript_aligner.audio_processing.audio_buffer import audio_slice
+
+
+def make_audio(seconds: float, seed: int) -> np.ndarray:
+    return np.random.default_rng(seed).uniform(-0.5, 0.5, int(seconds * 16000)).astype(np.float32)
+
+
+def make_batches(seconds: float, segment_seconds: float, batch_size: int) -> list:
+    ranges = [(start, min(start + segment_seconds, seconds)) for start in np.arange(0.0, seconds, segment_seconds)]
+    return [ranges[index:index + batch_size] for index in range(0, len(ranges), batch_size)]
+
+
+def expected_texts(audio: np.ndarray, batches: list) -> list:
+    backend = StubBackend()
+    return [backend.transcribe_batch([audio_slice(audio, start, end) for start, end in batch]) for batch in batches]
+
+
+@pytest.fixture
+def shared_memory_names(monkeypatch):
+    """Record the names of the shared memory blocks created by the pool."""
+    names = []
+
+    class RecordingSharedMemory(shared_memory.SharedMemory):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            names.append(self.name)
+
+    monkeypatch.setattr(asr_pool.shared_memory, "SharedMemory", RecordingSharedMemory)
+    return names
+
+
+def assert_released(names: list) -> None:
+    for name in names:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+
+def test_batches_are_reassembled_in_order(shared_memory_names):
+    audio = make_audio(60.0, seed=0)
+    batches = make_batches(60.0, 4.0, 2)
+    backend_factory = partial(create_asr_backend, "stub", seconds_per_audio_second=0.01)
+
+    with ASRWorkerPool(backend_factory, ["cpu", "cpu"]) as pool:
+        results = {}
+        for number, texts, _ in pool.transcribe(audio, batches):
+            assert number not in results
+            results[number] = texts
+    assert [results[number] for number in range(len(batches))] == expected_texts(audio, batches)
+    assert len(shared_memory_names) == 1
+    assert_released(shared_memory_names)
+
+
+def test_results_of_abandoned_session_are_dropped(shared_memory_names):
+    first_audio, second_audio = make_audio(60.0, seed=1), make_audio(60.0, seed=2)
+    batches = make_batches(60.0, 2.0, 1)
+    backend_factory = partial(create_asr_backend, "stub", seconds_per_audio_second=0.02)
+
+    with ASRWorkerPool(backend_factory, ["cpu", "cpu"]) as pool:
+        abandoned = pool.transcribe(first_audio, batches)
+        next(abandoned)
+        abandoned.close()
+
+        results = {}
+        for number, texts, _ in pool.transcribe(second_audio, batches):
+            assert number not in results
+            results[number] = texts
+    assert [results[number] for number in range(len(batches))] == expected_texts(second_audio, batches)
+    assert len(shared_memory_names) == 2
+    assert_released(shared_memory_names)
@@ -0,0 +1,80 @@
+"""Tests of the ASRServer and ASRClient with the stub backend."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from parliament_transcript_aligner.audio_processing.asr import StubBackend
+from parliament_transcript_aligner.audio_processing.asr_server import ASRClient, ASRServer
+
+
+class FailingOnNaNBackend(StubBackend):
+    """Stub backend that fails on every batch containing a segment with NaN samples."""
+
+    def transcribe_batch(self, arrays, language=None):
+        if any(np.isnan(array).any() for array in arrays):
+            raise ValueError("NaN samples")
+        return super().transcribe_batch(arrays, language)
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = ASRServer(FailingOnNaNBackend(), str(tmp_path / "asr.sock"), max_batch_size=8, max_wait=0.1)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.close()
+
+
+def make_segments(client_number: int, request_number: int, count: int = 3) -> list:
+    rng = np.random.default_rng(client_number * 1000 + request_number)
+    return [rng.uniform(-0.5, 0.5, int(16000 * rng.uniform(0.5, 3.0))).astype(np.float32) for _ in range(count)]
+
+
+def run_clients(server: ASRServer, requests: dict) -> dict:
+    """Send the requests of every client (list of segment lists) concurrently, return the texts or errors."""
+    results = {}
+
+    def client(client_number: int) -> None:
+        asr_client = ASRClient(server.address)
+        results[client_number] = []
+        for segments in requests[client_number]:
+            try:
+                results[client_number].append(asr_client.transcribe_batch(segments))
+            except RuntimeError as e:
+                results[client_number].append(e)
+        asr_client.close()
+
+    threads = [threading.Thread(target=client, args=(number,), daemon=True) for number in requests]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+        assert not thread.is_alive(), "a client did not get an answer"
+    return results
+
+
+def test_concurrent_clients_get_their_texts_in_order(server):
+    requests = {client: [make_segments(client, request) for request in range(4)] for client in range(4)}
+
+    results = run_clients(server, requests)
+
+    backend = StubBackend()
+    for client, client_requests in requests.items():
+        assert results[client] == [backend.transcribe_batch(segments) for segments in client_requests]
+    assert sum(stats.num_segments for stats in server.batch_stats) == 4 * 4 * 3
+
+
+def test_error_reaches_only_the_client_that_caused_it(server):
+    bad_segments = make_segments(0, 0)
+    bad_segments[1][100] = np.nan
+    requests = {0: [bad_segments, make_segments(0, 1)], 1: [make_segments(1, 0)], 2: [make_segments(2, 0)]}
+
+    results = run_clients(server, requests)
+
+    backend = StubBackend()
+    assert isinstance(results[0][0], RuntimeError)
+    assert "NaN samples" in str(results[0][0])
+    assert results[0][1] == backend.transcribe_batch(requests[0][1])
+    assert results[1] == [backend.transcribe_batch(requests[1][0])]
+    assert results[2] == [backend.transcribe_batch(requests[2][0])]
@@ -0,0 +1,73 @@
+"""Tests of the fine-tuning of TranscriptAligner."""
+
+import random
+import time
+
+import pytest
+from pyannote.core import Segment
+
+from parliament_transcript_aligner.data_models.models import TranscribedSegment
+from parliament_transcript_aligner.transcript.aligner import TranscriptAligner
+from parliament_transcript_aligner.transcript.transcript_view import TranscriptView
+
+
+def match_key(match):
+    return match and (match.start_idx, match.end_idx, match.cer, match.human_text)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_incremental_fine_tune_matches_window_by_window(seed):
+    """Both fine-tuning modes find the same match (start, end, CER) on random transcripts and regions.
+
+    Small vocabularies produce many ties, short segments and regions near the
+    transcript boundaries exercise the edge cases of the window enumeration.
+    """
+    rnd = random.Random(seed)
+    vocab = ['a', 'b', 'ab', 'ba', 'bb', 'ca', 'ccc']
+    window_by_window = TranscriptAligner(incremental_fine_tune=False)
+    incremental = TranscriptAligner(incremental_fine_tune=True)
+    for trial in range(100):
+        tokens = TranscriptView([rnd.choice(vocab) for _ in range(rnd.randint(0, 80))])
+        text = ' '.join(rnd.choice(vocab) for _ in range(rnd.randint(0, 30)))
+        segment = TranscribedSegment(Segment(0, 1), text)
+        region_start_idx = rnd.randint(0, len(tokens) + 5)
+
+        expected = window_by_window._fine_tune_match(segment, tokens, region_start_idx)
+        actual = incremental._fine_tune_match_incremental(segment, tokens, region_start_idx)
+        assert match_key(actual) == match_key(expected), f"Trial {trial}: {text!r}, region {region_start_idx}"
+
+
+def time_fine_tunes(aligner: TranscriptAligner, tasks: list, transcript: TranscriptView, repeats: int = 3) -> float:
+    """Best wall time of fine-tuning all (segment, region start) tasks."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for segment, region_start_idx in tasks:
+            aligner._fine_tune_match(segment, transcript, region_start_idx)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+@pytest.mark.parametrize("num_words", [20, 40, 60])
+def test_default_fine_tune_is_faster_than_baseline(num_words):
+    """The default fine-tuning beats the unbounded window-by-window baseline on noisy segments."""
+    rnd = random.Random(num_words)
+    vocab = [''.join(rnd.choice('aeioukmnprst') for _ in range(rnd.randint(2, 9))) for _ in range(2000)]
+    words = [rnd.choice(vocab) for _ in range(5000)]
+    transcript = TranscriptView(words)
+    tasks = []
+    for _ in range(50):
+        start = rnd.randrange(0, len(words) - num_words - 40)
+        asr_words = [word if rnd.random() > 0.08 else rnd.choice(vocab) for word in words[start:start + num_words]]
+        tasks.append((TranscribedSegment(Segment(0, 1), ' '.join(asr_words)), start + rnd.randint(-5, 5)))
+
+    baseline = TranscriptAligner(incremental_fine_tune=False, bounded_cer=False, cer_cache_size=None)
+    default = TranscriptAligner()
+    for segment, region_start_idx in tasks:
+        expected = baseline._fine_tune_match(segment, transcript, region_start_idx)
+        assert match_key(default._fine_tune_match(segment, transcript, region_start_idx)) == match_key(expected)
+
+    baseline_time = time_fine_tunes(baseline, tasks, transcript)
+    default_time = time_fine_tunes(TranscriptAligner(), tasks, transcript)
+    print(f"{num_words} words: baseline {baseline_time:.3f}s, default {default_time:.3f}s per {len(tasks)} fine-tunes")
+    assert default_time < baseline_time
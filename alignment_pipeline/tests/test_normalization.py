@@ -0,0 +1,66 @@
+"""Tests of the text normalization of the transcript and the ASR segments."""
+
+from pyannote.core import Segment
+
+from parliament_transcript_aligner.data_models.models import TranscribedSegment
+from parliament_transcript_aligner.transcript.aligner import TranscriptAligner
+from parliament_transcript_aligner.transcript.anchor_index import NGramAnchorIndex, normalize_anchor_token
+from parliament_transcript_aligner.transcript.normalization import TextNormalizer
+from parliament_transcript_aligner.transcript.transcript_view import TranscriptView
+
+TRANSCRIPT = ("Mr. President – the House adopted the budget ... of the Ministry of Finance. "
+              "We don't agree – and (as I said) the vote was postponed - again.")
+
+
+def test_transcript_and_asr_are_normalized_alike():
+    normalizer = TextNormalizer()
+    view = TranscriptView.normalized(TRANSCRIPT, normalizer)
+
+    assert "  " not in view.text
+    assert "" not in view.tokens
+    assert view.text == normalizer.normalize_text(TRANSCRIPT)
+    # Every window comes from original words that the ASR side normalizes into the same words
+    for start in range(len(view)):
+        for end in range(start + 1, len(view) + 1):
+            original_start, original_end = view.original_span(start, end)
+            original_text = " ".join(TRANSCRIPT.split()[original_start:original_end])
+            assert view.original_window_text(start, end) == original_text
+            assert view.window_text(start, end) in normalizer.normalize_text(original_text)
+
+
+def test_token_origins_of_dropped_and_split_tokens():
+    view = TranscriptView.normalized("Yes – we don't !", TextNormalizer())
+
+    assert view.tokens == ["yes", "we", "don", "t"]
+    assert view.token_origins == [0, 2, 3, 3]
+    assert view.original_span(0, 2) == (0, 3)
+    assert view.original_window_text(0, 2) == "Yes – we"
+    assert view.original_window_text(2, 3) == "don't"
+    assert view.original_span(1, 1) == (2, 2)
+    assert view.original_span(4, 4) == (5, 5)
+
+
+def test_alignment_reports_original_tokens():
+    original_tokens = TRANSCRIPT.split()
+    segments = [
+        TranscribedSegment(Segment(0, 4), "the house adopted the budget of the ministry of finance"),
+        TranscribedSegment(Segment(4, 8), "we don't agree and as i said the vote was postponed again"),
+    ]
+
+    aligned = TranscriptAligner(window_token_margin=4).align_transcript(segments, TRANSCRIPT)
+
+    assert [segment.cer for segment in aligned] == [0.0, 0.0]
+    for segment in aligned:
+        assert segment.human_text == " ".join(original_tokens[segment.start_idx:segment.end_idx])
+    assert aligned[0].human_text == "the House adopted the budget ... of the Ministry of Finance."
+    assert aligned[1].human_text == "We don't agree – and (as I said) the vote was postponed - again."
+
+
+def test_anchor_tokens_are_normalized_like_the_text():
+    normalizer = TextNormalizer()
+    for token in ["Finance.", "(as", "don't", "–", "Mr.", "X-ray"]:
+        assert normalize_anchor_token(token) == normalizer.normalize_token(token)
+    words, _ = normalizer.normalize_words(TRANSCRIPT.split())
+    index = NGramAnchorIndex(words, n=3)
+    asr_words = normalizer.normalize_text("The vote was postponed").split()
+    assert index.candidate_starts(asr_words, top_k=1) == [words.index("vote") - 1]
@@ -0,0 +1,104 @@
+"""Tests of the SilenceIndex against the Timeline.crop reference of split_on_silences."""
+
+import random
+
+import pytest
+from pyannote.core import Annotation, Segment, Timeline
+
+from parliament_transcript_aligner.audio_processing.segmentation import (
+    SilenceIndex, longest_silence, split_on_silences
+)
+
+
+def make_regions(minutes: float, seed: int):
+    """Create non-speech regions like Silero VAD finds them, pydub silences and a diarization.
+
+    Speech runs of 0.5 to 30 seconds (some longer than the maximum window, so that
+    the pydub fallback is used) alternate with pauses of 10 ms to 3 seconds, and
+    now and then a break longer than the minimum window.
+    """
+    rnd = random.Random(seed)
+    duration = minutes * 60
+    non_speech, silences = Timeline(), Timeline()
+    diarization = Annotation()
+    speakers = ["A", "B", "C"]
+    speaker = speakers[0]
+    position = round(rnd.uniform(0.0, 2.0) * 16000) / 16000
+    non_speech.add(Segment(0, position))
+    while position < duration:
+        speech_end = position + round(rnd.uniform(0.5, 30.0) * 16000) / 16000
+        cursor = position
+        while True:
+            cursor += round(rnd.uniform(1.0, 8.0) * 1000) / 1000
+            if cursor + 0.5 >= speech_end:
+                break
+            silences.add(Segment(cursor, cursor + round(rnd.uniform(0.2, 0.5) * 1000) / 1000))
+        if rnd.random() < 0.2:
+            speaker = rnd.choice(speakers)
+        diarization[Segment(position, speech_end)] = speaker
+        pause = rnd.uniform(12.0, 60.0) if rnd.random() < 0.03 else rnd.uniform(0.01, 3.0)
+        position = speech_end + round(pause * 16000) / 16000
+        non_speech.add(Segment(speech_end, position))
+    for _ in range(int(minutes)):
+        start = rnd.uniform(0.0, duration)
+        diarization[Segment(start, start + rnd.uniform(0.5, 3.0))] = rnd.choice(speakers) + "_overlap"
+    return non_speech, silences, diarization
+
+
+def as_tuples(timeline):
+    return [(segment.start, segment.end) for segment in timeline]
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("variant", ["vad", "pydub", "diarization"])
+def test_split_on_silences_matches_timeline(seed, variant):
+    non_speech, silences, diarization = make_regions(20, seed)
+    fallback = silences if variant != "vad" else None
+    speakers = diarization if variant == "diarization" else None
+
+    expected = split_on_silences(non_speech, 10.0, 20.0, fallback, speakers)
+    actual = split_on_silences(SilenceIndex(non_speech), 10.0, 20.0,
+                               SilenceIndex(fallback) if fallback is not None else None, speakers)
+
+    assert len(expected) > 0
+    assert as_tuples(actual) == as_tuples(expected)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_longest_silence_matches_timeline_on_boundary_windows(seed):
+    rnd = random.Random(seed)
+    non_speech, _, _ = make_regions(10, seed)
+    index = SilenceIndex(non_speech)
+    end = non_speech.extent().end
+    boundaries = [boundary for segment in non_speech for boundary in (segment.start, segment.end)]
+    for _ in range(2000):
+        if rnd.random() < 0.5:
+            # Windows starting or ending exactly on region boundaries
+            start = rnd.choice(boundaries)
+            window_end = rnd.choice([start + rnd.uniform(0.0, 30.0), start + 20.0, rnd.choice(boundaries)])
+        else:
+            start = rnd.uniform(-5.0, end + 5.0)
+            window_end = start + rnd.choice([rnd.uniform(0.0, 60.0), 10.0, 20.0, 0.0])
+        assert longest_silence(index, start, window_end) == longest_silence(non_speech, start, window_end), \
+            f"window ({start}, {window_end})"
+
+
+def test_ties_and_boundaries():
+    # Silences of equal length, windows ending and starting exactly on their edges
+    non_speech = Timeline([Segment(0.0, 1.0), Segment(5.0, 6.0), Segment(10.0, 11.0), Segment(15.0, 16.0),
+                           Segment(20.0, 20.5), Segment(31.0, 32.0), Segment(40.0, 41.0)])
+    index = SilenceIndex(non_speech)
+    windows = [(0.0, 20.0), (1.0, 15.0), (5.0, 16.0), (6.0, 10.0), (10.0, 10.0), (11.0, 31.0),
+               (16.0, 20.0), (20.5, 40.0), (-3.0, 0.0), (41.0, 50.0), (0.5, 5.5), (12.0, 14.0)]
+    for start, end in windows:
+        assert longest_silence(index, start, end) == longest_silence(non_speech, start, end), f"window ({start}, {end})"
+
+    for window_min_size, window_max_size in [(4.0, 10.0), (5.0, 10.0), (10.0, 20.0), (1.0, 5.0)]:
+        expected = split_on_silences(non_speech, window_min_size, window_max_size)
+        actual = split_on_silences(index, window_min_size, window_max_size)
+        assert as_tuples(actual) == as_tuples(expected)
+
+
+def test_empty_regions():
+    assert as_tuples(split_on_silences(SilenceIndex(Timeline()), 10.0, 20.0)) == \
+        as_tuples(split_on_silences(Timeline(), 10.0, 20.0))
@@ -0,0 +1,49 @@
+"""Tests of the StagedExecutor."""
+
+import threading
+
+from parliament_transcript_aligner.pipeline.staged_executor import Stage, StagedExecutor
+
+
+def run_with_timeout(executor: StagedExecutor, items, timeout: float = 30.0) -> list:
+    """Run the executor in a thread, fail the test if it does not return in time."""
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(outputs=executor.run(items)), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "the executor did not return"
+    return result["outputs"]
+
+
+def fail_on_three(number: int) -> int:
+    if number == 3:
+        raise ValueError("broken item")
+    return number
+
+
+def test_outputs_in_input_order():
+    executor = StagedExecutor([Stage("double", lambda number: number * 2), Stage("increment", lambda number: number + 1)])
+
+    assert run_with_timeout(executor, range(10)) == [number * 2 + 1 for number in range(10)]
+    assert [stats.items for stats in executor.stats] == [10, 10]
+
+
+def test_failed_item_is_dropped_and_reported():
+    errors = []
+    executor = StagedExecutor(
+        [Stage("check", fail_on_three), Stage("square", lambda number: number ** 2)],
+        on_error=lambda item, stage_name, error: errors.append((item, stage_name, str(error))),
+    )
+
+    assert run_with_timeout(executor, range(6)) == [0, 1, 4, 16, 25]
+    assert errors == [(3, "check", "broken item")]
+
+
+def test_failing_on_error_does_not_stop_the_stages():
+    def on_error(item, stage_name, error):
+        raise RuntimeError("could not report the error")
+
+    executor = StagedExecutor([Stage("check", fail_on_three), Stage("square", lambda number: number ** 2)],
+                              on_error=on_error)
+
+    assert run_with_timeout(executor, range(6)) == [0, 1, 4, 16, 25]
@@ -0,0 +1,81 @@
+"""Tests of the streaming alignment of AlignmentPipeline (ASR and alignment overlapped)."""
+
+import threading
+
+import pytest
+from pyannote.core import Segment
+
+from parliament_transcript_aligner.data_models.models import TranscribedSegment
+from parliament_transcript_aligner.pipeline.alignment_pipeline import AlignmentPipeline
+from parliament_transcript_aligner.transcript.aligner import TranscriptAligner
+
+WORDS = "the house adopted the budget of the ministry of finance after the second reading".split()
+
+
+class FakeSegmenter:
+    """Yields the transcribed segments of a recording without audio or ASR."""
+
+    def __init__(self, num_segments: int):
+        self.num_segments = num_segments
+
+    def iter_segment_and_transcribe(self, audio_path, video_id=None):
+        for number in range(self.num_segments):
+            yield TranscribedSegment(Segment(number * 5.0, number * 5.0 + 5.0), " ".join(WORDS))
+
+
+def make_pipeline(tmp_path, engine: str, num_segments: int = 20) -> AlignmentPipeline:
+    pipeline = AlignmentPipeline.__new__(AlignmentPipeline)
+    pipeline.cache_dir = tmp_path
+    pipeline.alignment_engine = engine
+    pipeline.language = "en"
+    pipeline.audio_segmenter = FakeSegmenter(num_segments)
+    return pipeline
+
+
+def run_with_timeout(function, timeout: float = 30.0):
+    """Run the function in a thread, fail the test if it does not return in time."""
+    result = {}
+
+    def target():
+        try:
+            result["value"] = function()
+        except Exception as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "the streaming alignment did not return"
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
+
+
+@pytest.mark.parametrize("engine, method", [
+    ("greedy", "_align_transcript_greedy"),
+    ("global", "_align_transcript_global"),
+    ("anchored", "_align_transcript_anchored"),
+])
+def test_failing_candidate_raises_without_hanging(tmp_path, monkeypatch, engine, method):
+    def fail(*args, **kwargs):
+        raise RuntimeError("alignment failed")
+
+    monkeypatch.setattr(TranscriptAligner, method, fail)
+    pipeline = make_pipeline(tmp_path, engine)
+    transcript = " ".join(WORDS * 20)
+    candidates = {("t1", "html"): transcript, ("t1", "docx"): transcript}
+
+    with pytest.raises(RuntimeError, match="alignment failed"):
+        run_with_timeout(lambda: pipeline._segment_audio_and_align("audio.opus", "v1", candidates))
+
+
+def test_streaming_alignment_of_every_candidate(tmp_path):
+    pipeline = make_pipeline(tmp_path, "greedy", num_segments=4)
+    transcript = " ".join(WORDS * 4)
+    candidates = {("t1", "html"): transcript, ("t2", "html"): transcript}
+
+    alignments = run_with_timeout(lambda: pipeline._segment_audio_and_align("audio.opus", "v1", candidates))
+
+    assert set(alignments) == set(candidates)
+    assert all(len(aligned) == 4 for aligned in alignments.values())
+    assert (tmp_path / "v1_segments.pkl").exists()
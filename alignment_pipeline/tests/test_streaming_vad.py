@@ -0,0 +1,78 @@
+"""Tests of the streaming Silero VAD against get_speech_timestamps on the whole recording."""
+
+import os
+import wave
+
+import numpy as np
+import pytest
+from pyannote.core import Segment
+
+from parliament_transcript_aligner.audio_processing.audio_buffer import SAMPLING_RATE, iter_audio_chunks, load_audio
+
+torch = pytest.importorskip("torch")
+
+from parliament_transcript_aligner.audio_processing.vad.silero_vad import (  # noqa: E402
+    iter_silero_non_speech,
+    load_silero_vad_model,
+)
+
+
+def make_recording(seconds: float, seed: int = 0) -> np.ndarray:
+    """Speech-like bursts (modulated tones with noise) separated by pauses of background noise."""
+    rng = np.random.default_rng(seed)
+    num_samples = int(seconds * SAMPLING_RATE)
+    audio = rng.normal(0.0, 0.003, num_samples).astype(np.float32)
+    position = int(rng.uniform(0.2, 1.0) * SAMPLING_RATE)
+    while position < num_samples:
+        end = min(position + int(rng.uniform(1.0, 6.0) * SAMPLING_RATE), num_samples)
+        t = np.arange(end - position) / SAMPLING_RATE
+        envelope = 0.5 + 0.5 * np.sin(2 * np.pi * rng.uniform(3.0, 6.0) * t)
+        audio[position:end] += (0.2 * envelope * np.sin(2 * np.pi * rng.uniform(100.0, 250.0) * t)).astype(np.float32)
+        audio[position:end] += rng.normal(0.0, 0.02, end - position).astype(np.float32)
+        position = end + int(rng.uniform(0.1, 2.0) * SAMPLING_RATE)
+    return np.clip(audio, -1.0, 1.0)
+
+
+@pytest.fixture(scope="module")
+def silero():
+    # Only a local model (SILERO_VAD_DIR or the silero-vad package), the tests do not download from torch hub
+    if not os.getenv("SILERO_VAD_DIR"):
+        pytest.importorskip("silero_vad")
+    return load_silero_vad_model()
+
+
+@pytest.fixture(scope="module")
+def audio_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("audio") / "session.wav"
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(SAMPLING_RATE)
+        wav_file.writeframes(np.clip(make_recording(60.0) * 32768.0, -32768, 32767).astype(np.int16).tobytes())
+    return str(path)
+
+
+def one_shot_non_speech(audio: np.ndarray, silero) -> list:
+    """Non-speech regions between the speech timestamps of the whole recording."""
+    model, get_speech_timestamps = silero
+    model.reset_states()
+    speech = get_speech_timestamps(torch.from_numpy(audio), model, threshold=0.5, sampling_rate=SAMPLING_RATE,
+                                   min_silence_duration_ms=10)
+    assert len(speech) > 3
+    regions = []
+    if speech[0]["start"] > 0:
+        regions.append(Segment(0, speech[0]["start"] / SAMPLING_RATE))
+    for previous, following in zip(speech, speech[1:]):
+        regions.append(Segment(previous["end"] / SAMPLING_RATE, following["start"] / SAMPLING_RATE))
+    if speech[-1]["end"] < len(audio):
+        regions.append(Segment(speech[-1]["end"] / SAMPLING_RATE, len(audio) / SAMPLING_RATE))
+    return regions
+
+
+@pytest.mark.parametrize("chunk_seconds", [1.0, 7.3, 30.0])
+def test_chunked_vad_matches_one_shot_speech_timestamps(silero, audio_path, chunk_seconds):
+    expected = one_shot_non_speech(load_audio(audio_path), silero)
+
+    regions = list(iter_silero_non_speech(iter_audio_chunks(audio_path, chunk_seconds=chunk_seconds)))
+
+    assert [(region.start, region.end) for region in regions] == [(region.start, region.end) for region in expected]